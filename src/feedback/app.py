@@ -26,6 +26,7 @@ if TYPE_CHECKING:
 
     from textual.screen import Screen
 
+    from feedback.feeds.discovery import PodcastIndexClient
     from feedback.player.base import BasePlayer
 
 # Module logger
@@ -64,6 +65,7 @@ class FeedbackApp(App[None]):
         self._current_episode: Episode | None = None
         self._feeds: list[Feed] = []
         self._download_queue: DownloadQueue | None = None
+        self._discovery_client: PodcastIndexClient | None = None
         self._sleep_timer = SleepTimer(on_expire=self._on_sleep_timer_expire)
 
     def _create_player(self) -> BasePlayer:
@@ -100,6 +102,11 @@ class FeedbackApp(App[None]):
             raise RuntimeError("Database not initialized")
         return self._db
 
+    @property
+    def history_version(self) -> int:
+        """Get the playback history version counter."""
+        return self.database.history_version
+
     @property
     def player(self) -> BasePlayer:
         """Get the player instance."""
@@ -122,6 +129,22 @@ class FeedbackApp(App[None]):
             raise RuntimeError("Download queue not initialized")
         return self._download_queue
 
+    @property
+    def discovery_client(self) -> PodcastIndexClient:
+        """Get the Podcast Index client, created on first use.
+
+        The client is reused across searches so its HTTP connections are too.
+        """
+        if self._discovery_client is None:
+            from feedback.feeds.discovery import PodcastIndexClient
+
+            self._discovery_client = PodcastIndexClient(
+                api_key=self._config.discovery.api_key,
+                api_secret=self._config.discovery.api_secret,
+                timeout=self._config.network.timeout,
+            )
+        return self._discovery_client
+
     @property
     def sleep_timer(self) -> SleepTimer:
         """Get the sleep timer instance."""
@@ -171,6 +194,8 @@ class FeedbackApp(App[None]):
         _log.info("Feedback shutting down")
         if self._player.state != PlayerState.STOPPED:
             await self._player.stop()
+        if self._discovery_client is not None:
+            await self._discovery_client.close()
         if self._db is not None:
             await self._db.close()
         _log.info("Shutdown complete")
@@ -1,8 +1,10 @@
 """Async SQLite database layer for feedback."""
 
 import asyncio
+import sys
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from itertools import groupby
 from pathlib import Path
 
 import aiosqlite
@@ -56,6 +58,36 @@ CREATE INDEX IF NOT EXISTS idx_history_played_at ON playback_history(played_at);
 """
 
 
+# Connection settings. WAL with synchronous=NORMAL only syncs at checkpoints
+# instead of on every commit, and the page cache is 64 MB.
+PRAGMAS = """
+PRAGMA foreign_keys = ON;
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -64000;
+"""
+
+# Memory-mapped reads, on platforms where SQLite's mmap support is reliable
+MMAP_PRAGMA = "PRAGMA mmap_size = 30000000000;"
+MMAP_PLATFORMS = frozenset({"linux", "darwin"})
+
+# IDs bound per IN (...) query, well under SQLite's host parameter limit
+MAX_QUERY_IDS = 500
+
+# Episode writes; parameters come from Database._episode_params, after the id
+INSERT_EPISODE = """
+INSERT INTO episode (feed_key, title, description, link, enclosure,
+    pubdate, copyright, played, progress_ms, downloaded_path)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+REPLACE_EPISODE = """
+INSERT OR REPLACE INTO episode (id, feed_key, title, description, link, enclosure,
+    pubdate, copyright, played, progress_ms, downloaded_path)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 class Database:
     """Async SQLite database for podcast data."""
 
@@ -68,13 +100,20 @@ class Database:
         self.path = path
         self._conn: aiosqlite.Connection | None = None
         self._lock = asyncio.Lock()
+        self._history_version = 0
+
+    @property
+    def history_version(self) -> int:
+        """Counter bumped whenever playback history is modified."""
+        return self._history_version
 
     async def connect(self) -> None:
         """Connect to the database and ensure schema exists."""
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = await aiosqlite.connect(self.path)
         self._conn.row_factory = aiosqlite.Row
-        await self._conn.execute("PRAGMA foreign_keys = ON")
+        pragmas = PRAGMAS + MMAP_PRAGMA if sys.platform in MMAP_PLATFORMS else PRAGMAS
+        await self._conn.executescript(pragmas)
         await self._conn.executescript(SCHEMA)
         await self._run_migrations()
         await self._conn.commit()
@@ -97,6 +136,8 @@ class Database:
     async def close(self) -> None:
         """Close the database connection."""
         if self._conn is not None:
+            # Let SQLite update query planner statistics it found missing
+            await self._conn.execute("PRAGMA optimize")
             await self._conn.close()
             self._conn = None
 
@@ -163,6 +204,8 @@ class Database:
         """Delete a feed and its episodes."""
         async with self.transaction() as conn:
             await conn.execute("DELETE FROM feed WHERE key = ?", (key,))
+        # History rows for the feed's episodes are removed by cascade
+        self._history_version += 1
 
     async def update_feed_start_position(
         self, key: str, start_position_ms: int
@@ -206,6 +249,31 @@ class Database:
 
         return self._row_to_episode(row) if row else None
 
+    async def get_episodes_by_ids(self, episode_ids: list[int]) -> list[Episode]:
+        """Get several episodes by ID, up to MAX_QUERY_IDS per query.
+
+        Args:
+            episode_ids: IDs of the episodes to fetch.
+
+        Returns:
+            The episodes that exist, in no particular order.
+        """
+        if self._conn is None:
+            raise RuntimeError("Database not connected")
+
+        episodes: list[Episode] = []
+        for start in range(0, len(episode_ids), MAX_QUERY_IDS):
+            chunk = episode_ids[start : start + MAX_QUERY_IDS]
+            placeholders = ", ".join("?" * len(chunk))
+            async with self._conn.execute(
+                f"SELECT * FROM episode WHERE id IN ({placeholders})",
+                chunk,
+            ) as cursor:
+                rows = await cursor.fetchall()
+            episodes.extend(self._row_to_episode(row) for row in rows)
+
+        return episodes
+
     async def get_unplayed_episodes(self, feed_key: str) -> list[Episode]:
         """Get unplayed episodes for a feed."""
         if self._conn is None:
@@ -224,52 +292,32 @@ class Database:
         async with self.transaction() as conn:
             if episode.id is None:
                 cursor = await conn.execute(
-                    """
-                    INSERT INTO episode (feed_key, title, description, link, enclosure,
-                                        pubdate, copyright, played, progress_ms, downloaded_path)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        episode.feed_key,
-                        episode.title,
-                        episode.description,
-                        episode.link,
-                        episode.enclosure,
-                        episode.pubdate.isoformat() if episode.pubdate else None,
-                        episode.copyright,
-                        1 if episode.played else 0,
-                        episode.progress_ms,
-                        episode.downloaded_path,
-                    ),
+                    INSERT_EPISODE, self._episode_params(episode)
                 )
                 return cursor.lastrowid or 0
             else:
                 await conn.execute(
-                    """
-                    INSERT OR REPLACE INTO episode (id, feed_key, title, description, link, enclosure,
-                                                   pubdate, copyright, played, progress_ms, downloaded_path)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        episode.id,
-                        episode.feed_key,
-                        episode.title,
-                        episode.description,
-                        episode.link,
-                        episode.enclosure,
-                        episode.pubdate.isoformat() if episode.pubdate else None,
-                        episode.copyright,
-                        1 if episode.played else 0,
-                        episode.progress_ms,
-                        episode.downloaded_path,
-                    ),
+                    REPLACE_EPISODE, (episode.id, *self._episode_params(episode))
                 )
                 return episode.id
 
     async def upsert_episodes(self, episodes: list[Episode]) -> None:
-        """Bulk insert or update episodes."""
-        for episode in episodes:
-            await self.upsert_episode(episode)
+        """Bulk insert or update episodes in a single transaction.
+
+        Consecutive new and existing episodes are each written with one
+        executemany, keeping the order a per-episode upsert would use.
+        """
+        async with self.transaction() as conn:
+            for is_new, run in groupby(episodes, key=lambda ep: ep.id is None):
+                if is_new:
+                    await conn.executemany(
+                        INSERT_EPISODE, map(self._episode_params, run)
+                    )
+                else:
+                    await conn.executemany(
+                        REPLACE_EPISODE,
+                        ((ep.id, *self._episode_params(ep)) for ep in run),
+                    )
 
     async def update_progress(self, episode_id: int, progress_ms: int) -> None:
         """Update the playback progress for an episode."""
@@ -333,6 +381,8 @@ class Database:
         """Delete an episode."""
         async with self.transaction() as conn:
             await conn.execute("DELETE FROM episode WHERE id = ?", (episode_id,))
+        # History rows for the episode are removed by cascade
+        self._history_version += 1
 
     # Queue operations
 
@@ -355,11 +405,10 @@ class Database:
         """Save the playback queue (replaces existing)."""
         async with self.transaction() as conn:
             await conn.execute("DELETE FROM queue")
-            for item in items:
-                await conn.execute(
-                    "INSERT INTO queue (position, episode_id) VALUES (?, ?)",
-                    (item.position, item.episode_id),
-                )
+            await conn.executemany(
+                "INSERT INTO queue (position, episode_id) VALUES (?, ?)",
+                ((item.position, item.episode_id) for item in items),
+            )
 
     async def clear_queue(self) -> None:
         """Clear the playback queue."""
@@ -395,6 +444,7 @@ class Database:
                 (episode_id, played_at.isoformat(), duration_listened_ms),
             )
             history_id = cursor.lastrowid
+        self._history_version += 1
 
         return HistoryItem(
             id=history_id,
@@ -443,7 +493,8 @@ class Database:
 
         async with self.transaction() as conn:
             cursor = await conn.execute("DELETE FROM playback_history")
-            return cursor.rowcount
+        self._history_version += 1
+        return cursor.rowcount
 
     @staticmethod
     def _rows_to_history_item(row: aiosqlite.Row) -> tuple[HistoryItem, Episode]:
@@ -504,6 +555,22 @@ class Database:
             start_position_ms=row["start_position_ms"] or 0,
         )
 
+    @staticmethod
+    def _episode_params(episode: Episode) -> tuple[str | int | None, ...]:
+        """Convert an Episode model to INSERT_EPISODE parameters."""
+        return (
+            episode.feed_key,
+            episode.title,
+            episode.description,
+            episode.link,
+            episode.enclosure,
+            episode.pubdate.isoformat() if episode.pubdate else None,
+            episode.copyright,
+            1 if episode.played else 0,
+            episode.progress_ms,
+            episode.downloaded_path,
+        )
+
     @staticmethod
     def _row_to_episode(row: aiosqlite.Row) -> Episode:
         """Convert a database row to an Episode model."""
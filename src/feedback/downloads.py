@@ -24,7 +24,7 @@ class DownloadStatus(IntEnum):
     CANCELLED = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadItem:
     """Represents a download in the queue."""
 
@@ -57,11 +57,17 @@ class DownloadQueue:
     _active: dict[str, asyncio.Task[None]] = field(default_factory=dict)
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     _progress_callback: Callable[[DownloadItem], None] | None = None
+    _version: int = 0
 
     def __post_init__(self) -> None:
         """Ensure download directory exists."""
         self.download_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the queue or an item in it changes."""
+        return self._version
+
     @property
     def pending_count(self) -> int:
         """Number of pending downloads."""
@@ -124,6 +130,7 @@ class DownloadQueue:
 
         async with self._lock:
             self._queue.append(item)
+            self._version += 1
 
         # Try to start downloading
         await self._process_queue()
@@ -160,6 +167,7 @@ class DownloadQueue:
                 )
                 self._queue.append(item)
                 items.append(item)
+            self._version += 1
 
         # Start processing the queue
         await self._process_queue()
@@ -188,6 +196,7 @@ class DownloadQueue:
                     DownloadStatus.DOWNLOADING,
                 ):
                     item.status = DownloadStatus.CANCELLED
+                    self._version += 1
                     return True
 
         return False
@@ -213,6 +222,9 @@ class DownloadQueue:
                     item.status = DownloadStatus.CANCELLED
                     cancelled += 1
 
+            if cancelled:
+                self._version += 1
+
         return cancelled
 
     async def clear_completed(self) -> int:
@@ -233,7 +245,10 @@ class DownloadQueue:
                     DownloadStatus.CANCELLED,
                 )
             ]
-            return before - len(self._queue)
+            removed = before - len(self._queue)
+            if removed:
+                self._version += 1
+            return removed
 
     def get_items(self) -> list[DownloadItem]:
         """Get all items in the queue.
@@ -243,6 +258,17 @@ class DownloadQueue:
         """
         return list(self._queue)
 
+    def get_snapshot(self) -> tuple[int, tuple[DownloadItem, ...]]:
+        """Get the queue contents along with the current version.
+
+        Callers can compare the version with one they saw earlier to skip
+        work when nothing has changed.
+
+        Returns:
+            Tuple of (version, items).
+        """
+        return self._version, tuple(self._queue)
+
     def get_item(self, url: str) -> DownloadItem | None:
         """Get a download item by URL.
 
@@ -273,6 +299,7 @@ class DownloadQueue:
                 item.status = DownloadStatus.DOWNLOADING
                 task = asyncio.create_task(self._download(item))
                 self._active[item.url] = task
+                self._version += 1
 
     async def _download(self, item: DownloadItem) -> None:
         """Download a single item.
@@ -305,6 +332,7 @@ class DownloadQueue:
                         if item.total_bytes > 0:
                             item.progress = item.bytes_downloaded / item.total_bytes
 
+                        self._version += 1
                         if self._progress_callback:
                             self._progress_callback(item)
 
@@ -335,6 +363,7 @@ class DownloadQueue:
             # Remove from active and process next
             async with self._lock:
                 self._active.pop(item.url, None)
+                self._version += 1
 
             if self._progress_callback:
                 self._progress_callback(item)
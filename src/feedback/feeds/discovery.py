@@ -95,6 +95,24 @@ class PodcastIndexClient:
         self.api_key = api_key
         self.api_secret = api_secret
         self.timeout = timeout
+        # HTTP client kept open between requests so connections are reused
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client, creating it on first use.
+
+        Returns:
+            The shared HTTP client.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _get_auth_headers(self) -> dict[str, str]:
         """Generate authentication headers for the API.
@@ -138,24 +156,24 @@ class PodcastIndexClient:
             )
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/search/byterm",
-                    params={"q": query, "max": max_results},
-                    headers=self._get_auth_headers(),
-                )
+            client = self._get_client()
+            response = await client.get(
+                f"{self.BASE_URL}/search/byterm",
+                params={"q": query, "max": max_results},
+                headers=self._get_auth_headers(),
+            )
 
-                if response.status_code == 401:
-                    raise DiscoveryAuthError("Invalid API credentials")
+            if response.status_code == 401:
+                raise DiscoveryAuthError("Invalid API credentials")
 
-                response.raise_for_status()
-                data = response.json()
+            response.raise_for_status()
+            data = response.json()
 
-                if data.get("status") == "false":
-                    return []
+            if data.get("status") == "false":
+                return []
 
-                feeds = data.get("feeds", [])
-                return [PodcastResult.from_api(feed) for feed in feeds]
+            feeds = data.get("feeds", [])
+            return [PodcastResult.from_api(feed) for feed in feeds]
 
         except httpx.HTTPStatusError as e:
             raise DiscoverySearchError(f"HTTP error: {e.response.status_code}") from e
@@ -187,24 +205,24 @@ class PodcastIndexClient:
             )
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/search/bytitle",
-                    params={"q": title, "max": max_results},
-                    headers=self._get_auth_headers(),
-                )
+            client = self._get_client()
+            response = await client.get(
+                f"{self.BASE_URL}/search/bytitle",
+                params={"q": title, "max": max_results},
+                headers=self._get_auth_headers(),
+            )
 
-                if response.status_code == 401:
-                    raise DiscoveryAuthError("Invalid API credentials")
+            if response.status_code == 401:
+                raise DiscoveryAuthError("Invalid API credentials")
 
-                response.raise_for_status()
-                data = response.json()
+            response.raise_for_status()
+            data = response.json()
 
-                if data.get("status") == "false":
-                    return []
+            if data.get("status") == "false":
+                return []
 
-                feeds = data.get("feeds", [])
-                return [PodcastResult.from_api(feed) for feed in feeds]
+            feeds = data.get("feeds", [])
+            return [PodcastResult.from_api(feed) for feed in feeds]
 
         except httpx.HTTPStatusError as e:
             raise DiscoverySearchError(f"HTTP error: {e.response.status_code}") from e
@@ -244,24 +262,24 @@ class PodcastIndexClient:
             params["cat"] = ",".join(categories)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/podcasts/trending",
-                    params=params,
-                    headers=self._get_auth_headers(),
-                )
+            client = self._get_client()
+            response = await client.get(
+                f"{self.BASE_URL}/podcasts/trending",
+                params=params,
+                headers=self._get_auth_headers(),
+            )
 
-                if response.status_code == 401:
-                    raise DiscoveryAuthError("Invalid API credentials")
+            if response.status_code == 401:
+                raise DiscoveryAuthError("Invalid API credentials")
 
-                response.raise_for_status()
-                data = response.json()
+            response.raise_for_status()
+            data = response.json()
 
-                if data.get("status") == "false":
-                    return []
+            if data.get("status") == "false":
+                return []
 
-                feeds = data.get("feeds", [])
-                return [PodcastResult.from_api(feed) for feed in feeds]
+            feeds = data.get("feeds", [])
+            return [PodcastResult.from_api(feed) for feed in feeds]
 
         except httpx.HTTPStatusError as e:
             raise DiscoverySearchError(f"HTTP error: {e.response.status_code}") from e
@@ -288,27 +306,27 @@ class PodcastIndexClient:
             )
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/podcasts/byfeedurl",
-                    params={"url": feed_url},
-                    headers=self._get_auth_headers(),
-                )
+            client = self._get_client()
+            response = await client.get(
+                f"{self.BASE_URL}/podcasts/byfeedurl",
+                params={"url": feed_url},
+                headers=self._get_auth_headers(),
+            )
 
-                if response.status_code == 401:
-                    raise DiscoveryAuthError("Invalid API credentials")
+            if response.status_code == 401:
+                raise DiscoveryAuthError("Invalid API credentials")
 
-                response.raise_for_status()
-                data = response.json()
+            response.raise_for_status()
+            data = response.json()
 
-                if data.get("status") == "false":
-                    return None
+            if data.get("status") == "false":
+                return None
 
-                feed = data.get("feed")
-                if not feed:
-                    return None
+            feed = data.get("feed")
+            if not feed:
+                return None
 
-                return PodcastResult.from_api(feed)
+            return PodcastResult.from_api(feed)
 
         except httpx.HTTPStatusError as e:
             raise DiscoverySearchError(f"HTTP error: {e.response.status_code}") from e
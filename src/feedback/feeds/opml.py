@@ -5,10 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING
-from xml.etree import ElementTree as ET
 
 if TYPE_CHECKING:
     from pathlib import Path
+    from xml.etree import ElementTree as ET
 
     from feedback.models import Feed
 
@@ -54,6 +54,8 @@ def parse_opml(content: str) -> list[OPMLOutline]:
     Raises:
         OPMLParseError: If the OPML content is invalid.
     """
+    from xml.etree import ElementTree as ET
+
     try:
         root = ET.fromstring(content)
     except ET.ParseError as e:
@@ -80,18 +82,18 @@ def _extract_outlines(element: ET.Element, outlines: list[OPMLOutline]) -> None:
         outlines: List to append found outlines to.
     """
     for outline in element.findall("outline"):
+        attrib = outline.attrib
+
         # Check if this is a feed (has xmlUrl attribute)
-        xml_url = outline.get("xmlUrl") or outline.get("xmlurl")
+        xml_url = attrib.get("xmlUrl") or attrib.get("xmlurl")
 
         if xml_url:
             # This is a feed outline
             title = (
-                outline.get("title")
-                or outline.get("text")
-                or xml_url.split("/")[-1]
+                attrib.get("title") or attrib.get("text") or xml_url.rsplit("/", 1)[-1]
             )
-            html_url = outline.get("htmlUrl") or outline.get("htmlurl")
-            description = outline.get("description")
+            html_url = attrib.get("htmlUrl") or attrib.get("htmlurl")
+            description = attrib.get("description")
 
             outlines.append(
                 OPMLOutline(
@@ -129,16 +131,21 @@ def parse_opml_file(path: Path) -> list[OPMLOutline]:
 def export_opml(
     feeds: list[Feed],
     title: str = "Podcast Subscriptions",
+    *,
+    pretty: bool = True,
 ) -> str:
     """Export feeds to OPML format.
 
     Args:
         feeds: List of Feed objects to export.
         title: Title for the OPML document.
+        pretty: If True, indent the output for human readers.
 
     Returns:
         OPML XML content as string.
     """
+    from xml.etree import ElementTree as ET
+
     # Create OPML structure
     opml = ET.Element("opml", version="2.0")
 
@@ -170,7 +177,11 @@ def export_opml(
         ET.SubElement(body, "outline", **attribs)
 
     # Generate XML string with declaration
-    return _prettify_xml(opml)
+    if pretty:
+        return _prettify_xml(opml)
+
+    xml_str = ET.tostring(opml, encoding="unicode")
+    return f'<?xml version="1.0" encoding="UTF-8"?>\n{xml_str}'
 
 
 def _prettify_xml(element: ET.Element, indent: str = "  ") -> str:
@@ -183,6 +194,8 @@ def _prettify_xml(element: ET.Element, indent: str = "  ") -> str:
     Returns:
         Pretty-printed XML string with declaration.
     """
+    from xml.etree import ElementTree as ET
+
     # Add indentation
     _indent_element(element, level=0, indent=indent)
 
@@ -204,16 +217,16 @@ def _indent_element(elem: ET.Element, level: int, indent: str) -> None:
     i = "\n" + level * indent
 
     if len(elem):
-        if not elem.text or not elem.text.strip():
+        if not elem.text or elem.text.isspace():
             elem.text = i + indent
-        if not elem.tail or not elem.tail.strip():
+        if not elem.tail or elem.tail.isspace():
             elem.tail = i
         for child in elem:
             _indent_element(child, level + 1, indent)
-        if not child.tail or not child.tail.strip():
+        if not child.tail or child.tail.isspace():
             child.tail = i
     else:
-        if level and (not elem.tail or not elem.tail.strip()):
+        if level and (not elem.tail or elem.tail.isspace()):
             elem.tail = i
 
 
@@ -221,6 +234,8 @@ def export_opml_file(
     feeds: list[Feed],
     path: Path,
     title: str = "Podcast Subscriptions",
+    *,
+    pretty: bool = True,
 ) -> None:
     """Export feeds to an OPML file.
 
@@ -228,12 +243,13 @@ def export_opml_file(
         feeds: List of Feed objects to export.
         path: Path to write the OPML file.
         title: Title for the OPML document.
+        pretty: If True, indent the output for human readers.
 
     Raises:
         OPMLExportError: If the file cannot be written.
     """
     try:
-        content = export_opml(feeds, title)
+        content = export_opml(feeds, title, pretty=pretty)
         path.write_text(content, encoding="utf-8")
     except OSError as e:
         raise OPMLExportError(f"Cannot write file: {e}") from e
@@ -274,6 +290,11 @@ async def import_opml_feeds(
     existing_feeds = await database.get_feeds()
     existing_urls = {feed.key for feed in existing_feeds}
 
+    # Process new feeds before known duplicates so imports show up first
+    # (stable sort keeps OPML order within each group)
+    if skip_duplicates:
+        outlines.sort(key=lambda outline: outline.xml_url in existing_urls)
+
     total = len(outlines)
 
     for i, outline in enumerate(outlines):
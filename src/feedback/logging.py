@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import logging.handlers
 import sys
 
 from feedback.config import get_data_path
@@ -10,6 +11,12 @@ from feedback.config import get_data_path
 # Create module-level logger
 logger = logging.getLogger("feedback")
 
+# Rotate the log file once it grows past this size
+MAX_LOG_BYTES = 5 * 1024 * 1024
+
+# Child loggers handed out by get_logger, keyed by short name
+_loggers: dict[str, logging.Logger] = {}
+
 
 def setup_logging(
     *,
@@ -26,6 +33,14 @@ def setup_logging(
     """
     logger.setLevel(level)
 
+    # Our format string doesn't use thread/process/task info, so skip
+    # collecting it for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # Added in Python 3.12 but missing from the logging type stubs
+    logging.logAsyncioTasks = False  # type: ignore[attr-defined]
+
     # Clear existing handlers
     logger.handlers.clear()
 
@@ -39,14 +54,14 @@ def setup_logging(
         # Ensure parent directory exists
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Rotate log if it gets too big (>5MB)
-        if log_path.exists() and log_path.stat().st_size > 5 * 1024 * 1024:
-            old_log = log_path.with_suffix(".log.old")
-            if old_log.exists():
-                old_log.unlink()
-            log_path.rename(old_log)
-
-        file_handler = logging.FileHandler(log_path)
+        # Rotate at write time once the log gets too big; delay opening the
+        # file until the first record is emitted
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_path,
+            maxBytes=MAX_LOG_BYTES,
+            backupCount=1,
+            delay=True,
+        )
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
 
@@ -65,4 +80,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance.
     """
-    return logging.getLogger(f"feedback.{name}")
+    log = _loggers.get(name)
+    if log is None:
+        log = _loggers[name] = logging.getLogger(f"feedback.{name}")
+    return log
@@ -1,7 +1,9 @@
 """Feed and Episode models for feedback."""
 
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Annotated
+from functools import cached_property
+from typing import Annotated, Any, Self
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -83,14 +85,39 @@ class Episode(BaseModel):
         """Check if the episode has been downloaded."""
         return self.downloaded_path is not None
 
+    @cached_property
+    def title_sortkey(self) -> str:
+        """Get the lowercased title used for sorting, computed once per title."""
+        return self.title.lower()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field, dropping the cached sort key when the title changes."""
+        super().__setattr__(name, value)
+        if name == "title":
+            self.__dict__.pop("title_sortkey", None)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the episode, dropping the cached sort key if the title changes."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update and "title" in update:
+            copied.__dict__.pop("title_sortkey", None)
+        return copied
+
     @property
     def progress_seconds(self) -> float:
         """Get playback progress in seconds."""
         return self.progress_ms / 1000.0
 
     def with_progress(self, progress_ms: int) -> "Episode":
-        """Return a copy with updated progress."""
-        return self.model_copy(update={"progress_ms": progress_ms})
+        """Return a copy with updated progress.
+
+        ``model_copy`` skips validation, which keeps this cheap enough to
+        call on every player tick, so the non-negative constraint on
+        ``progress_ms`` is enforced here instead.
+        """
+        return self.model_copy(update={"progress_ms": max(0, progress_ms)})
 
     def mark_played(self) -> "Episode":
         """Return a copy marked as played with progress reset."""
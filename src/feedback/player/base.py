@@ -97,6 +97,8 @@ class BasePlayer(ABC):
     Provides common functionality and enforces the Player protocol.
     """
 
+    __slots__ = ("_duration_ms", "_position_ms", "_rate", "_state", "_volume")
+
     MIN_VOLUME = 0
     MAX_VOLUME = 100
     MIN_RATE = 0.5
@@ -166,6 +168,12 @@ class BasePlayer(ABC):
         """Formatted current time / duration string."""
         return f"{self.format_time(self._position_ms)}/{self.format_time(self._duration_ms)}"
 
+    def _set_stopped(self) -> None:
+        """Reset playback state after the backend has been stopped."""
+        self._state = PlayerState.STOPPED
+        self._position_ms = 0
+        self._duration_ms = 0
+
     def _clamp_volume(self, volume: int) -> int:
         """Clamp volume to valid range."""
         return max(self.MIN_VOLUME, min(self.MAX_VOLUME, volume))
@@ -213,6 +221,8 @@ class BasePlayer(ABC):
 class NullPlayer(BasePlayer):
     """A no-op player implementation for testing."""
 
+    __slots__ = ()
+
     async def play(self, _path: str, start_ms: int = 0) -> None:
         """Simulate starting playback."""
         self._state = PlayerState.PLAYING
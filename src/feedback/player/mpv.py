@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-
-import mpv
+from typing import TYPE_CHECKING
 
 from feedback.player.base import BasePlayer, PlayerState
 
+if TYPE_CHECKING:
+    import mpv
+
 
 class MPVPlayer(BasePlayer):
     """Player implementation using python-mpv.
@@ -18,6 +20,10 @@ class MPVPlayer(BasePlayer):
 
     def __init__(self) -> None:
         """Initialize the MPV player."""
+        # Loading libmpv is expensive, so only pay for it when a player is
+        # actually created
+        import mpv
+
         super().__init__()
         self._player = mpv.MPV(
             video=False,
@@ -35,6 +41,35 @@ class MPVPlayer(BasePlayer):
             if self._duration_ms > 0:
                 self._position_ms = self._duration_ms
 
+        # Duration only changes when a new file is loaded, so observe it
+        # instead of polling it on every tick
+        self._player.observe_property("duration", self._on_duration)
+
+    def _on_duration(self, _name: str, value: float | None) -> None:
+        """Handle mpv duration changes.
+
+        Args:
+            _name: The observed property name.
+            value: New duration in seconds, or None if unknown.
+        """
+        if value is not None:
+            self._duration_ms = self._seconds_to_ms(value)
+
+    @staticmethod
+    def _seconds_to_ms(seconds: float) -> int:
+        """Convert mpv's float seconds to whole milliseconds.
+
+        Rounds to nearest rather than truncating so the position doesn't
+        jitter by a millisecond between ticks.
+
+        Args:
+            seconds: Time in seconds.
+
+        Returns:
+            Time in milliseconds.
+        """
+        return int(seconds * 1000 + 0.5)
+
     async def play(self, path: str, start_ms: int = 0) -> None:
         """Start playback from the given path.
 
@@ -78,11 +113,12 @@ class MPVPlayer(BasePlayer):
 
     async def stop(self) -> None:
         """Stop playback."""
-        self._stop_polling()
+        poll_task = self._stop_polling()
+        if poll_task is not None:
+            # Reap the cancelled task so it can't outlive this player state
+            await asyncio.wait((poll_task,))
         self._player.stop()
-        self._state = PlayerState.STOPPED
-        self._position_ms = 0
-        self._duration_ms = 0
+        self._set_stopped()
 
     async def seek(self, position_ms: int) -> None:
         """Seek to the given position.
@@ -118,30 +154,31 @@ class MPVPlayer(BasePlayer):
         if self._poll_task is None or self._poll_task.done():
             self._poll_task = asyncio.create_task(self._poll_position())
 
-    def _stop_polling(self) -> None:
-        """Stop the position polling task."""
-        if self._poll_task is not None and not self._poll_task.done():
-            self._poll_task.cancel()
-            self._poll_task = None
+    def _stop_polling(self) -> asyncio.Task[None] | None:
+        """Cancel the position polling task.
+
+        Returns:
+            The cancelled task, so async callers can wait for it to finish,
+            or None if no task was running.
+        """
+        task, self._poll_task = self._poll_task, None
+        if task is None or task.done():
+            return None
+        task.cancel()
+        return task
 
     async def _poll_position(self) -> None:
-        """Poll mpv for position and duration updates."""
+        """Poll mpv for position updates."""
+        import mpv
+
         try:
             while True:
                 if self._state == PlayerState.PLAYING:
-                    # Update position
+                    # Update position (duration is observed separately)
                     try:
                         pos = self._player.time_pos
                         if pos is not None:
-                            self._position_ms = int(pos * 1000)
-                    except mpv.ShutdownError:
-                        break
-
-                    # Update duration
-                    try:
-                        dur = self._player.duration
-                        if dur is not None:
-                            self._duration_ms = int(dur * 1000)
+                            self._position_ms = self._seconds_to_ms(pos)
                     except mpv.ShutdownError:
                         break
 
@@ -151,6 +188,9 @@ class MPVPlayer(BasePlayer):
 
     def __del__(self) -> None:
         """Clean up mpv resources."""
+        # __init__ may have failed to import mpv before creating the player
+        if not hasattr(self, "_player"):
+            return
         self._stop_polling()
         if self._player:
             self._player.terminate()
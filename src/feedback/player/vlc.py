@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import contextlib
+from typing import ClassVar
 
 import vlc
 
 from feedback.player.base import BasePlayer, PlayerState
 
+# Longest to wait for playback to begin before seeking to the start position
+START_TIMEOUT = 2.0
+
 
 class VLCPlayer(BasePlayer):
     """Player implementation using python-vlc (libVLC).
@@ -16,14 +22,44 @@ class VLCPlayer(BasePlayer):
     Requires VLC to be installed on the system.
     """
 
+    __slots__ = (
+        "_events_attached",
+        "_instance",
+        "_media",
+        "_player",
+        "_playing",
+    )
+
+    # libVLC instance shared by all players; loading plugins is expensive
+    _shared_instance: ClassVar[vlc.Instance | None] = None
+
     def __init__(self) -> None:
         """Initialize the VLC player."""
         super().__init__()
-        self._instance = vlc.Instance("--no-video", "--quiet")
+        self._instance = self._get_instance()
         self._player: vlc.MediaPlayer = self._instance.media_player_new()
         self._media: vlc.Media | None = None
-        self._poll_task: asyncio.Task[None] | None = None
-        self._poll_interval = 0.5  # seconds
+        self._events_attached = False
+        self._playing = asyncio.Event()
+
+    @classmethod
+    def _get_instance(cls) -> vlc.Instance:
+        """Get the shared libVLC instance, creating it on first use.
+
+        Returns:
+            The shared libVLC instance.
+        """
+        if cls._shared_instance is None:
+            cls._shared_instance = vlc.Instance("--no-video", "--quiet")
+            atexit.register(cls._release_instance)
+        return cls._shared_instance
+
+    @classmethod
+    def _release_instance(cls) -> None:
+        """Release the shared libVLC instance at interpreter exit."""
+        if cls._shared_instance is not None:
+            cls._shared_instance.release()
+            cls._shared_instance = None
 
     async def play(self, path: str, start_ms: int = 0) -> None:
         """Start playback from the given path.
@@ -40,20 +76,19 @@ class VLCPlayer(BasePlayer):
         self._player.set_media(self._media)
 
         # Start playback
+        self._playing.clear()
+        self._attach_events()
         self._player.play()
         self._state = PlayerState.PLAYING
 
-        # Wait for VLC to start playing before seeking
-        await asyncio.sleep(0.1)
-
-        # Seek to start position if specified
+        # Seek to start position if specified, once VLC reports it is playing
         if start_ms > 0:
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(START_TIMEOUT):
+                    await self._playing.wait()
             self._player.set_time(start_ms)
             self._position_ms = start_ms
 
-        # Start polling for position updates
-        self._start_polling()
-
     async def pause(self) -> None:
         """Pause playback."""
         if self._state == PlayerState.PLAYING:
@@ -68,11 +103,9 @@ class VLCPlayer(BasePlayer):
 
     async def stop(self) -> None:
         """Stop playback."""
-        self._stop_polling()
+        self._detach_events()
         self._player.stop()
-        self._state = PlayerState.STOPPED
-        self._position_ms = 0
-        self._duration_ms = 0
+        self._set_stopped()
         self._media = None
 
     async def seek(self, position_ms: int) -> None:
@@ -104,48 +137,81 @@ class VLCPlayer(BasePlayer):
         self._rate = self._clamp_rate(rate)
         self._player.set_rate(self._rate)
 
-    def _start_polling(self) -> None:
-        """Start the position polling task."""
-        if self._poll_task is None or self._poll_task.done():
-            self._poll_task = asyncio.create_task(self._poll_position())
-
-    def _stop_polling(self) -> None:
-        """Stop the position polling task."""
-        if self._poll_task is not None and not self._poll_task.done():
-            self._poll_task.cancel()
-            self._poll_task = None
-
-    async def _poll_position(self) -> None:
-        """Poll VLC for position and duration updates."""
-        try:
-            while True:
-                if self._state == PlayerState.PLAYING:
-                    # Update position
-                    pos = self._player.get_time()
-                    if pos >= 0:
-                        self._position_ms = pos
-
-                    # Update duration
-                    dur = self._player.get_length()
-                    if dur > 0:
-                        self._duration_ms = dur
-
-                    # Check if playback ended
-                    state = self._player.get_state()
-                    if state == vlc.State.Ended:
-                        self._state = PlayerState.STOPPED
-                        self._position_ms = self._duration_ms
-                        break
-
-                await asyncio.sleep(self._poll_interval)
-        except asyncio.CancelledError:
-            pass
+    def _attach_events(self) -> None:
+        """Register libVLC event callbacks for playback state and position.
+
+        libVLC fires events from its own thread, so each callback hands
+        the value over to the running event loop.
+        """
+        if self._events_attached:
+            return
+
+        loop = asyncio.get_running_loop()
+        em = self._player.event_manager()
+        em.event_attach(
+            vlc.EventType.MediaPlayerTimeChanged,
+            lambda event: loop.call_soon_threadsafe(self._apply_time, event.u.new_time),
+        )
+        em.event_attach(
+            vlc.EventType.MediaPlayerLengthChanged,
+            lambda event: loop.call_soon_threadsafe(
+                self._apply_length, event.u.new_length
+            ),
+        )
+        em.event_attach(
+            vlc.EventType.MediaPlayerPlaying,
+            lambda _event: loop.call_soon_threadsafe(self._playing.set),
+        )
+        em.event_attach(
+            vlc.EventType.MediaPlayerEndReached,
+            lambda _event: loop.call_soon_threadsafe(self._apply_end),
+        )
+        self._events_attached = True
+
+    def _detach_events(self) -> None:
+        """Unregister libVLC event callbacks."""
+        if not self._events_attached:
+            return
+
+        em = self._player.event_manager()
+        for event_type in (
+            vlc.EventType.MediaPlayerPlaying,
+            vlc.EventType.MediaPlayerTimeChanged,
+            vlc.EventType.MediaPlayerLengthChanged,
+            vlc.EventType.MediaPlayerEndReached,
+        ):
+            em.event_detach(event_type)
+        self._events_attached = False
+
+    def _apply_time(self, time_ms: int) -> None:
+        """Update the position from a TimeChanged event.
+
+        Args:
+            time_ms: New playback position in milliseconds.
+        """
+        if self._state != PlayerState.STOPPED and time_ms >= 0:
+            self._position_ms = time_ms
+
+    def _apply_length(self, length_ms: int) -> None:
+        """Update the duration from a LengthChanged event.
+
+        Args:
+            length_ms: New media length in milliseconds.
+        """
+        if length_ms > 0:
+            self._duration_ms = length_ms
+
+    def _apply_end(self) -> None:
+        """Mark playback as finished after an EndReached event."""
+        self._state = PlayerState.STOPPED
+        self._position_ms = self._duration_ms
 
     def __del__(self) -> None:
         """Clean up VLC resources."""
-        self._stop_polling()
+        # __init__ may have failed to create the libVLC instance
+        if not hasattr(self, "_player"):
+            return
+        self._detach_events()
         if self._player:
             self._player.stop()
             self._player.release()
-        if self._instance:
-            self._instance.release()
@@ -10,14 +10,19 @@ from textual.screen import Screen
 from textual.widgets import Footer, Header, Static
 
 from feedback.downloads import DownloadItem, DownloadStatus
+from feedback.widgets.confirm_dialog import ConfirmDialog
 from feedback.widgets.download_list import DownloadList, DownloadSelected
 from feedback.widgets.player_bar import PlayerBar
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
+    from textual.timer import Timer
 
     from feedback.app import FeedbackApp
 
+# Noun forms indexed by ``count == 1``
+_DOWNLOADS = ("downloads", "download")
+
 
 class DownloadsScreen(Screen[None]):
     """Screen for managing downloads."""
@@ -34,79 +39,100 @@ class DownloadsScreen(Screen[None]):
         Binding("space", "play_pause", "Play/Pause", show=False),
     ]
 
+    # Seconds to collect progress updates into a single redraw
+    REFRESH_DELAY = 0.1
+
     def __init__(self) -> None:
         """Initialize the downloads screen."""
         super().__init__()
-        self._refresh_timer = None
+        self._refresh_timer: Timer | None = None
+        self._last_version = -1
 
     def compose(self) -> ComposeResult:
         """Compose the downloads screen layout."""
         yield Header()
-        yield PlayerBar()
+        self._player_bar = PlayerBar()
+        yield self._player_bar
         with Vertical(id="downloads-content"):
             yield Static("Downloads", id="downloads-title")
-            yield DownloadList()
+            self._download_list = DownloadList()
+            yield self._download_list
         yield Footer()
 
     async def on_mount(self) -> None:
         """Set up when screen mounts."""
         await self._load_downloads()
-        # Set up progress callback and refresh timer
+        # Redraw only when the queue reports a change
         app: FeedbackApp = self.app  # type: ignore[assignment]
         app.download_queue.set_progress_callback(self._on_progress)
-        self._refresh_timer = self.set_interval(1.0, self._refresh_display)
 
     async def on_screen_resume(self) -> None:
         """Reload downloads when returning to this screen."""
+        app: FeedbackApp = self.app  # type: ignore[assignment]
+        if app.download_queue.version == self._last_version:
+            return
         await self._load_downloads()
 
     async def _load_downloads(self) -> None:
         """Load downloads from the queue."""
         app: FeedbackApp = self.app  # type: ignore[assignment]
-        items = app.download_queue.get_items()
+        self._last_version, items = app.download_queue.get_snapshot()
 
-        download_list = self.query_one(DownloadList)
-        download_list.set_downloads(items)
+        with app.batch_update():
+            self._download_list.set_downloads(items)
 
         if not items:
             self.notify("No downloads", severity="information")
 
-    def _on_progress(self, item: DownloadItem) -> None:
-        """Handle download progress update.
+    def _on_progress(self, _item: DownloadItem) -> None:
+        """Schedule a redraw after a download progress update.
 
         Args:
-            item: The download item with updated progress.
+            _item: The download item with updated progress.
         """
-        # Progress updates will be picked up by the refresh timer
-        pass
+        # DownloadQueue calls this from its download tasks on the event loop,
+        # so no thread hop is needed
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Redraw the list after REFRESH_DELAY, unless already scheduled.
+
+        Bursts of progress updates then cost one check each and share a
+        single redraw.
+        """
+        if self._refresh_timer is None:
+            self._refresh_timer = self.set_timer(
+                self.REFRESH_DELAY, self._flush_refresh
+            )
+
+    async def _flush_refresh(self) -> None:
+        """Run the scheduled redraw."""
+        self._refresh_timer = None
+        await self._refresh_display()
 
     async def _refresh_display(self) -> None:
         """Refresh the download list display."""
         app: FeedbackApp = self.app  # type: ignore[assignment]
-        items = app.download_queue.get_items()
-        download_list = self.query_one(DownloadList)
-        download_list.set_downloads(items)
+        version, items = app.download_queue.get_snapshot()
+        if version == self._last_version:
+            return
+        self._last_version = version
+
+        # One repaint for all the row removals, replacements and additions
+        with app.batch_update():
+            self._download_list.set_downloads(items)
 
     def action_move_down(self) -> None:
         """Move selection down."""
-        try:
-            download_list = self.query_one(DownloadList)
-            download_list.action_cursor_down()
-        except Exception:
-            pass
+        self._download_list.action_cursor_down()
 
     def action_move_up(self) -> None:
         """Move selection up."""
-        try:
-            download_list = self.query_one(DownloadList)
-            download_list.action_cursor_up()
-        except Exception:
-            pass
+        self._download_list.action_cursor_up()
 
     async def action_play(self) -> None:
         """Play the selected downloaded episode."""
-        download_list = self.query_one(DownloadList)
-        item = download_list.get_selected_download()
+        item = self._download_list.get_selected_download()
 
         if item is None:
             self.notify("No download selected", severity="warning")
@@ -133,8 +159,7 @@ class DownloadsScreen(Screen[None]):
 
                 await app.play_episode(episode)
 
-                player_bar = self.query_one(PlayerBar)
-                player_bar.set_playing(
+                self._player_bar.set_playing(
                     title=episode.title,
                     duration_ms=app.player.duration_ms,
                 )
@@ -143,8 +168,7 @@ class DownloadsScreen(Screen[None]):
 
         # Fallback: play file directly
         await app.player.play(str(item.destination))
-        player_bar = self.query_one(PlayerBar)
-        player_bar.set_playing(
+        self._player_bar.set_playing(
             title=item.destination.name,
             duration_ms=app.player.duration_ms,
         )
@@ -152,10 +176,7 @@ class DownloadsScreen(Screen[None]):
 
     async def action_delete(self) -> None:
         """Delete the selected download and its file."""
-        from feedback.widgets.confirm_dialog import ConfirmDialog
-
-        download_list = self.query_one(DownloadList)
-        item = download_list.get_selected_download()
+        item = self._download_list.get_selected_download()
 
         if item is None:
             self.notify("No download selected", severity="warning")
@@ -202,8 +223,7 @@ class DownloadsScreen(Screen[None]):
 
     async def action_cancel(self) -> None:
         """Cancel the selected download."""
-        download_list = self.query_one(DownloadList)
-        item = download_list.get_selected_download()
+        item = self._download_list.get_selected_download()
 
         if item is None:
             self.notify("No download selected", severity="warning")
@@ -217,19 +237,17 @@ class DownloadsScreen(Screen[None]):
         cancelled = await app.download_queue.cancel(item.url)
 
         if cancelled:
-            await self._load_downloads()
+            self._schedule_refresh()
             self.notify("Download cancelled", severity="information")
         else:
             self.notify("Failed to cancel download", severity="error")
 
     async def action_cancel_all(self) -> None:
         """Cancel all pending and active downloads."""
-        from feedback.widgets.confirm_dialog import ConfirmDialog
-
         app: FeedbackApp = self.app  # type: ignore[assignment]
 
         # Count active/pending downloads
-        items = app.download_queue.get_items()
+        _version, items = app.download_queue.get_snapshot()
         active_count = sum(
             1
             for item in items
@@ -241,10 +259,11 @@ class DownloadsScreen(Screen[None]):
             return
 
         # Show confirmation dialog
+        noun = _DOWNLOADS[active_count == 1]
         confirmed = await self.app.push_screen_wait(
             ConfirmDialog(
                 title="Cancel All Downloads",
-                message=f"Cancel {active_count} active download{'s' if active_count != 1 else ''}?",
+                message=f"Cancel {active_count} active {noun}?",
                 confirm_label="Cancel All",
                 cancel_label="Keep",
             )
@@ -255,35 +274,44 @@ class DownloadsScreen(Screen[None]):
 
         count = await app.download_queue.cancel_all()
 
-        await self._load_downloads()
+        self._schedule_refresh()
 
         if count > 0:
-            self.notify(f"Cancelled {count} downloads", severity="information")
+            self.notify(
+                f"Cancelled {count} {_DOWNLOADS[count == 1]}", severity="information"
+            )
 
     async def action_clear_completed(self) -> None:
         """Clear completed, failed, and cancelled downloads from the list."""
         app: FeedbackApp = self.app  # type: ignore[assignment]
         count = await app.download_queue.clear_completed()
 
-        await self._load_downloads()
+        self._schedule_refresh()
 
         if count > 0:
-            self.notify(f"Cleared {count} downloads", severity="information")
+            self.notify(
+                f"Cleared {count} {_DOWNLOADS[count == 1]}", severity="information"
+            )
         else:
             self.notify("Nothing to clear", severity="information")
 
     async def action_play_pause(self) -> None:
         """Toggle play/pause."""
         app: FeedbackApp = self.app  # type: ignore[assignment]
+        before = app.player.state
         await app.toggle_play_pause()
-
-        player_bar = self.query_one(PlayerBar)
-        if app.player.state.name == "PLAYING":
-            player_bar.status = "Playing"
-            self.notify("Resumed playback")
-        elif app.player.state.name == "PAUSED":
-            player_bar.status = "Paused"
-            self.notify("Paused playback")
+        state = app.player.state
+
+        # Only announce real state changes so repeated presses don't pile up
+        # notifications
+        if state.name == "PLAYING":
+            self._player_bar.status = "Playing"
+            if state != before:
+                self.notify("Resumed playback")
+        elif state.name == "PAUSED":
+            self._player_bar.status = "Paused"
+            if state != before:
+                self.notify("Paused playback")
         else:
             self.notify("No episode playing")
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING, ClassVar
 
 from textual.binding import Binding
@@ -9,13 +10,13 @@ from textual.containers import Vertical, VerticalScroll
 from textual.screen import ModalScreen
 from textual.widgets import Static
 
-from feedback import __version__
-
 if TYPE_CHECKING:
+    from rich.text import Text
     from textual.app import ComposeResult
 
 
-HELP_TEXT = f"""[bold]Feedback v{__version__}[/bold]
+# Filled in with the package version when the help screen is first opened
+HELP_TEXT = """[bold]Feedback v{version}[/bold]
 A modern TUI podcast client for the terminal
 
 [bold underline]Navigation[/bold underline]
@@ -79,6 +80,20 @@ A modern TUI podcast client for the terminal
 """
 
 
+@cache
+def _help_renderable() -> Text:
+    """Build the help text renderable on first use.
+
+    Returns:
+        The parsed help text, shared by every HelpScreen.
+    """
+    from rich.text import Text
+
+    from feedback import __version__
+
+    return Text.from_markup(HELP_TEXT.format(version=__version__))
+
+
 class HelpScreen(ModalScreen[None]):
     """Modal screen displaying help and keybindings."""
 
@@ -116,7 +131,7 @@ class HelpScreen(ModalScreen[None]):
     def compose(self) -> ComposeResult:
         """Compose the help screen."""
         with Vertical(), VerticalScroll():
-            yield Static(HELP_TEXT)
+            yield Static(_help_renderable())
 
     def action_close(self) -> None:
         """Close the help screen."""
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import contextlib
 from typing import TYPE_CHECKING, ClassVar
 
 from textual.binding import Binding
 from textual.containers import Vertical
 from textual.screen import Screen
 from textual.widgets import Footer, Header, OptionList, Static
-from textual.widgets.option_list import Option
+from textual.widgets.option_list import Option, OptionDoesNotExist
 
+from feedback.widgets.confirm_dialog import ConfirmDialog
 from feedback.widgets.player_bar import PlayerBar
 
 if TYPE_CHECKING:
@@ -18,6 +20,12 @@ if TYPE_CHECKING:
     from feedback.app import FeedbackApp
     from feedback.models import Episode, HistoryItem
 
+# "(Nm listened)" labels for the first three hours, built once
+_LISTENED_STRS = tuple(f"({minutes}m listened)" for minutes in range(181))
+
+# Noun forms indexed by ``count == 1``
+_HISTORY_ITEMS = ("history items", "history item")
+
 
 class HistoryList(OptionList):
     """List widget for playback history."""
@@ -32,7 +40,14 @@ class HistoryList(OptionList):
     def __init__(self) -> None:
         """Initialize the history list."""
         super().__init__()
-        self._history: list[tuple[HistoryItem, Episode]] = []
+        # Parallel per-row arrays, read back when a row is selected
+        self._items: list[HistoryItem] = []
+        self._episodes: list[Episode] = []
+
+    @property
+    def history_count(self) -> int:
+        """Number of history entries shown."""
+        return len(self._items)
 
     def set_history(self, history: list[tuple[HistoryItem, Episode]]) -> None:
         """Set the history items to display.
@@ -40,22 +55,64 @@ class HistoryList(OptionList):
         Args:
             history: List of (HistoryItem, Episode) tuples.
         """
-        self._history = history
-        self.clear_options()
+        old_items = self._items
+        items = [hist_item for hist_item, _ in history]
+        self._items = items
+        self._episodes = [episode for _, episode in history]
+
+        # History rows don't change once written, so skip the rebuild when
+        # the same entries come back
+        if [(h.id, h.duration_listened_ms) for h in items] == [
+            (h.id, h.duration_listened_ms) for h in old_items
+        ] and self.option_count == len(items):
+            return
+
+        # Entries played in the same minute share a formatted timestamp
+        played_strs: dict[tuple[int, int, int, int, int], str] = {}
+        labels: list[str] = []
 
         for hist_item, episode in history:
             # Format played time
-            played_str = hist_item.played_at.strftime("%Y-%m-%d %H:%M")
+            played_at = hist_item.played_at
+            minute_key = (
+                played_at.year,
+                played_at.month,
+                played_at.day,
+                played_at.hour,
+                played_at.minute,
+            )
+            played_str = played_strs.get(minute_key)
+            if played_str is None:
+                played_str = played_strs[minute_key] = played_at.strftime(
+                    "%Y-%m-%d %H:%M"
+                )
 
             # Format duration listened
             if hist_item.duration_listened_ms > 0:
                 minutes = hist_item.duration_listened_ms // 60000
-                duration_str = f"({minutes}m listened)"
+                if minutes < len(_LISTENED_STRS):
+                    duration_str = _LISTENED_STRS[minutes]
+                else:
+                    duration_str = f"({minutes}m listened)"
             else:
                 duration_str = ""
 
-            label = f"{episode.title}\n  [dim]{played_str} {duration_str}[/dim]"
-            self.add_option(Option(label, id=f"history-{hist_item.id}"))
+            labels.append(f"{episode.title}\n  [dim]{played_str} {duration_str}[/dim]")
+
+        # Keep the same entry highlighted across the rebuild
+        highlighted_id = None
+        if self.highlighted is not None and self.highlighted < self.option_count:
+            highlighted_id = self.get_option_at_index(self.highlighted).id
+
+        self.clear_options()
+        self.add_options(
+            Option(label, id=f"history-{hist_item.id}")
+            for label, hist_item in zip(labels, items, strict=True)
+        )
+
+        if highlighted_id is not None:
+            with contextlib.suppress(OptionDoesNotExist):
+                self.highlighted = self.get_option_index(highlighted_id)
 
     def get_selected_episode(self) -> Episode | None:
         """Get the currently selected episode.
@@ -63,9 +120,9 @@ class HistoryList(OptionList):
         Returns:
             Selected Episode or None.
         """
-        if self.highlighted is None or self.highlighted >= len(self._history):
+        if self.highlighted is None or self.highlighted >= len(self._episodes):
             return None
-        return self._history[self.highlighted][1]
+        return self._episodes[self.highlighted]
 
     def get_selected_item(self) -> tuple[HistoryItem, Episode] | None:
         """Get the currently selected history item with episode.
@@ -73,9 +130,9 @@ class HistoryList(OptionList):
         Returns:
             Tuple of (HistoryItem, Episode) or None.
         """
-        if self.highlighted is None or self.highlighted >= len(self._history):
+        if self.highlighted is None or self.highlighted >= len(self._items):
             return None
-        return self._history[self.highlighted]
+        return self._items[self.highlighted], self._episodes[self.highlighted]
 
 
 class HistoryScreen(Screen[None]):
@@ -91,13 +148,20 @@ class HistoryScreen(Screen[None]):
         Binding("escape", "back", "Back"),
     ]
 
+    def __init__(self) -> None:
+        """Initialize the history screen."""
+        super().__init__()
+        self._loaded_version: int | None = None
+
     def compose(self) -> ComposeResult:
         """Compose the history screen layout."""
         yield Header()
-        yield PlayerBar()
+        self._player_bar = PlayerBar()
+        yield self._player_bar
         with Vertical(id="history-content"):
             yield Static("Playback History", id="history-title")
-            yield HistoryList()
+            self._history_list = HistoryList()
+            yield self._history_list
         yield Footer()
 
     async def on_mount(self) -> None:
@@ -106,39 +170,33 @@ class HistoryScreen(Screen[None]):
 
     async def on_screen_resume(self) -> None:
         """Reload history when returning to this screen."""
+        app: FeedbackApp = self.app  # type: ignore[assignment]
+        if self._loaded_version == app.history_version:
+            return
         await self._load_history()
 
     async def _load_history(self) -> None:
         """Load history from database."""
         app: FeedbackApp = self.app  # type: ignore[assignment]
+        self._loaded_version = app.history_version
         history = await app.database.get_history(limit=50)
 
-        history_list = self.query_one(HistoryList)
-        history_list.set_history(history)
+        self._history_list.set_history(history)
 
         if not history:
             self.notify("No playback history", severity="information")
 
     def action_move_down(self) -> None:
         """Move selection down."""
-        try:
-            history_list = self.query_one(HistoryList)
-            history_list.action_cursor_down()
-        except Exception:
-            pass
+        self._history_list.action_cursor_down()
 
     def action_move_up(self) -> None:
         """Move selection up."""
-        try:
-            history_list = self.query_one(HistoryList)
-            history_list.action_cursor_up()
-        except Exception:
-            pass
+        self._history_list.action_cursor_up()
 
     async def action_play(self) -> None:
         """Play the selected episode from history."""
-        history_list = self.query_one(HistoryList)
-        episode = history_list.get_selected_episode()
+        episode = self._history_list.get_selected_episode()
 
         if episode is None:
             self.notify("No episode selected", severity="warning")
@@ -147,8 +205,7 @@ class HistoryScreen(Screen[None]):
         app: FeedbackApp = self.app  # type: ignore[assignment]
         await app.play_episode(episode)
 
-        player_bar = self.query_one(PlayerBar)
-        player_bar.set_playing(
+        self._player_bar.set_playing(
             title=episode.title,
             duration_ms=app.player.duration_ms,
         )
@@ -156,17 +213,15 @@ class HistoryScreen(Screen[None]):
 
     async def action_clear_history(self) -> None:
         """Clear all playback history."""
-        from feedback.widgets.confirm_dialog import ConfirmDialog
-
-        history_list = self.query_one(HistoryList)
-        if not history_list._history:
+        shown = self._history_list.history_count
+        if not shown:
             self.notify("History is already empty", severity="information")
             return
 
         confirmed = await self.app.push_screen_wait(
             ConfirmDialog(
                 title="Clear History",
-                message=f"Clear all {len(history_list._history)} history items?",
+                message=f"Clear all {shown} {_HISTORY_ITEMS[shown == 1]}?",
                 confirm_label="Clear",
                 cancel_label="Cancel",
             )
@@ -178,20 +233,27 @@ class HistoryScreen(Screen[None]):
         app: FeedbackApp = self.app  # type: ignore[assignment]
         count = await app.database.clear_history()
         await self._load_history()
-        self.notify(f"Cleared {count} history items", severity="information")
+        self.notify(
+            f"Cleared {count} {_HISTORY_ITEMS[count == 1]}", severity="information"
+        )
 
     async def action_play_pause(self) -> None:
         """Toggle play/pause."""
         app: FeedbackApp = self.app  # type: ignore[assignment]
+        before = app.player.state
         await app.toggle_play_pause()
-
-        player_bar = self.query_one(PlayerBar)
-        if app.player.state.name == "PLAYING":
-            player_bar.status = "Playing"
-            self.notify("Resumed playback")
-        elif app.player.state.name == "PAUSED":
-            player_bar.status = "Paused"
-            self.notify("Paused playback")
+        state = app.player.state
+
+        # Only announce real state changes so repeated presses don't pile up
+        # notifications
+        if state.name == "PLAYING":
+            self._player_bar.status = "Playing"
+            if state != before:
+                self.notify("Resumed playback")
+        elif state.name == "PAUSED":
+            self._player_bar.status = "Paused"
+            if state != before:
+                self.notify("Paused playback")
         else:
             self.notify("No episode playing")
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING, ClassVar
 
 from textual import work
@@ -10,14 +11,18 @@ from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Footer, Header, Input, Static
 
+from feedback.config import get_config
+from feedback.widgets.confirm_dialog import ConfirmDialog
 from feedback.widgets.episode_list import EpisodeList, EpisodeSelected
 from feedback.widgets.feed_list import FeedList, FeedSelected
+from feedback.widgets.loading_overlay import LoadingOverlay
 from feedback.widgets.player_bar import PlayerBar
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
     from feedback.app import FeedbackApp
+    from feedback.models.feed import Episode
 
 
 class MetadataPanel(Static):
@@ -111,10 +116,14 @@ class PrimaryScreen(Screen[None]):
         Binding("t", "toggle_sleep_timer", "Sleep Timer"),
     ]
 
+    # Player bar refresh interval in seconds
+    PLAYER_UPDATE_INTERVAL = 0.5
     # Progress save interval in seconds
     PROGRESS_SAVE_INTERVAL = 30.0
     # Mark as played when this percentage is reached
     PLAYED_THRESHOLD = 0.90
+    # Number of feeds whose episode lists are kept in memory
+    EPISODE_CACHE_SIZE = 16
 
     def __init__(self) -> None:
         """Initialize the primary screen."""
@@ -123,62 +132,101 @@ class PrimaryScreen(Screen[None]):
         self._searching = False
         self._selected_feed_key: str | None = None
         self._player_timer = None
-        self._progress_timer = None
-        self._last_saved_position = 0
+        # Episode ID and position of the last progress write
+        self._last_saved: tuple[int | None, int] = (None, 0)
+        # Player bar ticks since mount; progress is saved every N ticks
+        self._tick_count = 0
+        # Player state seen on the previous tick
+        self._last_state = ""
+        # Episode IDs with a mark_played write in flight
+        self._pending_mark_played: set[int] = set()
+        # Episodes per feed key, least recently viewed first
+        self._episode_cache: OrderedDict[str, list[Episode]] = OrderedDict()
+        # Feed keys whose cached episodes no longer match the database
+        self._episode_cache_dirty: set[str] = set()
 
     def compose(self) -> ComposeResult:
         """Compose the primary screen layout."""
         yield Header()
-        yield PlayerBar()
+        self._player_bar = PlayerBar()
+        yield self._player_bar
         with Horizontal(id="main-content"):
             with Vertical(id="left-pane"):
-                yield FeedList()
+                self._feed_list = FeedList()
+                yield self._feed_list
             with Vertical(id="right-pane"):
-                yield EpisodeList()
-                yield MetadataPanel()
+                self._episode_list = EpisodeList()
+                yield self._episode_list
+                self._metadata_panel = MetadataPanel()
+                yield self._metadata_panel
         yield Footer()
 
     async def on_mount(self) -> None:
         """Load feeds when screen mounts."""
         await self._load_feeds()
-        # Start the player update timer (fast for UI)
-        self._player_timer = self.set_interval(0.5, self._update_player_bar)
-        # Start the progress save timer (slower for database)
-        self._progress_timer = self.set_interval(
-            self.PROGRESS_SAVE_INTERVAL, self._save_progress
+        # One timer drives both the player bar and the (slower) progress saves
+        self._player_timer = self.set_interval(
+            self.PLAYER_UPDATE_INTERVAL, self._update_player_bar
         )
 
     async def _update_player_bar(self) -> None:
-        """Update the player bar with current playback position."""
+        """Update the player bar with current playback position.
+
+        Also saves progress once every PROGRESS_SAVE_INTERVAL seconds of ticks.
+        """
         app: FeedbackApp = self.app  # type: ignore[assignment]
-        player_bar = self.query_one(PlayerBar)
 
-        if app.player.state.name == "PLAYING":
-            player_bar.position_ms = app.player.position_ms
-            player_bar.duration_ms = app.player.duration_ms
-            player_bar.status = "Playing"
+        # Read the player once per tick
+        state = app.player.state.name
+        # Nothing changes while idle, so only the first stopped tick does work
+        if state == "STOPPED" and self._last_state == "STOPPED":
+            return
+        self._last_state = state
+        position_ms = app.player.position_ms
+
+        if state == "PLAYING":
+            duration_ms = app.player.duration_ms
+            self._player_bar.position_ms = position_ms
+            self._player_bar.duration_ms = duration_ms
+            self._player_bar.status = "Playing"
 
             # Check if we should mark as played
-            if app.player.duration_ms > 0:
-                progress = app.player.position_ms / app.player.duration_ms
-                if progress >= self.PLAYED_THRESHOLD and app.current_episode:
-                    episode = app.current_episode
-                    if not episode.played and episode.id is not None:
-                        await app.database.mark_played(episode.id)
-                        episode.played = True
-
-        elif app.player.state.name == "PAUSED":
-            player_bar.position_ms = app.player.position_ms
-            player_bar.status = "Paused"
-        elif app.player.state.name == "STOPPED":
+            episode = app.current_episode
+            if (
+                episode is not None
+                and episode.id is not None
+                and not episode.played
+                and episode.id not in self._pending_mark_played
+                and duration_ms > 0
+                and position_ms / duration_ms >= self.PLAYED_THRESHOLD
+            ):
+                self._pending_mark_played.add(episode.id)
+                try:
+                    await app.database.mark_played(episode.id)
+                    episode.played = True
+                    self._episode_list.refresh_episode(episode)
+                    self._invalidate_episodes(episode.feed_key)
+                finally:
+                    self._pending_mark_played.discard(episode.id)
+
+        elif state == "PAUSED":
+            self._player_bar.position_ms = position_ms
+            self._player_bar.status = "Paused"
+        elif state == "STOPPED":
             # Save final progress when stopped
             await self._save_progress()
 
+        self._tick_count += 1
+        save_every = round(self.PROGRESS_SAVE_INTERVAL / self.PLAYER_UPDATE_INTERVAL)
+        if self._tick_count % save_every == 0:
+            await self._save_progress()
+
     async def _save_progress(self) -> None:
         """Save current playback progress to database."""
         app: FeedbackApp = self.app  # type: ignore[assignment]
 
-        if app.current_episode is None or app.current_episode.id is None:
+        episode = app.current_episode
+        if episode is None or episode.id is None:
             return
 
         if app.player.state.name not in ("PLAYING", "PAUSED"):
@@ -186,31 +234,56 @@ class PrimaryScreen(Screen[None]):
 
         position_ms = app.player.position_ms
 
-        # Only save if position changed significantly (>5 seconds)
-        if abs(position_ms - self._last_saved_position) > 5000:
-            await app.database.update_progress(app.current_episode.id, position_ms)
-            self._last_saved_position = position_ms
+        # Only save if position changed significantly (>5 seconds). The last
+        # save is tied to its episode, since playback can switch episodes
+        # from other screens without going through on_episode_selected.
+        last_id, last_position = self._last_saved
+        if last_id != episode.id or abs(position_ms - last_position) > 5000:
+            await app.database.update_progress(episode.id, position_ms)
+            self._last_saved = (episode.id, position_ms)
+            self._invalidate_episodes(episode.feed_key)
 
     async def _load_feeds(self) -> None:
         """Load feeds from the database."""
         app: FeedbackApp = self.app  # type: ignore[assignment]
-        feed_list = self.query_one(FeedList)
-        feed_list.set_feeds(app.feeds)
+        self._feed_list.set_feeds(app.feeds)
 
         # Auto-select first feed and load its episodes
         if app.feeds:
             first_feed = app.feeds[0]
             self._selected_feed_key = first_feed.key
             # Highlight the first feed in the list
-            feed_list.highlighted = 0
+            self._feed_list.highlighted = 0
             await self._load_episodes(first_feed.key)
 
     async def _load_episodes(self, feed_key: str) -> None:
-        """Load episodes for a feed."""
-        app: FeedbackApp = self.app  # type: ignore[assignment]
-        episodes = await app.database.get_episodes(feed_key)
-        episode_list = self.query_one(EpisodeList)
-        episode_list.set_episodes(episodes)
+        """Load episodes for a feed, reusing the cached list when it is clean."""
+        episodes = self._episode_cache.get(feed_key)
+        if episodes is None or feed_key in self._episode_cache_dirty:
+            app: FeedbackApp = self.app  # type: ignore[assignment]
+            episodes = await app.database.get_episodes(feed_key)
+            self._episode_cache[feed_key] = episodes
+            self._episode_cache_dirty.discard(feed_key)
+            if len(self._episode_cache) > self.EPISODE_CACHE_SIZE:
+                evicted, _ = self._episode_cache.popitem(last=False)
+                self._episode_cache_dirty.discard(evicted)
+        self._episode_cache.move_to_end(feed_key)
+        self._episode_list.set_episodes(episodes)
+
+    def _invalidate_episodes(self, feed_key: str | None = None) -> None:
+        """Mark cached episode lists as stale.
+
+        Args:
+            feed_key: Feed to invalidate, or None to invalidate every feed.
+        """
+        if feed_key is None:
+            self._episode_cache_dirty.update(self._episode_cache)
+        elif feed_key in self._episode_cache:
+            self._episode_cache_dirty.add(feed_key)
+
+    async def on_screen_resume(self) -> None:
+        """Invalidate cached episodes, which other screens may have changed."""
+        self._invalidate_episodes()
 
     async def on_feed_selected(self, event: FeedSelected) -> None:
         """Handle feed selection."""
@@ -225,16 +298,16 @@ class PrimaryScreen(Screen[None]):
         # Save progress of previous episode before switching
         await self._save_progress()
 
-        metadata_panel = self.query_one(MetadataPanel)
-        metadata_panel.show_episode(event.episode.title, event.episode.description)
+        self._metadata_panel.show_episode(
+            event.episode.title, event.episode.description
+        )
         await app.play_episode(event.episode)
 
-        # Reset last saved position for new episode
-        self._last_saved_position = event.episode.progress_ms
+        # Playback resumes from the stored progress, which is already saved
+        self._last_saved = (event.episode.id, event.episode.progress_ms)
 
         # Update the player bar
-        player_bar = self.query_one(PlayerBar)
-        player_bar.set_playing(
+        self._player_bar.set_playing(
             title=event.episode.title,
             duration_ms=app.player.duration_ms,
         )
@@ -264,8 +337,6 @@ class PrimaryScreen(Screen[None]):
 
     async def action_refresh(self) -> None:
         """Refresh all feeds from their sources."""
-        from feedback.widgets.loading_overlay import LoadingOverlay
-
         app: FeedbackApp = self.app  # type: ignore[assignment]
 
         if not app.feeds:
@@ -287,6 +358,7 @@ class PrimaryScreen(Screen[None]):
             success, failed, errors = await app.refresh_feeds_from_sources(
                 progress_callback=progress_callback
             )
+            self._invalidate_episodes()
             await self._load_feeds()
 
             if failed == 0:
@@ -317,8 +389,6 @@ class PrimaryScreen(Screen[None]):
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle input submission (add feed or search)."""
-        from feedback.widgets.loading_overlay import LoadingOverlay
-
         value = event.value.strip()
         is_search = isinstance(event.input, SearchInput)
         event.input.remove()
@@ -333,7 +403,7 @@ class PrimaryScreen(Screen[None]):
                 return
 
             url = value
-            if not url.startswith(("http://", "https://")):
+            if "://" not in url:
                 url = f"https://{url}"
 
             # Show loading overlay
@@ -355,10 +425,7 @@ class PrimaryScreen(Screen[None]):
     @work(exclusive=True)
     async def action_delete(self) -> None:
         """Delete the selected feed."""
-        from feedback.widgets.confirm_dialog import ConfirmDialog
-
-        feed_list = self.query_one(FeedList)
-        selected_feed = feed_list.get_selected_feed()
+        selected_feed = self._feed_list.get_selected_feed()
 
         if selected_feed is None:
             self.notify("No feed selected", severity="warning")
@@ -379,6 +446,8 @@ class PrimaryScreen(Screen[None]):
 
         app: FeedbackApp = self.app  # type: ignore[assignment]
         await app.delete_feed(selected_feed.key)
+        self._episode_cache.pop(selected_feed.key, None)
+        self._episode_cache_dirty.discard(selected_feed.key)
         await self._load_feeds()
         self.notify(f"Deleted: {selected_feed.title}", severity="information")
 
@@ -390,58 +459,66 @@ class PrimaryScreen(Screen[None]):
         if app.player.state.name == "PLAYING":
             await self._save_progress()
 
+        before = app.player.state
         await app.toggle_play_pause()
-
-        player_bar = self.query_one(PlayerBar)
-        if app.player.state.name == "PLAYING":
-            player_bar.status = "Playing"
-            self.notify("Resumed playback")
-        elif app.player.state.name == "PAUSED":
-            player_bar.status = "Paused"
-            self.notify("Paused playback")
+        state = app.player.state
+
+        # Only announce real state changes so repeated presses don't pile up
+        # notifications
+        if state.name == "PLAYING":
+            self._player_bar.status = "Playing"
+            if state != before:
+                self.notify("Resumed playback")
+        elif state.name == "PAUSED":
+            self._player_bar.status = "Paused"
+            if state != before:
+                self.notify("Paused playback")
         else:
             self.notify("No episode playing")
 
-    async def action_mark_played(self) -> None:
+    def action_mark_played(self) -> None:
         """Mark the selected episode as played."""
-        episode_list = self.query_one(EpisodeList)
-        episode = episode_list.get_selected_episode()
+        episode = self._episode_list.get_selected_episode()
 
         if episode is None or episode.id is None:
             self.notify("No episode selected", severity="warning")
             return
 
+        # The selected episode is the cached instance, so update it in place,
+        # redraw its row and let the write finish in the background
+        episode.played = True
+        episode.progress_ms = 0
+        self._episode_list.refresh_episode(episode)
         app: FeedbackApp = self.app  # type: ignore[assignment]
-        await app.database.mark_played(episode.id, played=True)
-
-        # Refresh episode list
-        if self._selected_feed_key:
-            await self._load_episodes(self._selected_feed_key)
+        self.run_worker(
+            app.database.mark_played(episode.id, played=True), group="db-write"
+        )
 
         self.notify(f"Marked as played: {episode.title}", severity="information")
 
-    async def action_mark_unplayed(self) -> None:
+    def action_mark_unplayed(self) -> None:
         """Mark the selected episode as unplayed."""
-        episode_list = self.query_one(EpisodeList)
-        episode = episode_list.get_selected_episode()
+        episode = self._episode_list.get_selected_episode()
 
         if episode is None or episode.id is None:
             self.notify("No episode selected", severity="warning")
             return
 
+        # The selected episode is the cached instance, so update it in place,
+        # redraw its row and let the write finish in the background
+        episode.played = False
+        episode.progress_ms = 0
+        self._episode_list.refresh_episode(episode)
         app: FeedbackApp = self.app  # type: ignore[assignment]
-        await app.database.mark_played(episode.id, played=False)
-
-        # Refresh episode list
-        if self._selected_feed_key:
-            await self._load_episodes(self._selected_feed_key)
+        self.run_worker(
+            app.database.mark_played(episode.id, played=False), group="db-write"
+        )
 
         self.notify(f"Marked as unplayed: {episode.title}", severity="information")
 
     async def action_add_to_queue(self) -> None:
         """Add the selected episode to the playback queue."""
-        episode_list = self.query_one(EpisodeList)
-        episode = episode_list.get_selected_episode()
+        episode = self._episode_list.get_selected_episode()
 
         if episode is None:
             self.notify("No episode selected", severity="warning")
@@ -455,8 +532,7 @@ class PrimaryScreen(Screen[None]):
 
     async def action_download_episode(self) -> None:
         """Download the selected episode."""
-        episode_list = self.query_one(EpisodeList)
-        episode = episode_list.get_selected_episode()
+        episode = self._episode_list.get_selected_episode()
 
         if episode is None:
             self.notify("No episode selected", severity="warning")
@@ -475,11 +551,11 @@ class PrimaryScreen(Screen[None]):
         if app.player.state.name not in ("PLAYING", "PAUSED"):
             return
 
-        new_position = min(
-            app.player.position_ms + 30000,
-            app.player.duration_ms,
-        )
-        await app.player.seek(new_position)
+        position_ms = app.player.position_ms
+        new_position = min(position_ms + 30000, app.player.duration_ms)
+        # Already at the end; skip the round-trip to the backend
+        if new_position != position_ms:
+            await app.player.seek(new_position)
 
     async def action_seek_backward(self) -> None:
         """Seek backward 10 seconds."""
@@ -488,59 +564,73 @@ class PrimaryScreen(Screen[None]):
         if app.player.state.name not in ("PLAYING", "PAUSED"):
             return
 
-        new_position = max(app.player.position_ms - 10000, 0)
-        await app.player.seek(new_position)
+        position_ms = app.player.position_ms
+        new_position = max(position_ms - 10000, 0)
+        if new_position != position_ms:
+            await app.player.seek(new_position)
 
     async def action_volume_up(self) -> None:
         """Increase volume by 10%."""
-        app: FeedbackApp = self.app  # type: ignore[assignment]
-        new_volume = min(app.player.volume + 10, 100)
-        await app.player.set_volume(new_volume)
-        self.notify(f"Volume: {new_volume}%")
+        await self._change_volume(10)
 
     async def action_volume_down(self) -> None:
         """Decrease volume by 10%."""
+        await self._change_volume(-10)
+
+    async def _change_volume(self, delta: int) -> None:
+        """Adjust the volume, skipping the backend call at either limit.
+
+        Args:
+            delta: Volume change in percentage points.
+        """
         app: FeedbackApp = self.app  # type: ignore[assignment]
-        new_volume = max(app.player.volume - 10, 0)
-        await app.player.set_volume(new_volume)
+        volume = app.player.volume
+        new_volume = max(0, min(volume + delta, 100))
+        if new_volume != volume:
+            await app.player.set_volume(new_volume)
         self.notify(f"Volume: {new_volume}%")
 
     async def action_speed_up(self) -> None:
         """Increase playback speed by 0.1x."""
-        app: FeedbackApp = self.app  # type: ignore[assignment]
-        new_speed = min(app.player.speed + 0.1, 2.0)
-        await app.player.set_speed(new_speed)
-        self.notify(f"Speed: {new_speed:.1f}x")
+        await self._change_rate(0.1)
 
     async def action_speed_down(self) -> None:
         """Decrease playback speed by 0.1x."""
+        await self._change_rate(-0.1)
+
+    async def _change_rate(self, delta: float) -> None:
+        """Adjust the playback rate, skipping the backend call at either limit.
+
+        Args:
+            delta: Rate change, e.g. 0.1 for 0.1x faster.
+        """
         app: FeedbackApp = self.app  # type: ignore[assignment]
-        new_speed = max(app.player.speed - 0.1, 0.5)
-        await app.player.set_speed(new_speed)
-        self.notify(f"Speed: {new_speed:.1f}x")
+        rate = app.player.rate
+        # Round so repeated steps don't accumulate float error
+        new_rate = round(max(0.5, min(rate + delta, 2.0)), 1)
+        if new_rate != rate:
+            await app.player.set_rate(new_rate)
+        self.notify(f"Speed: {new_rate:.1f}x")
 
     def action_cycle_filter(self) -> None:
         """Cycle through episode filter options."""
-        episode_list = self.query_one(EpisodeList)
-        episode_list.cycle_filter()
+        self._episode_list.cycle_filter()
 
-        filter_label = episode_list.get_filter_label()
-        count = episode_list.filtered_count
-        total = episode_list.total_count
+        filter_label = self._episode_list.get_filter_label()
+        count = self._episode_list.filtered_count
+        total = self._episode_list.total_count
         self.notify(f"Filter: {filter_label} ({count}/{total} episodes)")
 
     def action_cycle_sort(self) -> None:
         """Cycle through episode sort options."""
-        episode_list = self.query_one(EpisodeList)
-        episode_list.cycle_sort()
+        self._episode_list.cycle_sort()
 
-        sort_label = episode_list.get_sort_label()
+        sort_label = self._episode_list.get_sort_label()
         self.notify(f"Sort: {sort_label}")
 
     async def action_mark_all_played(self) -> None:
         """Mark all episodes of the selected feed as played."""
-        feed_list = self.query_one(FeedList)
-        feed = feed_list.get_selected_feed()
+        feed = self._feed_list.get_selected_feed()
 
         if feed is None:
             self.notify("No feed selected", severity="warning")
@@ -549,6 +639,15 @@ class PrimaryScreen(Screen[None]):
         app: FeedbackApp = self.app  # type: ignore[assignment]
         count = await app.database.mark_all_played(feed.key, played=True)
 
+        # Apply the same update to the cached episodes instead of re-reading
+        # them, and cache a new list so the episode list redraws
+        cached = self._episode_cache.get(feed.key)
+        if cached is not None:
+            for episode in cached:
+                episode.played = True
+                episode.progress_ms = 0
+            self._episode_cache[feed.key] = list(cached)
+
         # Refresh episode list
         await self._load_episodes(feed.key)
 
@@ -556,8 +655,7 @@ class PrimaryScreen(Screen[None]):
 
     async def action_feed_info(self) -> None:
         """Show information about the selected feed."""
-        feed_list = self.query_one(FeedList)
-        feed = feed_list.get_selected_feed()
+        feed = self._feed_list.get_selected_feed()
 
         if feed is None:
             self.notify("No feed selected", severity="warning")
@@ -572,7 +670,6 @@ class PrimaryScreen(Screen[None]):
             last_updated = feed.last_build_date.strftime("%Y-%m-%d %H:%M")
 
         # Show info in metadata panel
-        metadata_panel = self.query_one(MetadataPanel)
         info_text = f"""[bold]{feed.title}[/bold]
 
 [dim]URL:[/dim] {feed.key}
@@ -588,7 +685,7 @@ class PrimaryScreen(Screen[None]):
 [dim]Description:[/dim]
 {feed.description or 'No description'}"""
 
-        metadata_panel.update(info_text)
+        self._metadata_panel.update(info_text)
 
     def action_search_podcasts(self) -> None:
         """Search for podcasts using Podcast Index API.
@@ -609,13 +706,7 @@ class PrimaryScreen(Screen[None]):
         Args:
             query: Search query string.
         """
-        from feedback.config import get_config
-        from feedback.feeds.discovery import (
-            DiscoveryAuthError,
-            DiscoverySearchError,
-            PodcastIndexClient,
-        )
-        from feedback.widgets.loading_overlay import LoadingOverlay
+        from feedback.feeds.discovery import DiscoveryAuthError, DiscoverySearchError
 
         config = get_config()
 
@@ -627,11 +718,8 @@ class PrimaryScreen(Screen[None]):
             )
             return
 
-        client = PodcastIndexClient(
-            api_key=config.discovery.api_key,
-            api_secret=config.discovery.api_secret,
-            timeout=config.network.timeout,
-        )
+        app: FeedbackApp = self.app  # type: ignore[assignment]
+        client = app.discovery_client
 
         # Show loading overlay
         loading = LoadingOverlay(
@@ -649,13 +737,11 @@ class PrimaryScreen(Screen[None]):
                 return
 
             # Show results in metadata panel
-            metadata_panel = self.query_one(MetadataPanel)
-            result_text = "[bold]Search Results[/bold]\n\n"
-            for i, podcast in enumerate(results, 1):
-                result_text += f"{i}. {podcast.title}\n"
-                result_text += f"   [dim]{podcast.url}[/dim]\n\n"
-
-            metadata_panel.update(result_text)
+            result_text = "[bold]Search Results[/bold]\n\n" + "".join(
+                f"{i}. {podcast.title}\n   [dim]{podcast.url}[/dim]\n\n"
+                for i, podcast in enumerate(results, 1)
+            )
+            self._metadata_panel.update(result_text)
             self.notify(
                 f"Found {len(results)} podcasts. Use 'a' to add a feed URL.",
                 severity="information",
@@ -10,11 +10,13 @@ from textual.screen import Screen
 from textual.widgets import Footer, Header, Static
 
 from feedback.models import QueueItem
+from feedback.widgets.confirm_dialog import ConfirmDialog
 from feedback.widgets.player_bar import PlayerBar
 from feedback.widgets.queue_list import QueueItemSelected, QueueList
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
+    from textual.timer import Timer
 
     from feedback.app import FeedbackApp
     from feedback.models import Episode
@@ -35,18 +37,24 @@ class QueueScreen(Screen[None]):
         Binding("space", "play_pause", "Play/Pause", show=False),
     ]
 
+    # Seconds to wait after the last reorder before writing the queue
+    SAVE_QUEUE_DELAY = 0.3
+
     def __init__(self) -> None:
         """Initialize the queue screen."""
         super().__init__()
         self._queue_items: list[tuple[QueueItem, Episode]] = []
+        self._save_queue_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the queue screen layout."""
         yield Header()
-        yield PlayerBar()
+        self._player_bar = PlayerBar()
+        yield self._player_bar
         with Vertical(id="queue-content"):
             yield Static("Playback Queue", id="queue-title")
-            yield QueueList()
+            self._queue_list = QueueList()
+            yield self._queue_list
         yield Footer()
 
     async def on_mount(self) -> None:
@@ -57,27 +65,40 @@ class QueueScreen(Screen[None]):
         """Reload queue when returning to this screen."""
         await self._load_queue()
 
+    async def on_screen_suspend(self) -> None:
+        """Write any pending reorder before another screen reads the queue."""
+        await self._flush_save_queue()
+
+    async def on_unmount(self) -> None:
+        """Write any pending reorder before the screen goes away."""
+        await self._flush_save_queue()
+
     async def _load_queue(self) -> None:
         """Load the queue from database."""
         app: FeedbackApp = self.app  # type: ignore[assignment]
         queue_items = await app.database.get_queue()
 
-        # Fetch episode details for each queue item
-        self._queue_items = []
-        for item in queue_items:
-            episode = await app.database.get_episode(item.episode_id)
-            if episode:
-                self._queue_items.append((item, episode))
+        # Fetch episode details for all queue items in one query
+        episodes = await app.database.get_episodes_by_ids(
+            [item.episode_id for item in queue_items]
+        )
+        episodes_by_id = {episode.id: episode for episode in episodes}
+        self._queue_items = [
+            (item, episodes_by_id[item.episode_id])
+            for item in queue_items
+            if item.episode_id in episodes_by_id
+        ]
 
         # Update the widget
-        queue_list = self.query_one(QueueList)
-        queue_list.set_queue(self._queue_items)
+        self._queue_list.set_queue(self._queue_items)
 
         if not self._queue_items:
             self.notify("Queue is empty", severity="information")
 
     async def _save_queue(self) -> None:
         """Save the current queue order to database."""
+        # This write covers any reorder that was still waiting to be saved
+        self._cancel_save_queue()
         app: FeedbackApp = self.app  # type: ignore[assignment]
         # Rebuild queue items with new positions
         new_items = [
@@ -87,26 +108,39 @@ class QueueScreen(Screen[None]):
         ]
         await app.database.save_queue(new_items)
 
+    def _schedule_save_queue(self) -> None:
+        """Save the queue once reordering has been idle for SAVE_QUEUE_DELAY.
+
+        Holding a move key would otherwise rewrite the whole queue table on
+        every keystroke.
+        """
+        self._cancel_save_queue()
+        self._save_queue_timer = self.set_timer(
+            self.SAVE_QUEUE_DELAY, self._flush_save_queue
+        )
+
+    def _cancel_save_queue(self) -> None:
+        """Drop any scheduled queue save."""
+        if self._save_queue_timer is not None:
+            self._save_queue_timer.stop()
+            self._save_queue_timer = None
+
+    async def _flush_save_queue(self) -> None:
+        """Run a scheduled queue save now, if one is pending."""
+        if self._save_queue_timer is not None:
+            await self._save_queue()
+
     def action_move_down(self) -> None:
         """Move selection down."""
-        try:
-            queue_list = self.query_one(QueueList)
-            queue_list.action_cursor_down()
-        except Exception:
-            pass
+        self._queue_list.action_cursor_down()
 
     def action_move_up(self) -> None:
         """Move selection up."""
-        try:
-            queue_list = self.query_one(QueueList)
-            queue_list.action_cursor_up()
-        except Exception:
-            pass
+        self._queue_list.action_cursor_up()
 
     async def action_play(self) -> None:
         """Play the selected queue item."""
-        queue_list = self.query_one(QueueList)
-        item = queue_list.get_selected_item()
+        item = self._queue_list.get_selected_item()
 
         if item is None:
             self.notify("No item selected", severity="warning")
@@ -119,42 +153,29 @@ class QueueScreen(Screen[None]):
         await app.play_episode(episode)
 
         # Update player bar
-        player_bar = self.query_one(PlayerBar)
-        player_bar.set_playing(
+        self._player_bar.set_playing(
             title=episode.title,
             duration_ms=app.player.duration_ms,
         )
 
         self.notify(f"Playing: {episode.title}")
 
-    async def action_remove(self) -> None:
+    def action_remove(self) -> None:
         """Remove the selected item from the queue."""
-        queue_list = self.query_one(QueueList)
-        item = queue_list.get_selected_item()
+        idx = self._queue_list.highlighted
 
-        if item is None:
+        if idx is None or not 0 <= idx < len(self._queue_items):
             self.notify("No item selected", severity="warning")
             return
 
-        queue_item, episode = item
-
-        # Remove from local list
-        self._queue_items = [
-            (qi, ep) for qi, ep in self._queue_items if qi.episode_id != queue_item.episode_id
-        ]
-
-        # Save to database
-        await self._save_queue()
-
-        # Refresh display
-        queue_list.set_queue(self._queue_items)
+        _queue_item, episode = self._queue_items.pop(idx)
+        self._queue_list.remove_at(idx)
+        self._schedule_save_queue()
 
         self.notify(f"Removed: {episode.title}", severity="information")
 
     async def action_clear(self) -> None:
         """Clear the entire queue."""
-        from feedback.widgets.confirm_dialog import ConfirmDialog
-
         if not self._queue_items:
             self.notify("Queue is already empty", severity="information")
             return
@@ -173,73 +194,69 @@ class QueueScreen(Screen[None]):
             return
 
         app: FeedbackApp = self.app  # type: ignore[assignment]
+        self._cancel_save_queue()
         await app.database.clear_queue()
 
         self._queue_items = []
-        queue_list = self.query_one(QueueList)
-        queue_list.set_queue([])
+        self._queue_list.set_queue([])
 
         self.notify("Queue cleared", severity="information")
 
-    async def action_move_item_up(self) -> None:
+    def action_move_item_up(self) -> None:
         """Move the selected item up in the queue."""
-        queue_list = self.query_one(QueueList)
-
-        if queue_list.highlighted is None or queue_list.highlighted <= 0:
+        idx = self._queue_list.highlighted
+        if idx is None or idx <= 0:
             return
 
-        idx = queue_list.highlighted
-
         # Swap with previous item
         self._queue_items[idx], self._queue_items[idx - 1] = (
             self._queue_items[idx - 1],
             self._queue_items[idx],
         )
 
-        # Save and refresh
-        await self._save_queue()
-        queue_list.set_queue(self._queue_items)
-        queue_list.highlighted = idx - 1
+        # Refresh now and save once the user stops reordering
+        self._schedule_save_queue()
+        self._queue_list.swap(idx, idx - 1)
+        self._queue_list.highlighted = idx - 1
 
         self.notify("Moved up")
 
-    async def action_move_item_down(self) -> None:
+    def action_move_item_down(self) -> None:
         """Move the selected item down in the queue."""
-        queue_list = self.query_one(QueueList)
-
-        if (
-            queue_list.highlighted is None
-            or queue_list.highlighted >= len(self._queue_items) - 1
-        ):
+        idx = self._queue_list.highlighted
+        if idx is None or idx >= len(self._queue_items) - 1:
             return
 
-        idx = queue_list.highlighted
-
         # Swap with next item
         self._queue_items[idx], self._queue_items[idx + 1] = (
             self._queue_items[idx + 1],
             self._queue_items[idx],
         )
 
-        # Save and refresh
-        await self._save_queue()
-        queue_list.set_queue(self._queue_items)
-        queue_list.highlighted = idx + 1
+        # Refresh now and save once the user stops reordering
+        self._schedule_save_queue()
+        self._queue_list.swap(idx, idx + 1)
+        self._queue_list.highlighted = idx + 1
 
         self.notify("Moved down")
 
     async def action_play_pause(self) -> None:
         """Toggle play/pause."""
         app: FeedbackApp = self.app  # type: ignore[assignment]
+        before = app.player.state
         await app.toggle_play_pause()
-
-        player_bar = self.query_one(PlayerBar)
-        if app.player.state.name == "PLAYING":
-            player_bar.status = "Playing"
-            self.notify("Resumed playback")
-        elif app.player.state.name == "PAUSED":
-            player_bar.status = "Paused"
-            self.notify("Paused playback")
+        state = app.player.state
+
+        # Only announce real state changes so repeated presses don't pile up
+        # notifications
+        if state.name == "PLAYING":
+            self._player_bar.status = "Playing"
+            if state != before:
+                self.notify("Resumed playback")
+        elif state.name == "PAUSED":
+            self._player_bar.status = "Paused"
+            if state != before:
+                self.notify("Paused playback")
         else:
             self.notify("No episode playing")
 
@@ -251,8 +268,7 @@ class QueueScreen(Screen[None]):
         await app.play_episode(event.episode)
 
         # Update player bar
-        player_bar = self.query_one(PlayerBar)
-        player_bar.set_playing(
+        self._player_bar.set_playing(
             title=event.episode.title,
             duration_ms=app.player.duration_ms,
         )
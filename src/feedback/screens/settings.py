@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, Literal
 
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.lazy import Lazy
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Select, Static
 
+from feedback.config import get_config, get_config_path
+
 if TYPE_CHECKING:
     from textual.app import ComposeResult
+    from textual.widget import Widget
+
+# How a setting is edited: the backend picker, masked text, or an Input type
+SettingKind = Literal["select", "password", "integer", "number", "text"]
 
 
 class SettingsScreen(ModalScreen[bool]):
@@ -23,6 +30,63 @@ class SettingsScreen(ModalScreen[bool]):
         Binding("escape", "cancel", "Cancel"),
     ]
 
+    BACKEND_OPTIONS: ClassVar[list[tuple[str, str]]] = [("VLC", "vlc"), ("MPV", "mpv")]
+
+    # (section title, config section, rows) in display order. Each row is
+    # (label, widget ID, config field, kind), where kind is "select" for the
+    # backend picker, "password" for masked text, or an Input type.
+    SECTIONS: ClassVar[
+        list[tuple[str, str, list[tuple[str, str, str, SettingKind]]]]
+    ] = [
+        (
+            "Player",
+            "player",
+            [
+                ("Backend:", "player-backend", "backend", "select"),
+                ("Default Volume:", "player-volume", "default_volume", "integer"),
+                ("Default Speed:", "player-speed", "default_speed", "number"),
+                ("Seek Forward (s):", "player-seek-forward", "seek_forward", "integer"),
+                (
+                    "Seek Backward (s):",
+                    "player-seek-backward",
+                    "seek_backward",
+                    "integer",
+                ),
+            ],
+        ),
+        (
+            "Network",
+            "network",
+            [
+                ("Timeout (s):", "network-timeout", "timeout", "number"),
+                ("Max Episodes:", "network-max-episodes", "max_episodes", "integer"),
+            ],
+        ),
+        (
+            "Downloads",
+            "download",
+            [("Concurrent:", "download-concurrent", "concurrent", "integer")],
+        ),
+        (
+            "Podcast Index API",
+            "discovery",
+            [
+                ("API Key:", "discovery-api-key", "api_key", "password"),
+                ("API Secret:", "discovery-api-secret", "api_secret", "password"),
+            ],
+        ),
+    ]
+
+    # Sections below the fold, mounted after the first refresh
+    LAZY_SECTIONS: ClassVar[frozenset[str]] = frozenset({"discovery"})
+
+    # Row labels by widget ID, for validation messages
+    LABELS: ClassVar[dict[str, str]] = {
+        widget_id: label.removesuffix(":")
+        for _title, _section, rows in SECTIONS
+        for label, widget_id, _field, _kind in rows
+    }
+
     DEFAULT_CSS = """
     SettingsScreen {
         align: center middle;
@@ -46,6 +110,10 @@ class SettingsScreen(ModalScreen[bool]):
         margin-bottom: 1;
     }
 
+    SettingsScreen .settings-section {
+        height: auto;
+    }
+
     SettingsScreen .section-title {
         text-style: bold underline;
         margin-top: 1;
@@ -92,124 +160,69 @@ class SettingsScreen(ModalScreen[bool]):
         """Initialize the settings screen."""
         super().__init__()
         self._original_values: dict[str, str | int | float | bool] = {}
+        self._inputs: dict[str, Input] = {}
 
     def compose(self) -> ComposeResult:
         """Compose the settings screen."""
-        from feedback.config import get_config
-
         config = get_config()
 
         with Vertical():
             yield Static("Settings", classes="settings-title")
 
             with VerticalScroll():
-                # Player Settings
-                yield Static("Player", classes="section-title")
-
-                with Horizontal(classes="setting-row"):
-                    yield Label("Backend:", classes="setting-label")
-                    yield Select(
-                        [("VLC", "vlc"), ("MPV", "mpv")],
-                        value=config.player.backend.lower(),
-                        id="player-backend",
-                        classes="setting-input",
-                    )
-
-                with Horizontal(classes="setting-row"):
-                    yield Label("Default Volume:", classes="setting-label")
-                    yield Input(
-                        str(config.player.default_volume),
-                        id="player-volume",
-                        classes="setting-input",
-                        type="integer",
-                    )
-
-                with Horizontal(classes="setting-row"):
-                    yield Label("Default Speed:", classes="setting-label")
-                    yield Input(
-                        str(config.player.default_speed),
-                        id="player-speed",
-                        classes="setting-input",
-                        type="number",
-                    )
-
-                with Horizontal(classes="setting-row"):
-                    yield Label("Seek Forward (s):", classes="setting-label")
-                    yield Input(
-                        str(config.player.seek_forward),
-                        id="player-seek-forward",
-                        classes="setting-input",
-                        type="integer",
-                    )
-
-                with Horizontal(classes="setting-row"):
-                    yield Label("Seek Backward (s):", classes="setting-label")
-                    yield Input(
-                        str(config.player.seek_backward),
-                        id="player-seek-backward",
-                        classes="setting-input",
-                        type="integer",
-                    )
-
-                # Network Settings
-                yield Static("Network", classes="section-title")
-
-                with Horizontal(classes="setting-row"):
-                    yield Label("Timeout (s):", classes="setting-label")
-                    yield Input(
-                        str(config.network.timeout),
-                        id="network-timeout",
-                        classes="setting-input",
-                        type="number",
-                    )
-
-                with Horizontal(classes="setting-row"):
-                    yield Label("Max Episodes:", classes="setting-label")
-                    yield Input(
-                        str(config.network.max_episodes),
-                        id="network-max-episodes",
-                        classes="setting-input",
-                        type="integer",
-                    )
-
-                # Download Settings
-                yield Static("Downloads", classes="section-title")
-
-                with Horizontal(classes="setting-row"):
-                    yield Label("Concurrent:", classes="setting-label")
-                    yield Input(
-                        str(config.download.concurrent),
-                        id="download-concurrent",
-                        classes="setting-input",
-                        type="integer",
-                    )
-
-                # Discovery Settings
-                yield Static("Podcast Index API", classes="section-title")
-
-                with Horizontal(classes="setting-row"):
-                    yield Label("API Key:", classes="setting-label")
-                    yield Input(
-                        config.discovery.api_key or "",
-                        id="discovery-api-key",
-                        classes="setting-input",
-                        password=True,
-                    )
-
-                with Horizontal(classes="setting-row"):
-                    yield Label("API Secret:", classes="setting-label")
-                    yield Input(
-                        config.discovery.api_secret or "",
-                        id="discovery-api-secret",
-                        classes="setting-input",
-                        password=True,
-                    )
+                for title, section_name, rows in self.SECTIONS:
+                    container: Widget = Vertical(classes="settings-section")
+                    if section_name in self.LAZY_SECTIONS:
+                        container = Lazy(container)
+                    with container:
+                        yield Static(title, classes="section-title")
+                        section = getattr(config, section_name)
+                        for label, widget_id, field, kind in rows:
+                            with Horizontal(classes="setting-row"):
+                                yield Label(label, classes="setting-label")
+                                yield self._setting_widget(
+                                    widget_id, kind, getattr(section, field)
+                                )
 
             # Buttons
             with Horizontal(classes="button-row"):
                 yield Button("Save", variant="primary", id="save-btn")
                 yield Button("Cancel", variant="default", id="cancel-btn")
 
+    def _setting_widget(
+        self, widget_id: str, kind: SettingKind, value: object
+    ) -> Input | Select[str]:
+        """Create a settings widget and keep a reference to it for saving.
+
+        Args:
+            widget_id: Widget ID; inputs are also stored under it in
+                ``self._inputs``.
+            kind: "select", "password", or an ``Input`` type.
+            value: Current config value for the setting.
+
+        Returns:
+            The new widget.
+        """
+        if kind == "select":
+            self._backend_select = Select(
+                self.BACKEND_OPTIONS,
+                value=str(value).lower(),
+                id=widget_id,
+                classes="setting-input",
+            )
+            return self._backend_select
+        if kind == "password":
+            widget = Input(
+                str(value or ""),
+                id=widget_id,
+                classes="setting-input",
+                password=True,
+            )
+        else:
+            widget = Input(str(value), id=widget_id, classes="setting-input", type=kind)
+        self._inputs[widget_id] = widget
+        return widget
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "save-btn":
@@ -224,31 +237,22 @@ class SettingsScreen(ModalScreen[bool]):
 
     async def _save_settings(self) -> None:
         """Save settings to config file."""
-        from feedback.config import get_config_path
-
-        # Collect values from inputs
-        try:
-            backend = self.query_one("#player-backend", Select).value
-            volume = int(self.query_one("#player-volume", Input).value)
-            speed = float(self.query_one("#player-speed", Input).value)
-            seek_forward = int(self.query_one("#player-seek-forward", Input).value)
-            seek_backward = int(self.query_one("#player-seek-backward", Input).value)
-            timeout = float(self.query_one("#network-timeout", Input).value)
-            max_episodes = int(self.query_one("#network-max-episodes", Input).value)
-            concurrent = int(self.query_one("#download-concurrent", Input).value)
-            api_key = self.query_one("#discovery-api-key", Input).value
-            api_secret = self.query_one("#discovery-api-secret", Input).value
-
-            # Validate ranges
-            volume = max(0, min(100, volume))
-            speed = max(0.5, min(2.0, speed))
-            seek_forward = max(1, seek_forward)
-            seek_backward = max(1, seek_backward)
-            timeout = max(1.0, timeout)
-            concurrent = max(1, min(10, concurrent))
-
-        except ValueError as e:
-            self.app.notify(f"Invalid value: {e}", severity="error")
+        # Collect and clamp values from inputs, noting every invalid field
+        errors: list[str] = []
+        inputs = self._inputs
+        backend = self._backend_select.value
+        volume = self._read_int("player-volume", errors, 0, 100)
+        speed = self._read_float("player-speed", errors, 0.5, 2.0)
+        seek_forward = self._read_int("player-seek-forward", errors, 1)
+        seek_backward = self._read_int("player-seek-backward", errors, 1)
+        timeout = self._read_float("network-timeout", errors, 1.0)
+        max_episodes = self._read_int("network-max-episodes", errors)
+        concurrent = self._read_int("download-concurrent", errors, 1, 10)
+        api_key = inputs["discovery-api-key"].value
+        api_secret = inputs["discovery-api-secret"].value
+
+        if errors:
+            self.app.notify(f"Invalid value: {'; '.join(errors)}", severity="error")
             return
 
         # Generate TOML content
@@ -266,14 +270,76 @@ class SettingsScreen(ModalScreen[bool]):
             api_secret=api_secret,
         )
 
-        # Write config file
+        # Write to a sibling file and swap it in, so a crash mid-write can't
+        # leave a truncated config behind
+        tmp_path = config_path.with_name(f"{config_path.name}.tmp")
         try:
             config_path.parent.mkdir(parents=True, exist_ok=True)
-            config_path.write_text(toml_content)
+            tmp_path.write_text(toml_content)
+            tmp_path.replace(config_path)
             self.app.notify("Settings saved. Restart for some changes to take effect.", severity="information")
         except OSError as e:
+            tmp_path.unlink(missing_ok=True)
             self.app.notify(f"Failed to save settings: {e}", severity="error")
 
+    def _read_int(
+        self,
+        widget_id: str,
+        errors: list[str],
+        low: int | None = None,
+        high: int | None = None,
+    ) -> int:
+        """Read a whole number from an input, clamped to the given bounds.
+
+        Args:
+            widget_id: ID of the input to read.
+            errors: List that a message is appended to if the value is invalid.
+            low: Smallest allowed value, if any.
+            high: Largest allowed value, if any.
+
+        Returns:
+            The clamped value, or 0 if the input was invalid.
+        """
+        try:
+            value = int(self._inputs[widget_id].value)
+        except ValueError:
+            errors.append(f"{self.LABELS[widget_id]} must be a whole number")
+            return 0
+        if low is not None:
+            value = max(low, value)
+        if high is not None:
+            value = min(high, value)
+        return value
+
+    def _read_float(
+        self,
+        widget_id: str,
+        errors: list[str],
+        low: float | None = None,
+        high: float | None = None,
+    ) -> float:
+        """Read a number from an input, clamped to the given bounds.
+
+        Args:
+            widget_id: ID of the input to read.
+            errors: List that a message is appended to if the value is invalid.
+            low: Smallest allowed value, if any.
+            high: Largest allowed value, if any.
+
+        Returns:
+            The clamped value, or 0.0 if the input was invalid.
+        """
+        try:
+            value = float(self._inputs[widget_id].value)
+        except ValueError:
+            errors.append(f"{self.LABELS[widget_id]} must be a number")
+            return 0.0
+        if low is not None:
+            value = max(low, value)
+        if high is not None:
+            value = min(high, value)
+        return value
+
     def _generate_toml(
         self,
         *,
@@ -293,33 +359,30 @@ class SettingsScreen(ModalScreen[bool]):
         Returns:
             TOML formatted string.
         """
-        lines = [
-            "# Feedback Configuration",
-            "# Generated by settings screen",
-            "",
-            "[player]",
-            f'backend = "{backend}"',
-            f"default_volume = {volume}",
-            f"default_speed = {speed}",
-            f"seek_forward = {seek_forward}",
-            f"seek_backward = {seek_backward}",
-            "",
-            "[network]",
-            f"timeout = {timeout}",
-            f"max_episodes = {max_episodes}",
-            "",
-            "[download]",
-            f"concurrent = {concurrent}",
-            "",
-        ]
+        # Adjacent literals compile to a single string build
+        content = (
+            "# Feedback Configuration\n"
+            "# Generated by settings screen\n"
+            "\n"
+            "[player]\n"
+            f'backend = "{backend}"\n'
+            f"default_volume = {volume}\n"
+            f"default_speed = {speed}\n"
+            f"seek_forward = {seek_forward}\n"
+            f"seek_backward = {seek_backward}\n"
+            "\n"
+            "[network]\n"
+            f"timeout = {timeout}\n"
+            f"max_episodes = {max_episodes}\n"
+            "\n"
+            "[download]\n"
+            f"concurrent = {concurrent}\n"
+        )
 
         # Only include discovery section if credentials are provided
         if api_key or api_secret:
-            lines.extend([
-                "[discovery]",
-                f'api_key = "{api_key}"',
-                f'api_secret = "{api_secret}"',
-                "",
-            ])
-
-        return "\n".join(lines)
+            content += (
+                f'\n[discovery]\napi_key = "{api_key}"\napi_secret = "{api_secret}"\n'
+            )
+
+        return content
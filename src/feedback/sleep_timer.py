@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from enum import Enum
 from typing import TYPE_CHECKING, ClassVar
 
@@ -26,37 +26,47 @@ class SleepTimerMode(Enum):
     @property
     def label(self) -> str:
         """Get human-readable label for the mode."""
-        labels = {
-            SleepTimerMode.OFF: "Off",
-            SleepTimerMode.MINUTES_15: "15 minutes",
-            SleepTimerMode.MINUTES_30: "30 minutes",
-            SleepTimerMode.MINUTES_45: "45 minutes",
-            SleepTimerMode.MINUTES_60: "60 minutes",
-            SleepTimerMode.END_OF_EPISODE: "End of episode",
-        }
-        return labels.get(self, "Unknown")
+        return _MODE_LABELS[self]
 
     @property
     def minutes(self) -> int | None:
         """Get duration in minutes, or None for end of episode."""
-        durations = {
-            SleepTimerMode.OFF: None,
-            SleepTimerMode.MINUTES_15: 15,
-            SleepTimerMode.MINUTES_30: 30,
-            SleepTimerMode.MINUTES_45: 45,
-            SleepTimerMode.MINUTES_60: 60,
-            SleepTimerMode.END_OF_EPISODE: None,
-        }
-        return durations.get(self)
-
-
-@dataclass
+        return _MODE_MINUTES[self]
+
+
+# Per-mode lookup tables, built once rather than on every property access
+_MODE_LABELS: dict[SleepTimerMode, str] = {
+    SleepTimerMode.OFF: "Off",
+    SleepTimerMode.MINUTES_15: "15 minutes",
+    SleepTimerMode.MINUTES_30: "30 minutes",
+    SleepTimerMode.MINUTES_45: "45 minutes",
+    SleepTimerMode.MINUTES_60: "60 minutes",
+    SleepTimerMode.END_OF_EPISODE: "End of episode",
+}
+
+_MODE_MINUTES: dict[SleepTimerMode, int | None] = {
+    SleepTimerMode.OFF: None,
+    SleepTimerMode.MINUTES_15: 15,
+    SleepTimerMode.MINUTES_30: 30,
+    SleepTimerMode.MINUTES_45: 45,
+    SleepTimerMode.MINUTES_60: 60,
+    SleepTimerMode.END_OF_EPISODE: None,
+}
+
+_UNTIMED_MODES = frozenset({SleepTimerMode.OFF, SleepTimerMode.END_OF_EPISODE})
+
+
+@dataclass(slots=True)
 class SleepTimerState:
-    """Current state of the sleep timer."""
+    """Current state of the sleep timer.
+
+    ``deadline`` is a ``time.monotonic()`` timestamp and ``paused_remaining``
+    is in seconds, so the remaining time is unaffected by wall-clock changes.
+    """
 
     mode: SleepTimerMode
-    end_time: datetime | None = None
-    paused_remaining: timedelta | None = None
+    deadline: float | None = None
+    paused_remaining: float | None = None
 
     @property
     def is_active(self) -> bool:
@@ -66,16 +76,13 @@ class SleepTimerState:
     @property
     def remaining_seconds(self) -> int | None:
         """Get remaining seconds, or None if end of episode mode."""
-        if self.mode == SleepTimerMode.OFF:
-            return None
-        if self.mode == SleepTimerMode.END_OF_EPISODE:
+        if self.mode in _UNTIMED_MODES:
             return None
         if self.paused_remaining is not None:
-            return int(self.paused_remaining.total_seconds())
-        if self.end_time is None:
+            return int(self.paused_remaining)
+        if self.deadline is None:
             return None
-        remaining = (self.end_time - datetime.now()).total_seconds()
-        return max(0, int(remaining))
+        return max(0, int(self.deadline - time.monotonic()))
 
     @property
     def remaining_formatted(self) -> str:
@@ -103,6 +110,10 @@ class SleepTimer:
         SleepTimerMode.MINUTES_60,
         SleepTimerMode.END_OF_EPISODE,
     ]
+    # Mode that follows each mode when cycling, wrapping back to the first
+    _NEXT_MODE: ClassVar[dict[SleepTimerMode, SleepTimerMode]] = dict(
+        zip(MODES, MODES[1:] + MODES[:1], strict=True)
+    )
 
     def __init__(self, on_expire: Callable[[], None] | None = None) -> None:
         """Initialize the sleep timer.
@@ -116,7 +127,11 @@ class SleepTimer:
 
     @property
     def state(self) -> SleepTimerState:
-        """Get current timer state."""
+        """Get current timer state.
+
+        The same object is updated in place on every transition, so it is a
+        live view of the timer rather than a snapshot.
+        """
         return self._state
 
     @property
@@ -135,22 +150,22 @@ class SleepTimer:
         Args:
             mode: The timer mode to set.
         """
+        # Untimed modes carry no state, so re-applying one is a no-op
+        if mode == self._state.mode and mode in _UNTIMED_MODES:
+            return
+
         # Cancel existing timer
         self._cancel_timer()
 
-        if mode == SleepTimerMode.OFF:
-            self._state = SleepTimerState(mode=SleepTimerMode.OFF)
-            return
-
-        if mode == SleepTimerMode.END_OF_EPISODE:
-            self._state = SleepTimerState(mode=mode)
+        if mode in _UNTIMED_MODES:
+            self._set_state(mode)
             return
 
-        # Calculate end time for timed modes
+        # Calculate the deadline for timed modes
         minutes = mode.minutes
         if minutes is not None:
-            end_time = datetime.now() + timedelta(minutes=minutes)
-            self._state = SleepTimerState(mode=mode, end_time=end_time)
+            deadline = time.monotonic() + minutes * 60
+            self._set_state(mode, deadline)
             self._start_timer(minutes * 60)
 
     def cycle_mode(self) -> SleepTimerMode:
@@ -159,35 +174,30 @@ class SleepTimer:
         Returns:
             The new mode.
         """
-        current_index = self.MODES.index(self._state.mode)
-        next_index = (current_index + 1) % len(self.MODES)
-        next_mode = self.MODES[next_index]
+        next_mode = self._NEXT_MODE[self._state.mode]
         self.set_mode(next_mode)
         return next_mode
 
     def cancel(self) -> None:
         """Cancel the timer."""
         self._cancel_timer()
-        self._state = SleepTimerState(mode=SleepTimerMode.OFF)
+        self._set_state(SleepTimerMode.OFF)
 
     def pause(self) -> None:
         """Pause the timer (when playback pauses)."""
-        if (
-            self._state.mode not in (SleepTimerMode.OFF, SleepTimerMode.END_OF_EPISODE)
-            and self._state.end_time is not None
-        ):
-            remaining = self._state.end_time - datetime.now()
-            self._state.paused_remaining = max(remaining, timedelta(seconds=0))
+        if self._state.mode not in _UNTIMED_MODES and self._state.deadline is not None:
+            remaining = self._state.deadline - time.monotonic()
+            self._state.paused_remaining = max(remaining, 0.0)
             self._cancel_timer()
 
     def resume(self) -> None:
         """Resume the timer (when playback resumes)."""
         if (
-            self._state.mode not in (SleepTimerMode.OFF, SleepTimerMode.END_OF_EPISODE)
+            self._state.mode not in _UNTIMED_MODES
             and self._state.paused_remaining is not None
         ):
-            seconds = int(self._state.paused_remaining.total_seconds())
-            self._state.end_time = datetime.now() + timedelta(seconds=seconds)
+            seconds = int(self._state.paused_remaining)
+            self._state.deadline = time.monotonic() + seconds
             self._state.paused_remaining = None
             if seconds > 0:
                 self._start_timer(seconds)
@@ -201,12 +211,24 @@ class SleepTimer:
             True if timer triggered and playback should stop.
         """
         if self._state.mode == SleepTimerMode.END_OF_EPISODE:
-            self._state = SleepTimerState(mode=SleepTimerMode.OFF)
+            self._set_state(SleepTimerMode.OFF)
             if self._on_expire:
                 self._on_expire()
             return True
         return False
 
+    def _set_state(self, mode: SleepTimerMode, deadline: float | None = None) -> None:
+        """Update the timer state in place.
+
+        Args:
+            mode: The new timer mode.
+            deadline: ``time.monotonic()`` deadline for timed modes.
+        """
+        state = self._state
+        state.mode = mode
+        state.deadline = deadline
+        state.paused_remaining = None
+
     def _start_timer(self, seconds: int) -> None:
         """Start the background timer task.
 
@@ -217,7 +239,7 @@ class SleepTimer:
 
         async def timer_task() -> None:
             await asyncio.sleep(seconds)
-            self._state = SleepTimerState(mode=SleepTimerMode.OFF)
+            self._set_state(SleepTimerMode.OFF)
             if self._on_expire:
                 self._on_expire()
 
@@ -228,5 +250,6 @@ class SleepTimer:
     def _cancel_timer(self) -> None:
         """Cancel the background timer task."""
         if self._timer_task is not None:
-            self._timer_task.cancel()
+            if not self._timer_task.done():
+                self._timer_task.cancel()
             self._timer_task = None
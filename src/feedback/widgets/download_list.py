@@ -8,13 +8,27 @@ from textual.message import Message
 from textual.widgets import OptionList
 from textual.widgets.option_list import Option
 
+from feedback.downloads import DownloadStatus
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from feedback.downloads import DownloadItem
 
+# Status markers for every state except DOWNLOADING, which shows a percentage
+_STATUS_ICONS: dict[DownloadStatus, str] = {
+    DownloadStatus.PENDING: "[pending]",
+    DownloadStatus.COMPLETED: "[done]",
+    DownloadStatus.FAILED: "[failed]",
+    DownloadStatus.CANCELLED: "[cancelled]",
+}
+
 
 class DownloadSelected(Message):
     """Message sent when a download is selected."""
 
+    __slots__ = ("download",)
+
     bubble = True  # Ensure message bubbles up to screen
 
     def __init__(self, download: DownloadItem) -> None:
@@ -49,19 +63,80 @@ class DownloadList(OptionList):
     def __init__(self) -> None:
         """Initialize the download list."""
         super().__init__()
-        self._downloads: list[DownloadItem] = []
+        self._downloads: Sequence[DownloadItem] = []
+        # Rendered prompt per download URL, in display order
+        self._snapshot: dict[str, str] = {}
+        # Status and percentage each prompt in the snapshot was rendered from
+        self._render_state: dict[str, tuple[DownloadStatus, int]] = {}
 
-    def set_downloads(self, downloads: list[DownloadItem]) -> None:
+    def set_downloads(self, downloads: Sequence[DownloadItem]) -> None:
         """Set the downloads to display.
 
+        Downloads whose status and percentage are unchanged reuse their
+        previous prompt without reformatting. Only rows whose rendered text
+        changed are updated; the list is rebuilt from scratch when existing
+        rows were reordered or new downloads appear before them. The
+        highlighted download stays highlighted across updates.
+
         Args:
-            downloads: List of DownloadItem objects.
+            downloads: Sequence of DownloadItem objects.
         """
+        highlighted_url = self._highlighted_url()
         self._downloads = downloads
-        self.clear_options()
+        old = self._snapshot
+        old_state = self._render_state
+        snapshot: dict[str, str] = {}
+        render_state: dict[str, tuple[DownloadStatus, int]] = {}
         for download in downloads:
-            title = self._format_download(download)
-            self.add_option(Option(title, id=download.url))
+            url = download.url
+            state = (download.status, download.progress_percent)
+            render_state[url] = state
+            if old_state.get(url) == state:
+                snapshot[url] = old[url]
+            else:
+                snapshot[url] = self._format_download(download)
+        self._snapshot = snapshot
+        self._render_state = render_state
+
+        if list(snapshot.items()) == list(old.items()):
+            return
+
+        kept = [url for url in old if url in snapshot]
+        added = [url for url in snapshot if url not in old]
+        if list(snapshot) != kept + added:
+            self.clear_options()
+            self.add_options(Option(prompt, id=url) for url, prompt in snapshot.items())
+            self._restore_highlight(highlighted_url)
+            return
+
+        for url in old:
+            if url not in snapshot:
+                self.remove_option(url)
+
+        for url in kept:
+            if snapshot[url] != old[url]:
+                self.replace_option_prompt(url, snapshot[url])
+
+        self.add_options(Option(snapshot[url], id=url) for url in added)
+        self._restore_highlight(highlighted_url)
+
+    def _highlighted_url(self) -> str | None:
+        """Get the URL of the highlighted row, if any."""
+        if self.highlighted is None or self.highlighted >= self.option_count:
+            return None
+        return self.get_option_at_index(self.highlighted).id
+
+    def _restore_highlight(self, url: str | None) -> None:
+        """Move the highlight back to the row for ``url`` if it still exists.
+
+        Args:
+            url: URL of the previously highlighted download.
+        """
+        if url is None or url not in self._snapshot:
+            return
+        index = self.get_option_index(url)
+        if self.highlighted != index:
+            self.highlighted = index
 
     def _format_download(self, download: DownloadItem) -> str:
         """Format a download item for display.
@@ -72,17 +147,11 @@ class DownloadList(OptionList):
         Returns:
             Formatted display string.
         """
-        from feedback.downloads import DownloadStatus
-
         filename = download.destination.name
-        status_icons = {
-            DownloadStatus.PENDING: "[pending]",
-            DownloadStatus.DOWNLOADING: f"[{download.progress_percent}%]",
-            DownloadStatus.COMPLETED: "[done]",
-            DownloadStatus.FAILED: "[failed]",
-            DownloadStatus.CANCELLED: "[cancelled]",
-        }
-        status = status_icons.get(download.status, "")
+        if download.status is DownloadStatus.DOWNLOADING:
+            status = f"[{download.progress_percent}%]"
+        else:
+            status = _STATUS_ICONS.get(download.status, "")
         return f"{status} {filename}"
 
     def get_selected_download(self) -> DownloadItem | None:
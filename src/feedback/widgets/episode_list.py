@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
 from enum import Enum
-from typing import TYPE_CHECKING
+from itertools import compress
+from operator import attrgetter
+from typing import TYPE_CHECKING, ClassVar
 
 from textual.message import Message
 from textual.widgets import OptionList
-from textual.widgets.option_list import Option
+from textual.widgets.option_list import Option, OptionDoesNotExist
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from feedback.models import Episode
 
 
@@ -22,6 +27,35 @@ class EpisodeFilter(Enum):
     IN_PROGRESS = "in_progress"
 
 
+# Status bits kept per episode, so filtering needs no attribute access
+_PLAYED = 1
+_DOWNLOADED = 2
+_IN_PROGRESS = 4
+
+# Bits each filter checks and the value they must have; ALL keeps every episode
+_FILTER_MASKS: dict[EpisodeFilter, tuple[int, int]] = {
+    EpisodeFilter.UNPLAYED: (_PLAYED, 0),
+    EpisodeFilter.DOWNLOADED: (_DOWNLOADED, _DOWNLOADED),
+    EpisodeFilter.IN_PROGRESS: (_PLAYED | _IN_PROGRESS, _IN_PROGRESS),
+}
+
+# bytes.translate table mapping each status byte to 1 if it passes the filter
+_FILTER_TABLES: dict[EpisodeFilter, bytes] = {
+    filter_type: bytes((status & mask) == value for status in range(256))
+    for filter_type, (mask, value) in _FILTER_MASKS.items()
+}
+
+
+def _episode_status(episode: Episode) -> int:
+    """Get the status bits for an episode."""
+    status = _PLAYED if episode.played else 0
+    if episode.downloaded_path:
+        status |= _DOWNLOADED
+    if episode.progress_ms > 0:
+        status |= _IN_PROGRESS
+    return status
+
+
 class EpisodeSort(Enum):
     """Sort options for episode list."""
 
@@ -30,9 +64,53 @@ class EpisodeSort(Enum):
     TITLE = "title"
 
 
+def _is_undated(episode: Episode) -> bool:
+    """Check whether an episode has no publication date."""
+    return episode.pubdate is None
+
+
+def _newest_first_key(episode: Episode) -> float:
+    """Get an ascending sort key for newest-first order of a dated episode."""
+    return -episode.pubdate.timestamp()  # type: ignore[union-attr]
+
+
+def _insort_episode(
+    episodes: list[Episode], episode: Episode, sort: EpisodeSort
+) -> None:
+    """Insert an episode into a list already in the given sort order.
+
+    The episode lands after any equal ones, where a stable sort of the list
+    with the episode appended would put it.
+
+    Args:
+        episodes: Episodes in ``sort`` order, modified in place.
+        episode: The episode to insert.
+        sort: The order ``episodes`` is in.
+    """
+    if sort == EpisodeSort.TITLE:
+        insort(episodes, episode, key=attrgetter("title_sortkey"))
+        return
+
+    # Undated episodes are kept last, in the order they were added
+    if episode.pubdate is None:
+        episodes.append(episode)
+        return
+
+    dated = bisect_left(episodes, True, key=_is_undated)
+    if sort == EpisodeSort.DATE_OLDEST:
+        insort(episodes, episode, hi=dated, key=attrgetter("pubdate"))
+    else:
+        index = bisect_right(
+            episodes, _newest_first_key(episode), hi=dated, key=_newest_first_key
+        )
+        episodes.insert(index, episode)
+
+
 class EpisodeSelected(Message):
     """Message sent when an episode is selected."""
 
+    __slots__ = ("episode",)
+
     bubble = True  # Ensure message bubbles up to screen
 
     def __init__(self, episode: Episode) -> None:
@@ -48,6 +126,8 @@ class EpisodeSelected(Message):
 class EpisodeFilterChanged(Message):
     """Message sent when filter/sort changes."""
 
+    __slots__ = ("filter_type", "sort_type")
+
     bubble = True
 
     def __init__(self, filter_type: EpisodeFilter, sort_type: EpisodeSort) -> None:
@@ -85,13 +165,32 @@ class EpisodeList(OptionList):
     }
     """
 
+    # Each removal renumbers every later row, so past this a rebuild is cheaper
+    MAX_INCREMENTAL_REMOVALS = 8
+
+    FILTERS: ClassVar[list[EpisodeFilter]] = list(EpisodeFilter)
+    SORTS: ClassVar[list[EpisodeSort]] = list(EpisodeSort)
+    # Filter and sort that follow each one when cycling, wrapping to the first
+    _NEXT_FILTER: ClassVar[dict[EpisodeFilter, EpisodeFilter]] = dict(
+        zip(FILTERS, FILTERS[1:] + FILTERS[:1], strict=True)
+    )
+    _NEXT_SORT: ClassVar[dict[EpisodeSort, EpisodeSort]] = dict(
+        zip(SORTS, SORTS[1:] + SORTS[:1], strict=True)
+    )
+
     def __init__(self) -> None:
         """Initialize the episode list."""
         super().__init__()
         self._all_episodes: list[Episode] = []
+        # Status bits for each of _all_episodes, in the same order
+        self._status = bytearray()
         self._filtered_episodes: list[Episode] = []
         self._filter: EpisodeFilter = EpisodeFilter.ALL
         self._sort: EpisodeSort = EpisodeSort.DATE_NEWEST
+        # Rendered prompt per episode ID, in display order
+        self._snapshot: dict[str, str] = {}
+        # Filtered and sorted episodes per (filter, sort), for _all_episodes
+        self._results: dict[tuple[EpisodeFilter, EpisodeSort], list[Episode]] = {}
 
     @property
     def filter_type(self) -> EpisodeFilter:
@@ -116,10 +215,41 @@ class EpisodeList(OptionList):
     def set_episodes(self, episodes: list[Episode]) -> None:
         """Set the list of episodes to display.
 
+        Passing the list that is already displayed does nothing; use
+        ``refresh_episode`` to redraw episodes changed in place.
+
         Args:
             episodes: List of Episode objects.
         """
+        if episodes is self._all_episodes:
+            return
         self._all_episodes = episodes
+        self._status = bytearray(map(_episode_status, episodes))
+        self._results.clear()
+        self._apply_filter_and_sort()
+
+    def add_episodes(self, episodes: list[Episode]) -> None:
+        """Add episodes to the ones already displayed.
+
+        The new episodes are inserted into the cached filtered and sorted
+        results by binary search instead of sorting every episode again, so
+        use this rather than ``set_episodes`` when episodes arrive in batches.
+
+        Args:
+            episodes: Episodes not already in the list.
+        """
+        if not episodes:
+            return
+        # Copy so the caller's list, which set_episodes may have been given,
+        # is left unchanged
+        self._all_episodes = [*self._all_episodes, *episodes]
+        status = bytearray(map(_episode_status, episodes))
+        self._status += status
+        for (filter_type, sort_type), results in self._results.items():
+            table = _FILTER_TABLES.get(filter_type)
+            for episode, episode_status in zip(episodes, status, strict=True):
+                if table is None or table[episode_status]:
+                    _insort_episode(results, episode, sort_type)
         self._apply_filter_and_sort()
 
     def set_filter(self, filter_type: EpisodeFilter) -> None:
@@ -150,10 +280,7 @@ class EpisodeList(OptionList):
         Returns:
             The new filter type.
         """
-        filters = list(EpisodeFilter)
-        current_idx = filters.index(self._filter)
-        next_idx = (current_idx + 1) % len(filters)
-        self.set_filter(filters[next_idx])
+        self.set_filter(self._NEXT_FILTER[self._filter])
         return self._filter
 
     def cycle_sort(self) -> EpisodeSort:
@@ -162,69 +289,156 @@ class EpisodeList(OptionList):
         Returns:
             The new sort type.
         """
-        sorts = list(EpisodeSort)
-        current_idx = sorts.index(self._sort)
-        next_idx = (current_idx + 1) % len(sorts)
-        self.set_sort(sorts[next_idx])
+        self.set_sort(self._NEXT_SORT[self._sort])
         return self._sort
 
     def _apply_filter_and_sort(self) -> None:
-        """Apply current filter and sort, then update display."""
-        # Apply filter
-        if self._filter == EpisodeFilter.ALL:
-            filtered = self._all_episodes
-        elif self._filter == EpisodeFilter.UNPLAYED:
-            filtered = [ep for ep in self._all_episodes if not ep.played]
-        elif self._filter == EpisodeFilter.DOWNLOADED:
-            filtered = [ep for ep in self._all_episodes if ep.downloaded_path]
-        elif self._filter == EpisodeFilter.IN_PROGRESS:
-            filtered = [
-                ep for ep in self._all_episodes if ep.progress_ms > 0 and not ep.played
-            ]
-        else:
-            filtered = self._all_episodes
-
-        # Apply sort
-        if self._sort == EpisodeSort.DATE_NEWEST:
-            # Sort by pubdate descending (newest first), None dates at end
-            filtered = sorted(
-                filtered,
-                key=lambda ep: (ep.pubdate is None, ep.pubdate),
-                reverse=True,
-            )
-        elif self._sort == EpisodeSort.DATE_OLDEST:
-            # Sort by pubdate ascending (oldest first), None dates at end
-            filtered = sorted(
-                filtered,
-                key=lambda ep: (ep.pubdate is None, ep.pubdate or ""),
-            )
-        elif self._sort == EpisodeSort.TITLE:
-            filtered = sorted(filtered, key=lambda ep: ep.title.lower())
+        """Apply current filter and sort, then update display.
+
+        Results are kept per filter and sort combination, so cycling back to
+        a previous view reuses its list instead of filtering and sorting again.
+        """
+        key = (self._filter, self._sort)
+        filtered = self._results.get(key)
+        if filtered is None:
+            filtered = self._filter_and_sort()
+            self._results[key] = filtered
 
         self._filtered_episodes = filtered
         self._update_display()
 
+    def _filter_and_sort(self) -> list[Episode]:
+        """Filter and sort all episodes with the current settings.
+
+        Returns:
+            A new list of the matching episodes in display order.
+        """
+        # Select matching episodes from their status bytes in C, lazily so
+        # no intermediate list is built before sorting
+        table = _FILTER_TABLES.get(self._filter)
+        episodes: Iterable[Episode] = (
+            self._all_episodes
+            if table is None
+            else compress(self._all_episodes, self._status.translate(table))
+        )
+
+        if self._sort == EpisodeSort.TITLE:
+            return sorted(episodes, key=attrgetter("title_sortkey"))
+
+        # Sort dated episodes with a C-level key, then put undated ones last
+        dated: list[Episode] = []
+        undated: list[Episode] = []
+        for episode in episodes:
+            (undated if episode.pubdate is None else dated).append(episode)
+        dated.sort(
+            key=attrgetter("pubdate"),
+            reverse=self._sort == EpisodeSort.DATE_NEWEST,
+        )
+        dated.extend(undated)
+        return dated
+
+    def _matches_filter(self, episode: Episode) -> bool:
+        """Check whether an episode passes the current filter.
+
+        Args:
+            episode: The episode to check.
+
+        Returns:
+            True if the episode should be shown.
+        """
+        table = _FILTER_TABLES.get(self._filter)
+        return table is None or bool(table[_episode_status(episode)])
+
     def _update_display(self) -> None:
-        """Update the option list display."""
-        self.clear_options()
-        for episode in self._filtered_episodes:
-            # Format the display title with status indicators
-            parts = []
-
-            if episode.played:
-                parts.append("[played]")
-            elif episode.progress_ms > 0:
-                parts.append("[▶]")  # In progress indicator
-
-            if episode.downloaded_path:
-                parts.append("[↓]")  # Downloaded indicator
-
-            prefix = " ".join(parts)
-            if prefix:
-                prefix += " "
-
-            title = f"{prefix}{episode.title}"
-            self.add_option(Option(title, id=str(episode.id)))
+        """Update the option list display.
+
+        Rows whose text changed are rewritten in place, dropped rows are
+        removed and new rows are appended. The list is rebuilt from scratch
+        when rows were reordered, when new rows would land before existing
+        ones, or when more rows were dropped than is cheap to remove one by
+        one.
+        """
+        old = self._snapshot
+        snapshot = {
+            str(episode.id): self._format_title(episode)
+            for episode in self._filtered_episodes
+        }
+        self._snapshot = snapshot
+
+        if list(snapshot.items()) == list(old.items()):
+            return
+
+        kept = [key for key in old if key in snapshot]
+        added = [key for key in snapshot if key not in old]
+        removed = len(old) - len(kept)
+        if list(snapshot) != kept + added or removed > self.MAX_INCREMENTAL_REMOVALS:
+            self.clear_options()
+            self.add_options(Option(prompt, id=key) for key, prompt in snapshot.items())
+            return
+
+        for key in old:
+            if key not in snapshot:
+                self.remove_option(key)
+
+        for key in kept:
+            if snapshot[key] != old[key]:
+                self.replace_option_prompt(key, snapshot[key])
+
+        self.add_options(Option(snapshot[key], id=key) for key in added)
+
+    @staticmethod
+    def _format_title(episode: Episode) -> str:
+        """Format the display title with status indicators.
+
+        Args:
+            episode: The episode to format.
+
+        Returns:
+            The title prefixed with played/progress/download markers.
+        """
+        if episode.played:
+            status = "[played] "
+        elif episode.progress_ms > 0:
+            status = "[▶] "  # In progress indicator
+        else:
+            status = ""
+
+        # Downloaded indicator
+        downloaded = "[↓] " if episode.downloaded_path else ""
+
+        return f"{status}{downloaded}{episode.title}"
+
+    def refresh_episode(self, episode: Episode) -> None:
+        """Redraw one episode after its status changed.
+
+        Only the episode's own row is updated, unless the change moves it
+        in or out of the current filter, in which case the list is updated
+        to match the filter.
+
+        Args:
+            episode: The episode whose fields were updated in place.
+        """
+        # The change may move the episode in or out of other filters' results
+        self._results.clear()
+        for position, listed in enumerate(self._all_episodes):
+            if listed is episode:
+                self._status[position] = _episode_status(episode)
+                break
+
+        key = str(episode.id)
+        try:
+            index = self.get_option_index(key)
+        except OptionDoesNotExist:
+            index = None
+
+        if (index is not None) != self._matches_filter(episode):
+            self._apply_filter_and_sort()
+        else:
+            self._results[(self._filter, self._sort)] = self._filtered_episodes
+            if index is not None:
+                prompt = self._format_title(episode)
+                self._snapshot[key] = prompt
+                self.replace_option_prompt_at_index(index, prompt)
 
     def get_selected_episode(self) -> Episode | None:
         """Get the currently selected episode.
@@ -9,12 +9,16 @@ from textual.widgets import OptionList
 from textual.widgets.option_list import Option
 
 if TYPE_CHECKING:
+    from textual.timer import Timer
+
     from feedback.models import Feed
 
 
 class FeedSelected(Message):
     """Message sent when a feed is selected."""
 
+    __slots__ = ("feed",)
+
     bubble = True  # Ensure message bubbles up to screen
 
     def __init__(self, feed: Feed) -> None:
@@ -46,10 +50,14 @@ class FeedList(OptionList):
     }
     """
 
+    # Seconds the cursor must rest on a feed before it is selected
+    HIGHLIGHT_DELAY = 0.15
+
     def __init__(self) -> None:
         """Initialize the feed list."""
         super().__init__()
         self._feeds: list[Feed] = []
+        self._highlight_timer: Timer | None = None
 
     def set_feeds(self, feeds: list[Feed]) -> None:
         """Set the list of feeds to display.
@@ -59,8 +67,7 @@ class FeedList(OptionList):
         """
         self._feeds = feeds
         self.clear_options()
-        for feed in feeds:
-            self.add_option(Option(feed.title, id=feed.key))
+        self.add_options(Option(feed.title, id=feed.key) for feed in feeds)
 
     def get_selected_feed(self) -> Feed | None:
         """Get the currently selected feed.
@@ -76,6 +83,7 @@ class FeedList(OptionList):
 
     def on_option_list_option_selected(self, _event: OptionList.OptionSelected) -> None:
         """Handle option selection (Enter key or double-click)."""
+        self._cancel_highlight()
         feed = self.get_selected_feed()
         if feed:
             self.post_message(FeedSelected(feed))
@@ -83,7 +91,25 @@ class FeedList(OptionList):
     def on_option_list_option_highlighted(
         self, _event: OptionList.OptionHighlighted
     ) -> None:
-        """Handle option highlight change (cursor movement)."""
+        """Select the highlighted feed once the cursor rests on it.
+
+        Each selection loads the feed's episodes, so holding a movement key
+        would otherwise load every feed the cursor passes over.
+        """
+        self._cancel_highlight()
+        self._highlight_timer = self.set_timer(
+            self.HIGHLIGHT_DELAY, self._select_highlighted
+        )
+
+    def _cancel_highlight(self) -> None:
+        """Drop any pending selection of the highlighted feed."""
+        if self._highlight_timer is not None:
+            self._highlight_timer.stop()
+            self._highlight_timer = None
+
+    def _select_highlighted(self) -> None:
+        """Select the feed the cursor is on after HIGHLIGHT_DELAY."""
+        self._highlight_timer = None
         feed = self.get_selected_feed()
         if feed:
             self.post_message(FeedSelected(feed))
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import contextlib
 from typing import TYPE_CHECKING, ClassVar
 
 from textual.binding import Binding
@@ -60,6 +59,11 @@ class LoadingOverlay(ModalScreen[None]):
     }
     """
 
+    # Composed text widgets, kept so updates skip a DOM query; None until composed
+    _title_static: Static | None = None
+    _message_static: Static | None = None
+    _progress_static: Static | None = None
+
     def __init__(
         self,
         title: str = "Loading...",
@@ -79,6 +83,8 @@ class LoadingOverlay(ModalScreen[None]):
         self._message = message
         self._cancellable = cancellable
         self._progress_text = ""
+        # Item number shown in the progress text, if any
+        self._progress_current: int | None = None
         self._cancelled = False
 
     @property
@@ -88,10 +94,19 @@ class LoadingOverlay(ModalScreen[None]):
 
     def compose(self) -> ComposeResult:
         """Compose the loading overlay."""
+        self._title_static = Static(
+            self._title, classes="loading-title", id="loading-title"
+        )
+        self._message_static = Static(
+            self._message, classes="loading-message", id="loading-message"
+        )
+        self._progress_static = Static(
+            self._progress_text, classes="loading-progress", id="loading-progress"
+        )
         with Middle(), Center():
-            yield Static(self._title, classes="loading-title", id="loading-title")
-            yield Static(self._message, classes="loading-message", id="loading-message")
-            yield Static(self._progress_text, classes="loading-progress", id="loading-progress")
+            yield self._title_static
+            yield self._message_static
+            yield self._progress_static
 
     def update_title(self, title: str) -> None:
         """Update the title text.
@@ -100,8 +115,8 @@ class LoadingOverlay(ModalScreen[None]):
             title: New title text.
         """
         self._title = title
-        with contextlib.suppress(Exception):
-            self.query_one("#loading-title", Static).update(title)
+        if self._title_static is not None:
+            self._title_static.update(title)
 
     def update_message(self, message: str) -> None:
         """Update the message text.
@@ -110,23 +125,36 @@ class LoadingOverlay(ModalScreen[None]):
             message: New message text.
         """
         self._message = message
-        with contextlib.suppress(Exception):
-            self.query_one("#loading-message", Static).update(message)
+        if self._message_static is not None:
+            self._message_static.update(message)
 
     def update_progress(self, current: int, total: int, label: str = "") -> None:
         """Update progress display.
 
+        Callers report every item, so the text is only redrawn after at least
+        a hundredth of the total has passed since the last redraw, and always
+        for the last item.
+
         Args:
             current: Current item number (1-indexed).
             total: Total number of items.
             label: Optional label for current item.
         """
+        last = self._progress_current
+        if (
+            last is not None
+            and current != total
+            and 0 <= current - last < max(1, total // 100)
+        ):
+            return
+        self._progress_current = current
+
         if label:
             self._progress_text = f"{current}/{total}: {label}"
         else:
             self._progress_text = f"{current}/{total}"
-        with contextlib.suppress(Exception):
-            self.query_one("#loading-progress", Static).update(self._progress_text)
+        if self._progress_static is not None:
+            self._progress_static.update(self._progress_text)
 
     def action_cancel(self) -> None:
         """Handle cancel action."""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import contextlib
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from textual.containers import Horizontal
@@ -13,6 +13,18 @@ if TYPE_CHECKING:
     from textual.app import ComposeResult
 
 
+# Two entries: one for the position, which moves, and one for the duration,
+# which is formatted again with every position but rarely changes
+@lru_cache(maxsize=2)
+def _seconds_to_time(seconds: int) -> str:
+    """Format whole seconds as HH:MM:SS, or MM:SS under an hour."""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours > 0:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
 class PlayerBar(Static):
     """Playback status bar with progress indicator."""
 
@@ -64,23 +76,42 @@ class PlayerBar(Static):
     duration_ms: reactive[int] = reactive(0)
     volume: reactive[int] = reactive(100)
 
+    # Child widgets, assigned in compose. Class-level defaults cover watchers
+    # that fire before compose has run.
+    _title_label: Label | None = None
+    _status_label: Label | None = None
+    _time_label: Label | None = None
+    _progress_bar: ProgressBar | None = None
+
+    # Last (position, duration) in whole seconds shown by the time label, and
+    # last progress shown by the bar in tenths of a percent
+    _time_seconds: tuple[int, int] | None = None
+    _progress_step: int | None = None
+
     def compose(self) -> ComposeResult:
         """Compose the player bar layout."""
         with Horizontal():
-            yield Label(self.title, id="player-title")
-            yield Label(self.status, id="player-status")
-            yield Label(self._format_time(), id="player-time")
-        yield ProgressBar(total=100, show_eta=False, show_percentage=False)
+            self._title_label = Label(self.title, id="player-title")
+            yield self._title_label
+            self._status_label = Label(self.status, id="player-status")
+            yield self._status_label
+            self._time_seconds = (self.position_ms // 1000, self.duration_ms // 1000)
+            self._time_label = Label(self._format_time(), id="player-time")
+            yield self._time_label
+        self._progress_bar = ProgressBar(
+            total=100, show_eta=False, show_percentage=False
+        )
+        yield self._progress_bar
 
     def watch_title(self, title: str) -> None:
         """Update the title label when title changes."""
-        with contextlib.suppress(Exception):
-            self.query_one("#player-title", Label).update(title)
+        if self._title_label is not None:
+            self._title_label.update(title)
 
     def watch_status(self, status: str) -> None:
         """Update the status label when status changes."""
-        with contextlib.suppress(Exception):
-            self.query_one("#player-status", Label).update(status)
+        if self._status_label is not None:
+            self._status_label.update(status)
 
     def watch_position_ms(self, _position: int) -> None:
         """Update progress when position changes."""
@@ -93,21 +124,35 @@ class PlayerBar(Static):
         self._update_time()
 
     def _update_progress(self) -> None:
-        """Update the progress bar."""
-        try:
-            progress_bar = self.query_one(ProgressBar)
-            if self.duration_ms > 0:
-                progress = (self.position_ms / self.duration_ms) * 100
-                progress_bar.update(progress=progress)
-            else:
-                progress_bar.update(progress=0)
-        except Exception:
-            pass
+        """Update the progress bar.
+
+        Progress is rounded to tenths of a percent, finer than the bar can
+        draw at any terminal width, and the bar is only updated when that
+        value changes rather than on every player tick.
+        """
+        if self._progress_bar is None:
+            return
+        duration = self.duration_ms
+        step = self.position_ms * 1000 // duration if duration > 0 else 0
+        if step == self._progress_step:
+            return
+        self._progress_step = step
+        self._progress_bar.update(progress=step / 10)
 
     def _update_time(self) -> None:
-        """Update the time label."""
-        with contextlib.suppress(Exception):
-            self.query_one("#player-time", Label).update(self._format_time())
+        """Update the time label.
+
+        Position changes on every player tick but the label only shows whole
+        seconds, and each label update costs a layout pass, so it is skipped
+        until the position or duration crosses a second boundary.
+        """
+        if self._time_label is None:
+            return
+        seconds = (self.position_ms // 1000, self.duration_ms // 1000)
+        if seconds == self._time_seconds:
+            return
+        self._time_seconds = seconds
+        self._time_label.update(self._format_time())
 
     def _format_time(self) -> str:
         """Format position/duration as time string."""
@@ -125,12 +170,7 @@ class PlayerBar(Static):
         Returns:
             Formatted time string.
         """
-        seconds = max(0, ms // 1000)
-        hours, remainder = divmod(seconds, 3600)
-        minutes, secs = divmod(remainder, 60)
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        return f"{minutes:02d}:{secs:02d}"
+        return _seconds_to_time(max(0, ms // 1000))
 
     def set_playing(
         self,
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class QueueItemSelected(Message):
     """Message sent when a queue item is selected."""
 
+    __slots__ = ("episode", "queue_item")
+
     bubble = True  # Ensure message bubbles up to screen
 
     def __init__(self, queue_item: QueueItem, episode: Episode) -> None:
@@ -59,11 +61,52 @@ class QueueList(OptionList):
         Args:
             items: List of (QueueItem, Episode) tuples.
         """
-        self._items = items
+        # Keep our own copy so swap() doesn't reorder the caller's list
+        self._items = list(items)
         self.clear_options()
-        for i, (queue_item, episode) in enumerate(items, 1):
-            title = f"{i}. {episode.title}"
-            self.add_option(Option(title, id=str(queue_item.episode_id)))
+        self.add_options(
+            Option(self._format_prompt(i, episode))
+            for i, (_, episode) in enumerate(self._items)
+        )
+
+    def swap(self, i: int, j: int) -> None:
+        """Swap two queue entries, re-rendering only their rows.
+
+        Args:
+            i: Index of the first entry.
+            j: Index of the second entry.
+        """
+        items = self._items
+        items[i], items[j] = items[j], items[i]
+        for index in (i, j):
+            self.replace_option_prompt_at_index(
+                index, self._format_prompt(index, items[index][1])
+            )
+
+    def remove_at(self, index: int) -> None:
+        """Remove a queue entry, renumbering only the rows after it.
+
+        Args:
+            index: Index of the entry to remove.
+        """
+        items = self._items
+        del items[index]
+        self.remove_option_at_index(index)
+        for i in range(index, len(items)):
+            self.replace_option_prompt_at_index(i, self._format_prompt(i, items[i][1]))
+
+    @staticmethod
+    def _format_prompt(index: int, episode: Episode) -> str:
+        """Format the row for a queue entry.
+
+        Args:
+            index: Zero-based position in the queue.
+            episode: The queued episode.
+
+        Returns:
+            The numbered episode title.
+        """
+        return f"{index + 1}. {episode.title}"
 
     def get_selected_item(self) -> tuple[QueueItem, Episode] | None:
         """Get the currently selected queue item.
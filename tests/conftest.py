@@ -11,6 +11,15 @@ import pytest_asyncio
 from feedback.config import Config
 from feedback.database import Database
 
+# Empties every table and resets AUTOINCREMENT ids between tests
+CLEAR_DATABASE = """
+DELETE FROM queue;
+DELETE FROM playback_history;
+DELETE FROM episode;
+DELETE FROM feed;
+DELETE FROM sqlite_sequence;
+"""
+
 
 @pytest.fixture(scope="session")
 def event_loop_policy():
@@ -31,10 +40,12 @@ def temp_db_path(temp_dir: Path) -> Path:
     return temp_dir / "test.db"
 
 
-@pytest_asyncio.fixture
-async def database(temp_db_path: Path) -> AsyncIterator[Database]:
-    """Create a connected test database."""
-    db = Database(temp_db_path)
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_database(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> AsyncIterator[Database]:
+    """Database connected once for the whole session."""
+    db = Database(tmp_path_factory.mktemp("database") / "test.db")
     await db.connect()
     try:
         yield db
@@ -42,6 +53,18 @@ async def database(temp_db_path: Path) -> AsyncIterator[Database]:
         await db.close()
 
 
+@pytest_asyncio.fixture
+async def database(session_database: Database) -> AsyncIterator[Database]:
+    """Provide the connected test database, reset after each test."""
+    try:
+        yield session_database
+    finally:
+        async with session_database.transaction() as conn:
+            await conn.executescript(CLEAR_DATABASE)
+        # Start each test from the version a fresh connection would report
+        session_database._history_version = 0
+
+
 @pytest.fixture
 def default_config() -> Config:
     """Create a default configuration."""
@@ -103,7 +126,7 @@ SAMPLE_RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rss_feed() -> str:
     """Sample RSS feed XML."""
     return SAMPLE_RSS_FEED
@@ -32,6 +32,22 @@ class TestDatabaseConnection:
         finally:
             await db.close()
 
+    @pytest.mark.asyncio
+    async def test_connect_applies_pragmas(self, database: Database):
+        """Test that connect enables WAL and the connection settings."""
+        assert database._conn is not None
+        for pragma, expected in [
+            ("journal_mode", "wal"),
+            ("synchronous", 1),
+            ("foreign_keys", 1),
+            ("temp_store", 2),
+            ("cache_size", -64000),
+        ]:
+            async with database._conn.execute(f"PRAGMA {pragma}") as cursor:
+                row = await cursor.fetchone()
+            assert row is not None
+            assert row[0] == expected, pragma
+
     @pytest.mark.asyncio
     async def test_close(self, temp_db_path: Path):
         """Test closing the database."""
@@ -163,6 +179,38 @@ class TestEpisodeOperations:
         assert result.id == episode_id
         assert result.title == "Ep1"
 
+    @pytest.mark.asyncio
+    async def test_get_episodes_by_ids(self, database: Database):
+        """Test getting several episodes by ID."""
+        await database.upsert_feed(Feed(key="feed1", title="Test"))
+        ids = [
+            await database.upsert_episode(
+                Episode(feed_key="feed1", title=f"Ep{i}", enclosure=f"url{i}")
+            )
+            for i in range(3)
+        ]
+
+        result = await database.get_episodes_by_ids([ids[2], ids[0], 9999])
+        assert sorted(e.id for e in result) == sorted([ids[0], ids[2]])
+        assert await database.get_episodes_by_ids([]) == []
+
+    @pytest.mark.asyncio
+    async def test_get_episodes_by_ids_chunks_queries(
+        self, database: Database, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that long ID lists are fetched over several queries."""
+        monkeypatch.setattr("feedback.database.MAX_QUERY_IDS", 2)
+        await database.upsert_feed(Feed(key="feed1", title="Test"))
+        ids = [
+            await database.upsert_episode(
+                Episode(feed_key="feed1", title=f"Ep{i}", enclosure=f"url{i}")
+            )
+            for i in range(5)
+        ]
+
+        result = await database.get_episodes_by_ids(ids)
+        assert sorted(e.id for e in result) == sorted(ids)
+
     @pytest.mark.asyncio
     async def test_get_unplayed_episodes(self, database: Database):
         """Test getting unplayed episodes."""
@@ -197,6 +245,27 @@ class TestEpisodeOperations:
         result = await database.get_episodes("feed1")
         assert len(result) == 5
 
+    @pytest.mark.asyncio
+    async def test_upsert_episodes_bulk_mixed(self, database: Database):
+        """Test bulk upserting replaces existing episodes and inserts new ones."""
+        await database.upsert_feed(Feed(key="feed1", title="Test"))
+        ep_id = await database.upsert_episode(
+            Episode(feed_key="feed1", title="Old", enclosure="url0")
+        )
+        await database.upsert_episodes(
+            [
+                Episode(id=ep_id, feed_key="feed1", title="New", enclosure="url0"),
+                Episode(feed_key="feed1", title="Ep1", enclosure="url1"),
+                Episode(feed_key="feed1", title="Ep2", enclosure="url2"),
+            ]
+        )
+
+        result = await database.get_episodes("feed1")
+        assert sorted(ep.title for ep in result) == ["Ep1", "Ep2", "New"]
+        episode = await database.get_episode(ep_id)
+        assert episode is not None
+        assert episode.title == "New"
+
     @pytest.mark.asyncio
     async def test_update_progress(self, database: Database):
         """Test updating episode progress."""
@@ -707,6 +776,43 @@ class TestPlaybackHistory:
         history = await database.get_history()
         assert len(history) == 0
 
+    @pytest.mark.asyncio
+    async def test_history_version(self, database: Database):
+        """Test that history_version is bumped by history changes."""
+        assert database.history_version == 0
+        await database.upsert_feed(Feed(key="feed1", title="Test Feed"))
+        await database.upsert_episode(
+            Episode(
+                feed_key="feed1",
+                title="Test Episode",
+                enclosure="http://example.com/ep.mp3",
+            )
+        )
+        episodes = await database.get_episodes("feed1")
+        ep_id = episodes[0].id
+        assert ep_id is not None
+
+        version = database.history_version
+        await database.get_history()
+        assert database.history_version == version
+
+        await database.add_to_history(ep_id)
+        assert database.history_version > version
+
+        version = database.history_version
+        await database.clear_history()
+        assert database.history_version > version
+
+        await database.add_to_history(ep_id)
+        version = database.history_version
+        await database.delete_episode(ep_id)
+        assert database.history_version > version
+        assert await database.get_history() == []
+
+        version = database.history_version
+        await database.delete_feed("feed1")
+        assert database.history_version > version
+
     @pytest.mark.asyncio
     async def test_add_to_history_not_connected(self, temp_db_path: Path):
         """Test add_to_history raises when not connected."""
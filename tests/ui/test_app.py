@@ -60,6 +60,14 @@ class TestFeedbackApp:
         async with app.run_test() as pilot:
             await pilot.press("?")
 
+    async def test_discovery_client_is_reused(self, app: FeedbackApp) -> None:
+        """Test that the Podcast Index client is created once and closed on exit."""
+        async with app.run_test():
+            client = app.discovery_client
+            assert app.discovery_client is client
+            http_client = client._get_client()
+        assert http_client.is_closed
+
     async def test_quit_binding(self, app: FeedbackApp) -> None:
         """Test that q quits the app."""
         async with app.run_test() as pilot:
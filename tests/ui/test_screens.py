@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import tomllib
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
 import pytest
 
 from feedback.app import FeedbackApp
+from feedback.config import Config
+from feedback.models.feed import Episode, Feed, HistoryItem, QueueItem
 from feedback.screens.downloads import DownloadsScreen
+from feedback.screens.history import HistoryList
 from feedback.screens.primary import MetadataPanel, PrimaryScreen
 from feedback.screens.queue import QueueScreen
+from feedback.screens.settings import SettingsScreen
 from feedback.widgets.download_list import DownloadList
-from feedback.widgets.episode_list import EpisodeList
+from feedback.widgets.episode_list import EpisodeFilter, EpisodeList
 from feedback.widgets.feed_list import FeedList
 from feedback.widgets.queue_list import QueueList
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class TestPrimaryScreen:
     """Tests for PrimaryScreen."""
@@ -79,6 +91,194 @@ class TestPrimaryScreen:
         async with app.run_test() as pilot:
             await pilot.press("p")
 
+    async def test_volume_at_limit_skips_player(self, app: FeedbackApp) -> None:
+        """Test volume up at 100% doesn't call the player backend."""
+        async with app.run_test() as pilot:
+            screen = pilot.app.screen
+            assert isinstance(screen, PrimaryScreen)
+            assert app.player.volume == 100
+            player_cls = type(app.player)
+            with patch.object(player_cls, "set_volume", AsyncMock()) as set_volume:
+                await screen.action_volume_up()
+                set_volume.assert_not_awaited()
+
+                await screen.action_volume_down()
+                set_volume.assert_awaited_once_with(90)
+
+    async def test_speed_actions_change_rate(self, app: FeedbackApp) -> None:
+        """Test speed actions step the rate and stop at the limits."""
+        async with app.run_test() as pilot:
+            screen = pilot.app.screen
+            assert isinstance(screen, PrimaryScreen)
+            for _ in range(12):
+                await screen.action_speed_up()
+            assert app.player.rate == 2.0
+
+            with patch.object(type(app.player), "set_rate", AsyncMock()) as set_rate:
+                await screen.action_speed_up()
+                set_rate.assert_not_awaited()
+
+            await screen.action_speed_down()
+            assert app.player.rate == 1.9
+
+    async def test_mark_played_writes_in_background(self, app: FeedbackApp) -> None:
+        """Test marking played updates the row and saves through a worker."""
+        async with app.run_test() as pilot:
+            screen = pilot.app.screen
+            assert isinstance(screen, PrimaryScreen)
+            episode = Episode(id=1, feed_key="feed", title="Ep", enclosure="url")
+            screen._episode_list.set_episodes([episode])
+            screen._episode_list.highlighted = 0
+
+            with patch.object(app.database, "mark_played", AsyncMock()) as mark_played:
+                screen.action_mark_played()
+                assert episode.played
+                await screen.workers.wait_for_complete()
+                mark_played.assert_awaited_once_with(1, played=True)
+
+    async def test_mark_unplayed_clears_progress(self, app: FeedbackApp) -> None:
+        """Test marking unplayed resets progress like the database write does."""
+        async with app.run_test() as pilot:
+            screen = pilot.app.screen
+            assert isinstance(screen, PrimaryScreen)
+            episode = Episode(
+                id=1,
+                feed_key="feed",
+                title="Ep",
+                enclosure="url",
+                played=True,
+                progress_ms=5000,
+            )
+            screen._episode_list.set_episodes([episode])
+            screen._episode_list.highlighted = 0
+
+            with patch.object(app.database, "mark_played", AsyncMock()):
+                screen.action_mark_unplayed()
+                await screen.workers.wait_for_complete()
+
+            assert episode.progress_ms == 0
+            assert str(screen._episode_list.get_option("1").prompt) == "Ep"
+            screen._episode_list.set_filter(EpisodeFilter.IN_PROGRESS)
+            assert screen._episode_list.filtered_count == 0
+
+    async def test_mark_all_played_updates_cache(self, app: FeedbackApp) -> None:
+        """Test marking a feed played reuses the cached episodes."""
+        async with app.run_test() as pilot:
+            screen = pilot.app.screen
+            assert isinstance(screen, PrimaryScreen)
+            episode = Episode(
+                id=1, feed_key="feed", title="Ep", enclosure="url", progress_ms=500
+            )
+            feed = Feed(key="feed", title="Feed")
+            with (
+                patch.object(
+                    app.database, "get_episodes", AsyncMock(return_value=[episode])
+                ) as get_episodes,
+                patch.object(
+                    app.database, "mark_all_played", AsyncMock(return_value=1)
+                ),
+                patch.object(screen._feed_list, "get_selected_feed", return_value=feed),
+            ):
+                await screen._load_episodes("feed")
+                await screen.action_mark_all_played()
+
+                get_episodes.assert_awaited_once()
+            assert episode.played
+            assert episode.progress_ms == 0
+            prompt = str(screen._episode_list.get_option("1").prompt)
+            assert prompt == "[played] Ep"
+
+    async def test_tick_mark_played_updates_episode_list(
+        self, app: FeedbackApp
+    ) -> None:
+        """Test that finishing an episode drops it from the unplayed filter."""
+        async with app.run_test() as pilot:
+            screen = pilot.app.screen
+            assert isinstance(screen, PrimaryScreen)
+            screen._player_timer.stop()
+            episode = Episode(id=1, feed_key="feed", title="Ep", enclosure="url")
+            screen._episode_list.set_episodes([episode])
+            screen._episode_list.set_filter(EpisodeFilter.UNPLAYED)
+            screen._episode_list.set_filter(EpisodeFilter.ALL)
+            app._current_episode = episode
+            await app.player.play("url", start_ms=59000)
+
+            with (
+                patch.object(
+                    type(app.player),
+                    "duration_ms",
+                    new_callable=PropertyMock,
+                    return_value=60000,
+                ),
+                patch.object(app.database, "mark_played", AsyncMock()),
+            ):
+                await screen._update_player_bar()
+
+            assert episode.played
+            prompt = str(screen._episode_list.get_option("1").prompt)
+            assert prompt == "[played] Ep"
+            screen._episode_list.set_filter(EpisodeFilter.UNPLAYED)
+            assert screen._episode_list.filtered_count == 0
+
+    async def test_idle_ticks_skip_work(self, app: FeedbackApp) -> None:
+        """Test that only the first tick after stopping does any work."""
+        async with app.run_test() as pilot:
+            screen = pilot.app.screen
+            assert isinstance(screen, PrimaryScreen)
+            screen._player_timer.stop()
+            screen._last_state = "PLAYING"
+            with patch.object(screen, "_save_progress", AsyncMock()) as save:
+                await screen._update_player_bar()
+                await screen._update_player_bar()
+                save.assert_awaited_once()
+
+    async def test_save_progress_after_episode_switch(self, app: FeedbackApp) -> None:
+        """Test progress is saved when the episode changes at a similar position."""
+        async with app.run_test() as pilot:
+            screen = pilot.app.screen
+            assert isinstance(screen, PrimaryScreen)
+            screen._player_timer.stop()
+            episode = Episode(id=2, feed_key="feed", title="Ep", enclosure="url")
+            screen._last_saved = (1, 3000)
+            app._current_episode = episode
+            await app.player.play("url", start_ms=4000)
+
+            with patch.object(app.database, "update_progress", AsyncMock()) as update:
+                await screen._save_progress()
+                update.assert_awaited_once_with(2, 4000)
+
+                await screen._save_progress()
+                update.assert_awaited_once()
+
+    async def test_load_episodes_uses_cache(self, app: FeedbackApp) -> None:
+        """Test that revisiting a feed reuses its cached episodes."""
+        async with app.run_test() as pilot:
+            screen = pilot.app.screen
+            assert isinstance(screen, PrimaryScreen)
+            with patch.object(
+                app.database, "get_episodes", AsyncMock(return_value=[])
+            ) as get_episodes:
+                await screen._load_episodes("feed-a")
+                await screen._load_episodes("feed-b")
+                await screen._load_episodes("feed-a")
+                assert get_episodes.await_count == 2
+
+                screen._invalidate_episodes("feed-a")
+                await screen._load_episodes("feed-a")
+                assert get_episodes.await_count == 3
+
+    async def test_episode_cache_evicts_oldest(self, app: FeedbackApp) -> None:
+        """Test that the episode cache is capped at EPISODE_CACHE_SIZE feeds."""
+        async with app.run_test() as pilot:
+            screen = pilot.app.screen
+            assert isinstance(screen, PrimaryScreen)
+            with patch.object(app.database, "get_episodes", AsyncMock(return_value=[])):
+                for i in range(screen.EPISODE_CACHE_SIZE + 1):
+                    await screen._load_episodes(f"feed-{i}")
+
+            assert len(screen._episode_cache) == screen.EPISODE_CACHE_SIZE
+            assert "feed-0" not in screen._episode_cache
+
 
 class TestQueueScreen:
     """Tests for QueueScreen."""
@@ -88,6 +288,29 @@ class TestQueueScreen:
         """Create a FeedbackApp instance."""
         return FeedbackApp()
 
+    async def test_queue_screen_play_pause_with_stale_bar(
+        self, app: FeedbackApp
+    ) -> None:
+        """Test play/pause notifies from the player state, not the screen's bar."""
+        async with app.run_test() as pilot:
+            await pilot.press("2")
+            screen = pilot.app.screen
+            assert isinstance(screen, QueueScreen)
+            await app.player.play("url")
+            await app.player.pause()
+            # Playback was paused elsewhere, so this screen's bar is out of date
+            screen._player_bar.status = "Playing"
+
+            with patch.object(screen, "notify") as notify:
+                await screen.action_play_pause()
+                notify.assert_called_once_with("Resumed playback")
+                assert screen._player_bar.status == "Playing"
+
+                screen._player_bar.status = "Paused"
+                await screen.action_play_pause()
+                notify.assert_called_with("Paused playback")
+                assert screen._player_bar.status == "Paused"
+
     async def test_queue_screen_has_queue_list(self, app: FeedbackApp) -> None:
         """Test that queue screen has a QueueList."""
         async with app.run_test() as pilot:
@@ -137,6 +360,35 @@ class TestQueueScreen:
             await pilot.press("2")
             await pilot.press("p")
 
+    async def test_reorders_are_saved_once(self, app: FeedbackApp) -> None:
+        """Test that consecutive reorders are coalesced into a single write."""
+        async with app.run_test() as pilot:
+            await pilot.press("2")
+            screen = pilot.app.screen
+            assert isinstance(screen, QueueScreen)
+            screen._queue_items = [
+                (
+                    QueueItem(position=i + 1, episode_id=i + 1),
+                    Episode(id=i + 1, feed_key="feed", title=f"Ep{i}", enclosure="url"),
+                )
+                for i in range(3)
+            ]
+            screen._queue_list.set_queue(screen._queue_items)
+            screen._queue_list.highlighted = 2
+
+            with patch.object(app.database, "save_queue", AsyncMock()) as save_queue:
+                screen.action_move_item_up()
+                screen.action_move_item_up()
+                save_queue.assert_not_awaited()
+
+                await screen._flush_save_queue()
+                save_queue.assert_awaited_once()
+                saved = save_queue.await_args.args[0]
+                assert [item.episode_id for item in saved] == [3, 1, 2]
+
+                await screen._flush_save_queue()
+                save_queue.assert_awaited_once()
+
 
 class TestDownloadsScreen:
     """Tests for DownloadsScreen."""
@@ -153,6 +405,38 @@ class TestDownloadsScreen:
             assert isinstance(pilot.app.screen, DownloadsScreen)
             assert pilot.app.screen.query_one(DownloadList)
 
+    async def test_downloads_screen_batches_list_updates(
+        self, app: FeedbackApp
+    ) -> None:
+        """Test that download list updates happen inside a batch update."""
+        async with app.run_test() as pilot:
+            await pilot.press("3")
+            screen = pilot.app.screen
+            assert isinstance(screen, DownloadsScreen)
+
+            screen._last_version = -1
+            with (
+                patch.object(app, "batch_update", wraps=app.batch_update) as batch,
+                patch.object(screen._download_list, "set_downloads") as set_downloads,
+            ):
+                await screen._refresh_display()
+            batch.assert_called_once()
+            set_downloads.assert_called_once()
+
+    async def test_downloads_screen_coalesces_progress(self, app: FeedbackApp) -> None:
+        """Test that a burst of progress updates schedules one redraw."""
+        async with app.run_test() as pilot:
+            await pilot.press("3")
+            screen = pilot.app.screen
+            assert isinstance(screen, DownloadsScreen)
+
+            with patch.object(screen, "_refresh_display", AsyncMock()) as refresh:
+                for _ in range(3):
+                    screen._on_progress(MagicMock())
+                await pilot.pause(screen.REFRESH_DELAY * 3)
+                refresh.assert_awaited_once()
+                assert screen._refresh_timer is None
+
     async def test_downloads_screen_j_key_moves_down(self, app: FeedbackApp) -> None:
         """Test that j key triggers move down action."""
         async with app.run_test() as pilot:
@@ -190,6 +474,122 @@ class TestDownloadsScreen:
             await pilot.press("p")
 
 
+class TestSettingsScreen:
+    """Tests for SettingsScreen."""
+
+    async def test_settings_save_reads_composed_inputs(self, tmp_path: Path) -> None:
+        """Test that saving reads the inputs kept from compose."""
+        app = FeedbackApp()
+        config_path = tmp_path / "config.toml"
+        async with app.run_test() as pilot:
+            screen = SettingsScreen()
+            with patch("feedback.screens.settings.get_config", return_value=Config()):
+                await app.push_screen(screen)
+            await pilot.pause()
+            assert len(screen._inputs) == 9
+            assert screen._backend_select.value == "vlc"
+            assert screen._inputs["player-volume"].value == str(
+                Config().player.default_volume
+            )
+            assert screen._inputs["discovery-api-key"].password
+            # The lazily mounted discovery section has replaced its placeholder
+            assert screen._inputs["discovery-api-key"].is_mounted
+            assert len(screen.query(".settings-section")) == 4
+
+            screen._inputs["player-volume"].value = "150"
+            screen._inputs["download-concurrent"].value = "4"
+            with patch(
+                "feedback.screens.settings.get_config_path", return_value=config_path
+            ):
+                await screen._save_settings()
+
+        assert [path.name for path in tmp_path.iterdir()] == ["config.toml"]
+        content = config_path.read_text()
+        assert "default_volume = 100" in content
+        assert "concurrent = 4" in content
+
+    async def test_settings_save_reports_every_invalid_field(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that one notification lists all invalid fields."""
+        app = FeedbackApp()
+        config_path = tmp_path / "config.toml"
+        async with app.run_test() as pilot:
+            screen = SettingsScreen()
+            with patch("feedback.screens.settings.get_config", return_value=Config()):
+                await app.push_screen(screen)
+            await pilot.pause()
+
+            screen._inputs["player-volume"].value = "loud"
+            screen._inputs["network-timeout"].value = ""
+            with (
+                patch(
+                    "feedback.screens.settings.get_config_path",
+                    return_value=config_path,
+                ),
+                patch.object(app, "notify") as notify,
+            ):
+                await screen._save_settings()
+
+        message = notify.call_args.args[0]
+        assert "Default Volume must be a whole number" in message
+        assert "Timeout (s) must be a number" in message
+        assert not config_path.exists()
+
+    async def test_settings_save_failure_removes_temp_file(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that a failed save reports the error and cleans up."""
+        app = FeedbackApp()
+        # A directory can't be replaced by a file, so the swap fails
+        config_path = tmp_path / "config.toml"
+        config_path.mkdir()
+        async with app.run_test() as pilot:
+            screen = SettingsScreen()
+            with patch("feedback.screens.settings.get_config", return_value=Config()):
+                await app.push_screen(screen)
+            await pilot.pause()
+
+            with (
+                patch(
+                    "feedback.screens.settings.get_config_path",
+                    return_value=config_path,
+                ),
+                patch.object(app, "notify") as notify,
+            ):
+                await screen._save_settings()
+
+        assert "Failed to save settings" in notify.call_args.args[0]
+        assert [path.name for path in tmp_path.iterdir()] == ["config.toml"]
+
+    def test_generate_toml_round_trips(self) -> None:
+        """Test that the generated config parses back to the saved values."""
+        content = SettingsScreen()._generate_toml(
+            backend="mpv",
+            volume=80,
+            speed=1.5,
+            seek_forward=30,
+            seek_backward=10,
+            timeout=20.0,
+            max_episodes=50,
+            concurrent=2,
+            api_key="key",
+            api_secret="secret",
+        )
+
+        data = tomllib.loads(content)
+        assert data["player"] == {
+            "backend": "mpv",
+            "default_volume": 80,
+            "default_speed": 1.5,
+            "seek_forward": 30,
+            "seek_backward": 10,
+        }
+        assert data["network"] == {"timeout": 20.0, "max_episodes": 50}
+        assert data["download"] == {"concurrent": 2}
+        assert data["discovery"] == {"api_key": "key", "api_secret": "secret"}
+
+
 class TestMetadataPanel:
     """Tests for MetadataPanel widget."""
 
@@ -197,3 +597,73 @@ class TestMetadataPanel:
         """Test MetadataPanel can be created."""
         panel = MetadataPanel()
         assert panel is not None
+
+
+class TestHistoryList:
+    """Tests for HistoryList widget."""
+
+    @pytest.fixture
+    def sample_history(self) -> list[tuple[HistoryItem, Episode]]:
+        """Create sample history entries for testing."""
+        played_at = datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+        return [
+            (
+                HistoryItem(
+                    id=i,
+                    episode_id=i,
+                    played_at=played_at,
+                    duration_listened_ms=i * 60000,
+                ),
+                Episode(
+                    id=i,
+                    feed_key="feed1",
+                    title=f"Episode {i}",
+                    enclosure=f"https://example.com/ep{i}.mp3",
+                ),
+            )
+            for i in range(3)
+        ]
+
+    def test_history_list_set_history(
+        self, sample_history: list[tuple[HistoryItem, Episode]]
+    ) -> None:
+        """Test that set_history renders one row per entry."""
+        history_list = HistoryList()
+        history_list.set_history(sample_history)
+
+        assert history_list.option_count == 3
+        first = str(history_list.get_option_at_index(0).prompt)
+        second = str(history_list.get_option_at_index(1).prompt)
+        assert "Episode 0" in first
+        assert "2024-01-15 10:30" in first
+        assert "listened" not in first
+        assert "(1m listened)" in second
+
+    def test_history_list_skips_unchanged_history(
+        self, sample_history: list[tuple[HistoryItem, Episode]]
+    ) -> None:
+        """Test that set_history skips the rebuild for identical history."""
+        history_list = HistoryList()
+        history_list.set_history(sample_history)
+        with patch.object(history_list, "clear_options") as clear_options:
+            history_list.set_history(list(sample_history))
+        clear_options.assert_not_called()
+
+        assert history_list.option_count == 3
+        history_list.set_history(sample_history[:1])
+        assert history_list.option_count == 1
+
+    def test_history_list_get_selected(
+        self, sample_history: list[tuple[HistoryItem, Episode]]
+    ) -> None:
+        """Test that selection getters read from the stored entries."""
+        history_list = HistoryList()
+        assert history_list.get_selected_item() is None
+
+        history_list.set_history(sample_history)
+        assert history_list.history_count == 3
+        with patch.object(
+            type(history_list), "highlighted", new_callable=PropertyMock, return_value=1
+        ):
+            assert history_list.get_selected_item() == sample_history[1]
+            assert history_list.get_selected_episode() == sample_history[1][1]
@@ -4,16 +4,22 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import PropertyMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
 from feedback.downloads import DownloadItem, DownloadStatus
 from feedback.models.feed import Episode, Feed, QueueItem
 from feedback.widgets.download_list import DownloadList, DownloadSelected
-from feedback.widgets.episode_list import EpisodeList, EpisodeSelected
+from feedback.widgets.episode_list import (
+    EpisodeFilter,
+    EpisodeList,
+    EpisodeSelected,
+    EpisodeSort,
+)
 from feedback.widgets.feed_list import FeedList, FeedSelected
-from feedback.widgets.player_bar import PlayerBar
+from feedback.widgets.loading_overlay import LoadingOverlay
+from feedback.widgets.player_bar import PlayerBar, _seconds_to_time
 from feedback.widgets.queue_list import QueueItemSelected, QueueList
 
 
@@ -74,6 +80,54 @@ class TestFeedList:
         ):
             assert feed_list.get_selected_feed() == sample_feeds[0]
 
+    def test_feed_list_highlight_selects_after_delay(
+        self, sample_feeds: list[Feed]
+    ) -> None:
+        """Test highlighting restarts the delay and selects only the last feed."""
+        feed_list = FeedList()
+        feed_list._feeds = sample_feeds
+        with (
+            patch.object(feed_list, "set_timer") as set_timer,
+            patch.object(feed_list, "post_message") as post_message,
+            patch.object(
+                type(feed_list), "highlighted", new_callable=PropertyMock
+            ) as highlighted,
+        ):
+            first_timer = set_timer.return_value
+            feed_list.on_option_list_option_highlighted(MagicMock())
+            feed_list.on_option_list_option_highlighted(MagicMock())
+            first_timer.stop.assert_called_once()
+            post_message.assert_not_called()
+
+            highlighted.return_value = 1
+            _delay, callback = set_timer.call_args.args
+            callback()
+
+        post_message.assert_called_once()
+        assert post_message.call_args.args[0].feed is sample_feeds[1]
+
+    def test_feed_list_select_cancels_pending_highlight(
+        self, sample_feeds: list[Feed]
+    ) -> None:
+        """Test that selecting a feed drops the pending highlight selection."""
+        feed_list = FeedList()
+        feed_list._feeds = sample_feeds
+        with (
+            patch.object(feed_list, "set_timer") as set_timer,
+            patch.object(feed_list, "post_message") as post_message,
+            patch.object(
+                type(feed_list),
+                "highlighted",
+                new_callable=PropertyMock,
+                return_value=0,
+            ),
+        ):
+            feed_list.on_option_list_option_highlighted(MagicMock())
+            feed_list.on_option_list_option_selected(MagicMock())
+
+        set_timer.return_value.stop.assert_called_once()
+        post_message.assert_called_once()
+
     def test_feed_selected_message(self, sample_feeds: list[Feed]) -> None:
         """Test FeedSelected message creation."""
         feed = sample_feeds[0]
@@ -115,6 +169,18 @@ class TestEpisodeList:
         episode_list.set_episodes(sample_episodes)
         assert episode_list._all_episodes == sample_episodes
 
+    def test_episode_list_set_same_episodes_is_noop(
+        self, sample_episodes: list[Episode]
+    ) -> None:
+        """Test that setting the displayed list again skips the rebuild."""
+        episode_list = EpisodeList()
+        episode_list.set_episodes(sample_episodes)
+        with patch.object(episode_list, "_apply_filter_and_sort") as rebuild:
+            episode_list.set_episodes(sample_episodes)
+            rebuild.assert_not_called()
+            episode_list.set_episodes(list(sample_episodes))
+            rebuild.assert_called_once()
+
     def test_episode_list_get_selected_empty(self) -> None:
         """Test get_selected_episode returns None when empty."""
         episode_list = EpisodeList()
@@ -145,11 +211,224 @@ class TestEpisodeList:
         ):
             assert episode_list.get_selected_episode() == sample_episodes[0]
 
+    def test_episode_list_refresh_episode_in_place(
+        self, sample_episodes: list[Episode]
+    ) -> None:
+        """Test refresh_episode rewrites only the changed row."""
+        episode_list = EpisodeList()
+        episode_list.set_episodes(sample_episodes)
+        episode = sample_episodes[1]
+
+        episode.played = True
+        with patch.object(episode_list, "_apply_filter_and_sort") as rebuild:
+            episode_list.refresh_episode(episode)
+            rebuild.assert_not_called()
+
+        assert str(episode_list.get_option("2").prompt) == "[played] Episode 2"
+
+    def test_episode_list_refresh_episode_leaving_filter(
+        self, sample_episodes: list[Episode]
+    ) -> None:
+        """Test refresh_episode drops an episode that no longer matches the filter."""
+        episode_list = EpisodeList()
+        episode_list.set_episodes(sample_episodes)
+        episode_list.set_filter(EpisodeFilter.UNPLAYED)
+        episode = sample_episodes[0]
+
+        episode.played = True
+        episode_list.refresh_episode(episode)
+
+        assert episode_list.filtered_count == 1
+        assert episode not in episode_list._filtered_episodes
+
+    def test_episode_list_filters(self) -> None:
+        """Test each filter selects episodes by played, progress and download."""
+        episodes = [
+            Episode(
+                id=episode_id,
+                feed_key="feed1",
+                title=f"Episode {episode_id}",
+                enclosure=f"https://example.com/ep{episode_id}.mp3",
+                played=played,
+                progress_ms=progress_ms,
+                downloaded_path=downloaded_path,
+            )
+            for episode_id, played, progress_ms, downloaded_path in [
+                (1, False, 0, None),
+                (2, True, 0, "/downloads/ep2.mp3"),
+                (3, False, 5000, None),
+                (4, True, 5000, None),
+                (5, False, 0, "/downloads/ep5.mp3"),
+            ]
+        ]
+        episode_list = EpisodeList()
+        episode_list.set_episodes(episodes)
+
+        expected = {
+            EpisodeFilter.ALL: [1, 2, 3, 4, 5],
+            EpisodeFilter.UNPLAYED: [1, 3, 5],
+            EpisodeFilter.DOWNLOADED: [2, 5],
+            EpisodeFilter.IN_PROGRESS: [3],
+        }
+        for filter_type, episode_ids in expected.items():
+            episode_list.set_filter(filter_type)
+            assert [ep.id for ep in episode_list._filtered_episodes] == episode_ids
+            for episode in episode_list._filtered_episodes:
+                assert episode_list._matches_filter(episode)
+
+    def test_episode_list_cycle_filter_and_sort(self) -> None:
+        """Test cycling visits every filter and sort in order, then wraps."""
+        episode_list = EpisodeList()
+
+        assert [episode_list.cycle_filter() for _ in EpisodeFilter] == [
+            *list(EpisodeFilter)[1:],
+            EpisodeFilter.ALL,
+        ]
+        assert [episode_list.cycle_sort() for _ in EpisodeSort] == [
+            *list(EpisodeSort)[1:],
+            EpisodeSort.DATE_NEWEST,
+        ]
+
+    def test_episode_list_reuses_results_for_previous_view(
+        self, sample_episodes: list[Episode]
+    ) -> None:
+        """Test that returning to a filter reuses its filtered list."""
+        episode_list = EpisodeList()
+        episode_list.set_episodes(sample_episodes)
+        all_results = episode_list._filtered_episodes
+
+        episode_list.set_filter(EpisodeFilter.UNPLAYED)
+        with patch.object(episode_list, "_filter_and_sort") as filter_and_sort:
+            episode_list.set_filter(EpisodeFilter.ALL)
+        filter_and_sort.assert_not_called()
+        assert episode_list._filtered_episodes is all_results
+
+        episode_list.set_episodes(list(sample_episodes))
+        assert episode_list._filtered_episodes is not all_results
+
+    def test_episode_list_refresh_episode_invalidates_other_views(
+        self, sample_episodes: list[Episode]
+    ) -> None:
+        """Test that a status change is reflected when switching filters."""
+        episode_list = EpisodeList()
+        episode_list.set_episodes(sample_episodes)
+        episode_list.set_filter(EpisodeFilter.UNPLAYED)
+        episode_list.set_filter(EpisodeFilter.ALL)
+
+        sample_episodes[0].played = True
+        episode_list.refresh_episode(sample_episodes[0])
+        episode_list.set_filter(EpisodeFilter.UNPLAYED)
+
+        assert episode_list._filtered_episodes == [sample_episodes[1]]
+
+    def test_episode_list_updates_rows_incrementally(
+        self, sample_episodes: list[Episode]
+    ) -> None:
+        """Test that filtering removes rows without rebuilding the list."""
+        episode_list = EpisodeList()
+        episode_list.set_episodes(sample_episodes)
+        sample_episodes[0].played = True
+        episode_list.refresh_episode(sample_episodes[0])
+
+        with patch.object(episode_list, "clear_options") as clear_options:
+            episode_list.set_filter(EpisodeFilter.UNPLAYED)
+            clear_options.assert_not_called()
+        assert episode_list.option_count == 1
+        assert episode_list.get_option_at_index(0).id == "2"
+
+        # Bringing the played episode back puts it ahead of episode 2
+        episode_list.set_filter(EpisodeFilter.ALL)
+        assert [episode_list.get_option_at_index(i).id for i in range(2)] == ["1", "2"]
+        assert str(episode_list.get_option("1").prompt) == "[played] Episode 1"
+
+    def test_episode_list_format_title_markers(
+        self, sample_episodes: list[Episode]
+    ) -> None:
+        """Test the status and download markers in front of a title."""
+        episode = sample_episodes[0]
+        assert EpisodeList._format_title(episode) == "Episode 1"
+
+        episode.progress_ms = 1000
+        episode.downloaded_path = "/downloads/ep1.mp3"
+        assert EpisodeList._format_title(episode) == "[▶] [↓] Episode 1"
+
+        episode.played = True
+        assert EpisodeList._format_title(episode) == "[played] [↓] Episode 1"
+
+    def test_episode_list_sort_orders(self) -> None:
+        """Test each sort order, with undated episodes last for date sorts."""
+        episodes = [
+            Episode(
+                id=episode_id,
+                feed_key="feed1",
+                title=title,
+                enclosure=f"https://example.com/ep{episode_id}.mp3",
+                pubdate=pubdate,
+            )
+            for episode_id, title, pubdate in [
+                (1, "beta", datetime(2024, 1, 2, tzinfo=UTC)),
+                (2, "Alpha", None),
+                (3, "gamma", datetime(2024, 1, 3, tzinfo=UTC)),
+                (4, "Delta", datetime(2024, 1, 1, tzinfo=UTC)),
+            ]
+        ]
+        episode_list = EpisodeList()
+        episode_list.set_episodes(episodes)
+
+        def order() -> list[int | None]:
+            return [ep.id for ep in episode_list._filtered_episodes]
+
+        assert order() == [3, 1, 4, 2]
+        episode_list.set_sort(EpisodeSort.DATE_OLDEST)
+        assert order() == [4, 1, 3, 2]
+        episode_list.set_sort(EpisodeSort.TITLE)
+        assert order() == [2, 1, 4, 3]
+
+    def test_episode_list_add_episodes_keeps_order(self) -> None:
+        """Test added episodes land where a full filter and sort puts them."""
+        episodes = [
+            Episode(
+                id=episode_id,
+                feed_key="feed1",
+                title=title,
+                enclosure=f"https://example.com/ep{episode_id}.mp3",
+                pubdate=None if day is None else datetime(2024, 1, day, tzinfo=UTC),
+                played=played,
+            )
+            for episode_id, title, day, played in [
+                (1, "beta", 2, False),
+                (2, "Alpha", None, True),
+                (3, "gamma", 3, False),
+                (4, "Delta", 1, True),
+                (5, "alpha", 2, False),
+                (6, "Epsilon", None, False),
+                (7, "zeta", 4, True),
+            ]
+        ]
+        episode_list = EpisodeList()
+        initial = episodes[:4]
+        episode_list.set_episodes(initial)
+        for filter_type in (EpisodeFilter.ALL, EpisodeFilter.UNPLAYED):
+            episode_list.set_filter(filter_type)
+            for sort_type in EpisodeSort:
+                episode_list.set_sort(sort_type)
+
+        episode_list.add_episodes(episodes[4:])
+
+        assert initial == episodes[:4]
+        assert episode_list._all_episodes == episodes
+        assert len(episode_list._results) == 6
+        for (filter_type, sort_type), results in episode_list._results.items():
+            episode_list._filter = filter_type
+            episode_list._sort = sort_type
+            assert results == episode_list._filter_and_sort()
+
     def test_episode_selected_message(self, sample_episodes: list[Episode]) -> None:
         """Test EpisodeSelected message creation."""
         episode = sample_episodes[0]
         message = EpisodeSelected(episode)
         assert message.episode == episode
+        assert not hasattr(message, "__dict__")
 
 
 class TestQueueList:
@@ -207,6 +486,43 @@ class TestQueueList:
         ):
             assert queue_list.get_selected_item() == sample_queue_items[0]
 
+    def test_queue_list_swap(self) -> None:
+        """Test swapping two entries updates only the items and their rows."""
+        items = [
+            (
+                QueueItem(episode_id=i, position=i),
+                Episode(id=i, feed_key="feed1", title=f"Episode {i}", enclosure="url"),
+            )
+            for i in range(3)
+        ]
+        queue_list = QueueList()
+        queue_list.set_queue(items)
+
+        queue_list.swap(0, 1)
+
+        assert [episode.id for _, episode in queue_list._items] == [1, 0, 2]
+        assert [episode.id for _, episode in items] == [0, 1, 2]
+        prompts = [str(option.prompt) for option in queue_list.options]
+        assert prompts == ["1. Episode 1", "2. Episode 0", "3. Episode 2"]
+
+    def test_queue_list_remove_at(self) -> None:
+        """Test removing an entry renumbers the rows after it."""
+        items = [
+            (
+                QueueItem(episode_id=i, position=i),
+                Episode(id=i, feed_key="feed1", title=f"Episode {i}", enclosure="url"),
+            )
+            for i in range(3)
+        ]
+        queue_list = QueueList()
+        queue_list.set_queue(items)
+
+        queue_list.remove_at(0)
+
+        assert [episode.id for _, episode in queue_list._items] == [1, 2]
+        prompts = [str(option.prompt) for option in queue_list.options]
+        assert prompts == ["1. Episode 1", "2. Episode 2"]
+
     def test_queue_item_selected_message(
         self, sample_queue_items: list[tuple[QueueItem, Episode]]
     ) -> None:
@@ -252,6 +568,108 @@ class TestDownloadList:
         download_list.set_downloads(sample_downloads)
         assert download_list._downloads == sample_downloads
 
+    def test_download_list_set_downloads_updates_changed_rows(
+        self, sample_downloads: list[DownloadItem]
+    ) -> None:
+        """Test that set_downloads only touches rows that changed."""
+        download_list = DownloadList()
+        download_list.set_downloads(sample_downloads)
+
+        sample_downloads[1].progress = 0.75
+        added = DownloadItem(
+            episode_id=3,
+            url="https://example.com/ep3.mp3",
+            destination=Path("/downloads/ep3.mp3"),
+        )
+        with patch.object(download_list, "clear_options") as clear_options:
+            download_list.set_downloads([sample_downloads[1], added])
+        clear_options.assert_not_called()
+
+        assert download_list.option_count == 2
+        assert download_list.get_option_at_index(0).id == sample_downloads[1].url
+        assert "[75%]" in str(download_list.get_option_at_index(0).prompt)
+        assert download_list.get_option_at_index(1).id == added.url
+
+    def test_download_list_skips_formatting_unchanged_downloads(
+        self, sample_downloads: list[DownloadItem]
+    ) -> None:
+        """Test that only downloads whose state changed are reformatted."""
+        download_list = DownloadList()
+        download_list.set_downloads(sample_downloads)
+
+        sample_downloads[1].progress = 0.6
+        with patch.object(
+            download_list,
+            "_format_download",
+            wraps=download_list._format_download,
+        ) as format_download:
+            download_list.set_downloads(sample_downloads)
+        format_download.assert_called_once_with(sample_downloads[1])
+        assert "[60%]" in str(download_list.get_option_at_index(1).prompt)
+
+    def test_download_list_format_download_status(self) -> None:
+        """Test the status marker shown for each download state."""
+        download_list = DownloadList()
+        download = DownloadItem(
+            url="https://example.com/ep1.mp3",
+            destination=Path("/downloads/ep1.mp3"),
+            status=DownloadStatus.DOWNLOADING,
+            progress=0.25,
+        )
+        assert download_list._format_download(download) == "[25%] ep1.mp3"
+
+        download.status = DownloadStatus.COMPLETED
+        assert download_list._format_download(download) == "[done] ep1.mp3"
+        download.status = DownloadStatus.CANCELLED
+        assert download_list._format_download(download) == "[cancelled] ep1.mp3"
+
+    def test_download_list_set_downloads_rebuilds_on_reorder(
+        self, sample_downloads: list[DownloadItem]
+    ) -> None:
+        """Test that set_downloads rebuilds when rows are reordered."""
+        download_list = DownloadList()
+        download_list.set_downloads(sample_downloads)
+        download_list.set_downloads(sample_downloads[::-1])
+
+        assert [download_list.get_option_at_index(i).id for i in range(2)] == [
+            sample_downloads[1].url,
+            sample_downloads[0].url,
+        ]
+
+    def test_download_list_set_downloads_rebuilds_on_prepend(
+        self, sample_downloads: list[DownloadItem]
+    ) -> None:
+        """Test that a download added ahead of existing rows is shown first."""
+        download_list = DownloadList()
+        download_list.set_downloads(sample_downloads)
+
+        added = DownloadItem(
+            episode_id=3,
+            url="https://example.com/ep3.mp3",
+            destination=Path("/downloads/ep3.mp3"),
+        )
+        downloads = [added, *sample_downloads]
+        download_list.set_downloads(downloads)
+
+        assert [download_list.get_option_at_index(i).id for i in range(3)] == [
+            download.url for download in downloads
+        ]
+        download_list.highlighted = 0
+        assert download_list.get_selected_download() == added
+
+    def test_download_list_set_downloads_keeps_highlight(
+        self, sample_downloads: list[DownloadItem]
+    ) -> None:
+        """Test that the highlighted download survives a rebuild."""
+        download_list = DownloadList()
+        download_list.set_downloads(sample_downloads)
+        download_list.highlighted = 1
+
+        download_list.set_downloads(sample_downloads[::-1])
+
+        assert download_list.highlighted == 0
+        assert download_list.get_selected_download() == sample_downloads[1]
+
     def test_download_list_get_selected_empty(self) -> None:
         """Test get_selected_download returns None when empty."""
         download_list = DownloadList()
@@ -324,6 +742,56 @@ class TestPlayerBar:
         player_bar.set_paused()
         assert player_bar.status == "Paused"
 
+    def test_player_bar_skips_unchanged_time(self) -> None:
+        """Test the time label is only updated when its text changes."""
+        player_bar = PlayerBar()
+        player_bar.position_ms = 0
+        player_bar.duration_ms = 0
+        with patch.object(player_bar, "_time_label") as time_label:
+            update = time_label.update
+            player_bar._update_time()
+            update.assert_called_once_with("00:00 / 00:00")
+
+            player_bar.set_reactive(PlayerBar.position_ms, 400)
+            player_bar._update_time()
+            update.assert_called_once()
+
+            player_bar.set_reactive(PlayerBar.position_ms, 1200)
+            player_bar._update_time()
+            update.assert_called_with("00:01 / 00:00")
+            assert update.call_count == 2
+
+    def test_player_bar_updates_composed_widgets(self) -> None:
+        """Test watchers update the child widgets kept from compose."""
+        player_bar = PlayerBar()
+        # Before compose there are no widgets to update
+        player_bar.set_playing(title="Before compose", duration_ms=1000)
+
+        with (
+            patch.object(player_bar, "_title_label") as title_label,
+            patch.object(player_bar, "_progress_bar") as progress_bar,
+        ):
+            player_bar.title = "Episode"
+            player_bar.set_reactive(PlayerBar.position_ms, 15000)
+            player_bar.duration_ms = 60000
+        title_label.update.assert_called_once_with("Episode")
+        progress_bar.update.assert_called_with(progress=25.0)
+
+    def test_player_bar_skips_unchanged_progress(self) -> None:
+        """Test the progress bar is only updated when its value changes."""
+        player_bar = PlayerBar()
+        with patch.object(player_bar, "_progress_bar") as progress_bar:
+            player_bar.duration_ms = 3_600_000
+            player_bar.position_ms = 1_800_000
+            progress_bar.update.assert_called_with(progress=50.0)
+            calls = progress_bar.update.call_count
+
+            player_bar.position_ms = 1_801_000
+            assert progress_bar.update.call_count == calls
+
+            player_bar.position_ms = 1_804_000
+            progress_bar.update.assert_called_with(progress=50.1)
+
     def test_player_bar_set_stopped(self) -> None:
         """Test set_stopped method."""
         player_bar = PlayerBar()
@@ -351,6 +819,18 @@ class TestPlayerBar:
         result = PlayerBar._ms_to_time(3725000)
         assert result == "01:02:05"
 
+    def test_player_bar_format_time_reuses_duration(self) -> None:
+        """Test the duration text is reused while only the position moves."""
+        player_bar = PlayerBar()
+        player_bar.duration_ms = 3_725_000
+        player_bar.position_ms = 1000
+        _seconds_to_time.cache_clear()
+        assert player_bar._format_time() == "00:01 / 01:02:05"
+
+        player_bar.position_ms = 2000
+        assert player_bar._format_time() == "00:02 / 01:02:05"
+        assert _seconds_to_time.cache_info().hits == 1
+
     def test_player_bar_ms_to_time_negative(self) -> None:
         """Test _ms_to_time with negative value."""
         result = PlayerBar._ms_to_time(-1000)
@@ -363,3 +843,25 @@ class TestPlayerBar:
         player_bar.duration_ms = 300000
         result = player_bar._format_time()
         assert result == "01:05 / 05:00"
+
+
+class TestLoadingOverlay:
+    """Tests for LoadingOverlay widget."""
+
+    def test_loading_overlay_update_progress_text(self) -> None:
+        """Test progress text with and without a label."""
+        overlay = LoadingOverlay()
+        overlay.update_progress(1, 3, "Feed One")
+        assert overlay._progress_text == "1/3: Feed One"
+        overlay.update_progress(2, 3)
+        assert overlay._progress_text == "2/3"
+
+    def test_loading_overlay_throttles_progress_redraws(self) -> None:
+        """Test progress is redrawn once per hundredth of the total and at the end."""
+        overlay = LoadingOverlay()
+        with patch.object(overlay, "_progress_static") as progress_static:
+            for current in range(1, 1001):
+                overlay.update_progress(current, 1000, f"Feed {current}")
+
+        assert progress_static.update.call_count == 101
+        progress_static.update.assert_called_with("1000/1000: Feed 1000")
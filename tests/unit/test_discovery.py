@@ -313,6 +313,26 @@ class TestPodcastIndexClientSearch:
         with pytest.raises(DiscoverySearchError, match="Request failed"):
             await client.search("test")
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_search_reuses_http_client(self) -> None:
+        """Test consecutive searches share one HTTP client until closed."""
+        respx.get("https://api.podcastindex.org/api/1.0/search/byterm").respond(
+            json={"status": "true", "feeds": []}
+        )
+
+        client = PodcastIndexClient(api_key="key", api_secret="secret")
+        await client.search("first")
+        http_client = client._client
+        await client.search("second")
+
+        assert http_client is not None
+        assert client._client is http_client
+
+        await client.close()
+        assert client._client is None
+        assert http_client.is_closed
+
 
 class TestPodcastIndexClientSearchByTitle:
     """Tests for search by title functionality."""
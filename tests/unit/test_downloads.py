@@ -558,6 +558,28 @@ class TestDownloadQueueGetItems:
         items.append(DownloadItem(url="u3", destination=tmp_path / "f3"))
         assert len(queue._queue) == 2
 
+    @pytest.mark.asyncio
+    async def test_get_snapshot_version(self, tmp_path: Path) -> None:
+        """Test that the snapshot version moves only when the queue changes."""
+        queue = DownloadQueue(download_dir=tmp_path)
+        queue._queue = [
+            DownloadItem(
+                url="u1", destination=tmp_path / "f1", status=DownloadStatus.COMPLETED
+            )
+        ]
+
+        version, items = queue.get_snapshot()
+        assert items == tuple(queue._queue)
+        assert queue.get_snapshot()[0] == version
+
+        assert await queue.clear_completed() == 1
+        new_version, items = queue.get_snapshot()
+        assert new_version > version
+        assert items == ()
+
+        assert await queue.clear_completed() == 0
+        assert queue.version == new_version
+
     @pytest.mark.asyncio
     async def test_get_item(self, tmp_path: Path) -> None:
         """Test getting single item by URL."""
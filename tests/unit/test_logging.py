@@ -60,7 +60,7 @@ class TestSetupLogging:
 
     def test_setup_logging_rotates_large_file(self, tmp_path: Path) -> None:
         """Test log rotation when file is too large."""
-        from feedback.logging import setup_logging
+        from feedback.logging import logger, setup_logging
 
         # Create a large log file (>5MB)
         log_path = tmp_path / "feedback.log"
@@ -69,9 +69,31 @@ class TestSetupLogging:
         with patch("feedback.logging.get_data_path", return_value=tmp_path):
             setup_logging(log_to_file=True, log_to_console=False)
 
-        # Old log should exist
-        old_log = tmp_path / "feedback.log.old"
+        # Rotation happens when the next record is written
+        logger.info("rotate")
+        for handler in logger.handlers:
+            handler.close()
+
+        # Old log should exist and the new log should be small
+        old_log = tmp_path / "feedback.log.1"
         assert old_log.exists()
+        assert log_path.stat().st_size < 1024
+
+    def test_setup_logging_file_is_opened_lazily(self, tmp_path: Path) -> None:
+        """Test that the log file is not created until something is logged."""
+        from feedback.logging import logger, setup_logging
+
+        with patch("feedback.logging.get_data_path", return_value=tmp_path):
+            setup_logging(log_to_file=True, log_to_console=False)
+
+        log_path = tmp_path / "feedback.log"
+        assert not log_path.exists()
+
+        logger.info("hello")
+        for handler in logger.handlers:
+            handler.close()
+
+        assert log_path.exists()
 
 
 class TestGetLogger:
@@ -94,3 +116,9 @@ class TestGetLogger:
         assert log1.name != log2.name
         assert log1.name == "feedback.module1"
         assert log2.name == "feedback.module2"
+
+    def test_get_logger_is_cached(self) -> None:
+        """Test that repeated calls return the same logger."""
+        from feedback.logging import get_logger
+
+        assert get_logger("cached") is get_logger("cached")
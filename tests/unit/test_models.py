@@ -161,6 +161,35 @@ class TestEpisode:
         )
         assert episode.progress_seconds == 90.0
 
+    def test_episode_title_sortkey(self):
+        """Test title_sortkey is cached and ignored by equality and dumps."""
+        episode = Episode(
+            feed_key="feed1",
+            title="The Episode",
+            enclosure="https://example.com/ep.mp3",
+        )
+        other = episode.model_copy()
+        assert episode.title_sortkey == "the episode"
+        assert episode.title_sortkey is episode.title_sortkey
+        assert episode == other
+        assert "title_sortkey" not in episode.model_dump()
+
+    def test_episode_title_sortkey_follows_title(self):
+        """Test title_sortkey is recomputed after the title changes."""
+        episode = Episode(
+            feed_key="feed1",
+            title="The Episode",
+            enclosure="https://example.com/ep.mp3",
+        )
+        assert episode.title_sortkey == "the episode"
+
+        renamed = episode.model_copy(update={"title": "Renamed"})
+        assert renamed.title_sortkey == "renamed"
+        assert episode.mark_played().title_sortkey == "the episode"
+
+        episode.title = "Another"
+        assert episode.title_sortkey == "another"
+
     def test_episode_with_progress(self):
         """Test with_progress method."""
         episode = Episode(
@@ -172,6 +201,15 @@ class TestEpisode:
         assert updated.progress_ms == 30000
         assert episode.progress_ms == 0  # Original unchanged
 
+    def test_episode_with_progress_clamps_negative(self):
+        """Test with_progress clamps negative progress to zero."""
+        episode = Episode(
+            feed_key="feed1",
+            title="Episode",
+            enclosure="https://example.com/ep.mp3",
+        )
+        assert episode.with_progress(-500).progress_ms == 0
+
     def test_episode_mark_played(self):
         """Test mark_played method."""
         episode = Episode(
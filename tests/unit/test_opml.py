@@ -1,13 +1,17 @@
 """Tests for OPML import/export functionality."""
 
 from pathlib import Path
+from unittest.mock import AsyncMock
 
 import pytest
 
+from feedback.database import Database
+from feedback.feeds import FeedFetchError
 from feedback.feeds.opml import (
     OPMLOutline,
     OPMLParseError,
     export_opml,
+    import_opml_feeds,
     parse_opml,
     parse_opml_file,
 )
@@ -292,6 +296,23 @@ class TestExportOPML:
         assert outlines[1].xml_url == "https://example.com/feed2.xml"
         assert outlines[1].title == "Podcast Two"
 
+    def test_export_compact(self) -> None:
+        """Test exporting without pretty-printing."""
+        feeds = [
+            Feed(key="https://example.com/feed1.xml", title="Podcast 1"),
+            Feed(key="https://example.com/feed2.xml", title="Podcast 2"),
+        ]
+
+        opml = export_opml(feeds, pretty=False)
+
+        assert opml.startswith('<?xml version="1.0" encoding="UTF-8"?>\n<opml')
+        assert opml.count("\n") == 1
+        assert "  <" not in opml
+        assert [o.xml_url for o in parse_opml(opml)] == [
+            "https://example.com/feed1.xml",
+            "https://example.com/feed2.xml",
+        ]
+
 
 class TestExportOPMLFile:
     """Tests for exporting OPML to files."""
@@ -336,6 +357,54 @@ class TestExportOPMLFile:
             export_opml_file(feeds, invalid_path)
 
 
+class TestImportOPMLFeeds:
+    """Tests for importing OPML feeds into the database."""
+
+    async def test_import_feeds(self, tmp_path: Path, database: Database) -> None:
+        """Test importing new feeds, skipping duplicates and collecting errors."""
+        await database.upsert_feed(Feed(key="https://example.com/old.xml", title="Old"))
+        opml_file = tmp_path / "podcasts.opml"
+        opml_file.write_text("""<?xml version="1.0" encoding="UTF-8"?>
+        <opml version="2.0">
+            <head><title>Podcasts</title></head>
+            <body>
+                <outline type="rss" text="Old" xmlUrl="https://example.com/old.xml"/>
+                <outline type="rss" text="New" xmlUrl="https://example.com/new.xml"/>
+                <outline type="rss" text="Bad" xmlUrl="https://example.com/bad.xml"/>
+            </body>
+        </opml>
+        """)
+        events: list[str] = []
+
+        async def fetch(url: str) -> tuple[Feed, list]:
+            events.append(f"fetch {url}")
+            if url.endswith("bad.xml"):
+                raise FeedFetchError(url, "boom")
+            return Feed(key=url, title="New"), []
+
+        fetcher = AsyncMock()
+        fetcher.fetch.side_effect = fetch
+
+        imported, skipped, errors = await import_opml_feeds(
+            opml_file,
+            database,
+            fetcher,
+            on_progress=lambda title, _current, _total: events.append(title),
+        )
+
+        assert (imported, skipped) == (1, 1)
+        assert errors == ["Bad: Failed to fetch https://example.com/bad.xml: boom"]
+        # New feeds are fetched before the known duplicate is skipped
+        assert events == [
+            "New",
+            "fetch https://example.com/new.xml",
+            "Bad",
+            "fetch https://example.com/bad.xml",
+            "Old",
+        ]
+        assert await database.get_feed("https://example.com/new.xml") is not None
+
+
 class TestOPMLOutline:
     """Tests for OPMLOutline dataclass."""
 
@@ -96,6 +96,17 @@ class TestBasePlayer:
         assert player._clamp_rate(1.0) == 1.0
         assert player._clamp_rate(3.0) == 2.0
 
+    def test_set_stopped(self):
+        """Test _set_stopped resets playback state."""
+        player = NullPlayer()
+        player._state = PlayerState.PLAYING
+        player._position_ms = 30000
+        player._duration_ms = 120000
+        player._set_stopped()
+        assert player.state == PlayerState.STOPPED
+        assert player.position_ms == 0
+        assert player.duration_ms == 0
+
 
 class TestNullPlayer:
     """Tests for NullPlayer implementation."""
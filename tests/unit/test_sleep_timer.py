@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+import time
+from unittest.mock import patch
 
 import pytest
 
@@ -44,8 +45,8 @@ class TestSleepTimerState:
 
     def test_active_timed_state(self) -> None:
         """Test state with active timer."""
-        end_time = datetime.now() + timedelta(minutes=15)
-        state = SleepTimerState(mode=SleepTimerMode.MINUTES_15, end_time=end_time)
+        deadline = time.monotonic() + 15 * 60
+        state = SleepTimerState(mode=SleepTimerMode.MINUTES_15, deadline=deadline)
         assert state.is_active
         # Should be close to 15 minutes
         remaining = state.remaining_seconds
@@ -63,15 +64,15 @@ class TestSleepTimerState:
         """Test state when timer is paused."""
         state = SleepTimerState(
             mode=SleepTimerMode.MINUTES_15,
-            paused_remaining=timedelta(minutes=10),
+            paused_remaining=600.0,
         )
         assert state.remaining_seconds == 600  # 10 minutes in seconds
 
     def test_remaining_formatted(self) -> None:
         """Test formatted remaining time string."""
         # 5:30 remaining
-        end_time = datetime.now() + timedelta(minutes=5, seconds=30)
-        state = SleepTimerState(mode=SleepTimerMode.MINUTES_15, end_time=end_time)
+        deadline = time.monotonic() + 5 * 60 + 30
+        state = SleepTimerState(mode=SleepTimerMode.MINUTES_15, deadline=deadline)
         formatted = state.remaining_formatted
         # Should be in M:SS format
         assert ":" in formatted
@@ -100,7 +101,18 @@ class TestSleepTimer:
         timer.set_mode(SleepTimerMode.MINUTES_30)
         assert timer.mode == SleepTimerMode.MINUTES_30
         assert timer.is_active
-        assert timer.state.end_time is not None
+        assert timer.state.deadline is not None
+
+    def test_set_mode_same_untimed_mode_is_noop(self) -> None:
+        """Test that re-applying OFF or end-of-episode leaves the state alone."""
+        timer = SleepTimer()
+        for mode in (SleepTimerMode.OFF, SleepTimerMode.END_OF_EPISODE):
+            timer.set_mode(mode)
+            state = timer.state
+            with patch.object(timer, "_cancel_timer") as cancel_timer:
+                timer.set_mode(mode)
+            cancel_timer.assert_not_called()
+            assert timer.state is state
 
     def test_set_mode_end_of_episode(self) -> None:
         """Test setting end-of-episode mode."""
@@ -108,7 +120,7 @@ class TestSleepTimer:
         timer.set_mode(SleepTimerMode.END_OF_EPISODE)
         assert timer.mode == SleepTimerMode.END_OF_EPISODE
         assert timer.is_active
-        assert timer.state.end_time is None
+        assert timer.state.deadline is None
 
     def test_cycle_mode(self) -> None:
         """Test cycling through modes."""
@@ -136,6 +148,21 @@ class TestSleepTimer:
         assert not timer.is_active
         assert timer.mode == SleepTimerMode.OFF
 
+    def test_state_is_updated_in_place(self) -> None:
+        """Test that transitions reuse the same state object."""
+        timer = SleepTimer()
+        state = timer.state
+        timer.set_mode(SleepTimerMode.MINUTES_15)
+        timer.pause()
+        timer.set_mode(SleepTimerMode.END_OF_EPISODE)
+        assert timer.state is state
+        assert state.deadline is None
+        assert state.paused_remaining is None
+
+        timer.cancel()
+        assert timer.state is state
+        assert state.mode == SleepTimerMode.OFF
+
     def test_pause_and_resume(self) -> None:
         """Test pausing and resuming the timer."""
         timer = SleepTimer()
@@ -144,13 +171,13 @@ class TestSleepTimer:
         # Pause
         timer.pause()
         assert timer.state.paused_remaining is not None
-        paused_seconds = timer.state.paused_remaining.total_seconds()
+        paused_seconds = timer.state.paused_remaining
         assert paused_seconds > 0
 
         # Resume
         timer.resume()
         assert timer.state.paused_remaining is None
-        assert timer.state.end_time is not None
+        assert timer.state.deadline is not None
 
     def test_pause_end_of_episode_no_effect(self) -> None:
         """Test that pause has no effect on end-of-episode mode."""
@@ -204,7 +231,7 @@ class TestSleepTimer:
         # Set a very short timer for testing
         timer._state = SleepTimerState(
             mode=SleepTimerMode.MINUTES_15,
-            end_time=datetime.now() + timedelta(milliseconds=100),
+            deadline=time.monotonic() + 0.1,
         )
         timer._start_timer(0)  # Start with 0 seconds for quick test
 
@@ -216,9 +243,9 @@ class TestSleepTimer:
 
     def test_remaining_seconds_expired(self) -> None:
         """Test remaining_seconds returns 0 when timer has expired."""
-        # Create a state where end_time is in the past
-        past_time = datetime.now() - timedelta(minutes=5)
-        state = SleepTimerState(mode=SleepTimerMode.MINUTES_15, end_time=past_time)
+        # Create a state where the deadline is in the past
+        past_deadline = time.monotonic() - 5 * 60
+        state = SleepTimerState(mode=SleepTimerMode.MINUTES_15, deadline=past_deadline)
         assert state.remaining_seconds == 0
 
     def test_cancel_timer_when_no_task(self) -> None:
@@ -234,8 +261,8 @@ class TestSleepTimer:
         mode = SleepTimerMode.OFF
         assert mode.label == "Off"
 
-    def test_state_remaining_formatted_empty_end_time(self) -> None:
-        """Test remaining_formatted when end_time is None for timed mode."""
-        # Edge case: timed mode but no end_time set
-        state = SleepTimerState(mode=SleepTimerMode.MINUTES_15, end_time=None)
+    def test_state_remaining_formatted_empty_deadline(self) -> None:
+        """Test remaining_formatted when deadline is None for timed mode."""
+        # Edge case: timed mode but no deadline set
+        state = SleepTimerState(mode=SleepTimerMode.MINUTES_15, deadline=None)
         assert state.remaining_formatted == ""